@@ -6,7 +6,6 @@
 compression method, reproducing the original text or binary
 data.
 """
-import copy
 import zlib
 from typing import List
 
@@ -34,6 +33,29 @@ class FlateDecode:
         if len(bytes_in) == 0:
             return bytes_in
 
+        # initial transform
+        bytes_after_zlib = zlib.decompress(bytes_in, bufsize=4092)
+
+        # predictor
+        return FlateDecode.apply_predictor(
+            bytes_after_zlib,
+            predictor=predictor,
+            bits_per_component=bits_per_component,
+            columns=columns,
+        )
+
+    @staticmethod
+    def apply_predictor(
+        bytes_in: bytes,
+        predictor: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+    ) -> bytes:
+        """
+        Reverses the (TIFF or PNG) predictor function that was applied to the data
+        before it was encoded (using the Flate or LZW filter)
+        """
+
         # check /Predictor
         # fmt: off
         assert predictor in [1, 2, 10, 11, 12, 13, 14, 15,], "Illegal argument exception. predictor must be in [1, 2, 10, 11, 12, 13, 14, 15]."
@@ -44,9 +66,6 @@ class FlateDecode:
         assert bits_per_component in [1, 2, 4, 8], "Illegal argument exception. bits_per_component must be in [1, 2, 4, 8]."
         # fmt: on
 
-        # initial transform
-        bytes_after_zlib = zlib.decompress(bytes_in, bufsize=4092)
-
         # LZW and Flate encoding compress more compactly if their input data is highly predictable. One way of
         # increasing the predictability of many continuous-tone sampled images is to replace each sample with the
         # difference between that sample and a predictor function applied to earlier neighboring samples. If the predictor
@@ -56,7 +75,7 @@ class FlateDecode:
 
         # check predictor
         if predictor == 1:
-            return bytes_after_zlib
+            return bytes_in
 
         # set up everything to do PNG prediction
         bytes_per_row: int = int((columns * bits_per_component + 7) / 8)
@@ -64,10 +83,10 @@ class FlateDecode:
 
         current_row: List[int] = [0 for _ in range(0, bytes_per_row)]
         prior_row: List[int] = [0 for _ in range(0, bytes_per_row)]
-        number_of_rows = int(len(bytes_after_zlib) / bytes_per_row)
+        number_of_rows = int(len(bytes_in) / bytes_per_row)
 
         # easy case
-        bytes_after_predictor = [int(x) for x in bytes_after_zlib]
+        bytes_after_predictor = [int(x) for x in bytes_in]
         if predictor == 2:
             if bits_per_component == 8:
                 for row in range(0, number_of_rows):
@@ -82,13 +101,13 @@ class FlateDecode:
         # harder cases
         bytes_after_predictor = []
         pos = 0
-        while pos + bytes_per_row <= len(bytes_after_zlib):
+        while pos + bytes_per_row <= len(bytes_in):
 
             # Read the filter type byte and a row of data
-            filter_type = bytes_after_zlib[pos]
+            filter_type = bytes_in[pos]
             pos += 1
 
-            current_row = [x for x in bytes_after_zlib[pos : pos + bytes_per_row]]
+            current_row = [x for x in bytes_in[pos : pos + bytes_per_row]]
             pos += bytes_per_row
 
             # PNG_FILTER_NONE
@@ -153,7 +172,7 @@ class FlateDecode:
                 bytes_after_predictor.append(current_row[i])
 
             # Swap curr and prior
-            prior_row = copy.deepcopy(current_row)
+            prior_row = current_row
 
         # return
         return bytes([(int(x) % 256) for x in bytes_after_predictor])
@@ -8,37 +8,7 @@ text or binary data.
 """
 import typing
 
-
-class bitarray:
-    """
-    This class works allows you to work with a bytes input
-    and retrieve individual bits (as integers)
-    """
-
-    def __init__(self, input: bytes):
-        self._src: bytes = input
-        self._pos: int = -1
-        self._buffer: typing.List[int] = []
-        self._default_to_return: int = 256
-
-    def _read_next_byte(self):
-        self._pos += 1
-        self._buffer += [int(x) for x in "{0:08b}".format(self._src[self._pos])]
-
-    def next(self, n) -> int:
-        """
-        This function reads the next n bits from the input
-        :param n:   the number of bits to retrieve
-        :return:    the next n bits from the input as an integer
-        """
-        try:
-            while n > len(self._buffer):
-                self._read_next_byte()
-            x: typing.List[int] = self._buffer[:n]
-            self._buffer = self._buffer[n:]
-            return int("".join([str(y) for y in x]), 2)
-        except:
-            return self._default_to_return
+from borb.io.filter.flate_decode import FlateDecode
 
 
 class LZWDecode:
@@ -48,68 +18,92 @@ class LZWDecode:
     text or binary data.
     """
 
-    def __init__(self):
-        self._lookup_table: typing.Dict[int, bytearray] = {}
-        self._table_index: int = 0
-        self._bits_to_read: int = 9
-
-    def _init_lookup_table(self):
-        self._lookup_table = {i: i.to_bytes(1, "big") for i in range(0, 256)}
-        self._table_index = 258
-        self._bits_to_read = 9
-
-    def _add_to_lookup_table(self, prev_bytes: bytearray, new_bytes: bytes):
-        self._lookup_table[self._table_index] = prev_bytes + new_bytes
-        self._table_index += 1
-        if self._table_index == 511:
-            self._bits_to_read = 10
-        elif self._table_index == 1023:
-            self._bits_to_read = 11
-        elif self._table_index == 2047:
-            self._bits_to_read = 12
-
-    def decode(self, input: bytes):
+    CLEAR_TABLE: int = 256
+    END_OF_DATA: int = 257
+    MAX_TABLE_SIZE: int = 4096
+
+    @staticmethod
+    def decode(
+        bytes_in: bytes,
+        predictor: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+        early_change: int = 1,
+    ) -> bytes:
         """
         Decompresses data encoded using the LZW (Lempel-Ziv-Welch)
         adaptive compression method
         """
 
-        # output
+        # trivial case
+        if len(bytes_in) == 0:
+            return bytes_in
+
+        # An indication of when to increase the code length. If the value of this entry is 0, code length increases shall
+        # be postponed as long as possible. If the value is 1, code length increases shall occur one code early.
+        # fmt: off
+        assert early_change in [0, 1], "Illegal argument exception. early_change must be in [0, 1]."
+        # fmt: on
+
+        # LZW and Flate encoding compress more compactly if their input data is highly predictable.
+        # The predictor functions (and their parameters) are the same for both filters.
+        return FlateDecode.apply_predictor(
+            LZWDecode._decode(bytes_in, early_change),
+            predictor=predictor,
+            bits_per_component=bits_per_component,
+            columns=columns,
+        )
+
+    @staticmethod
+    def _decode(bytes_in: bytes, early_change: int) -> bytes:
+        # The codes are read (most significant bit first) from an integer bit buffer,
+        # the code table is allocated (at its maximum size) once
+        table: typing.List[bytes] = [bytes([i]) for i in range(0, 256)] + [b""] * (
+            LZWDecode.MAX_TABLE_SIZE - 256
+        )
+        table_size: int = 258
+        code_length: int = 9
         bytes_out: bytearray = bytearray()
-
-        # read
-        bit_input: bitarray = bitarray(input)
-        prev_code: int = 0
-        code: int = 0
-
-        while code != 257:
-            code = bit_input.next(self._bits_to_read)
-            if code == 257:
-                break
-
-            # init
-            if code == 256:
-                self._init_lookup_table()
-                code = bit_input.next(self._bits_to_read)
-                if code == 257:
-                    break
-                bytes_out += self._lookup_table[code]
-                prev_code = code
-                continue
-
-            # normal behaviour
-            x: bytearray = bytearray()
-            if code < self._table_index:
-                x = self._lookup_table[code]
-                bytes_out += x
-                self._add_to_lookup_table(self._lookup_table[prev_code], x[0:1])
-                prev_code = code
-            else:
-                x = self._lookup_table[prev_code]
-                x = x + x[0:1]
-                bytes_out += x
-                self._add_to_lookup_table(x, bytearray())
-                prev_code = code
-
-        # return bytes
-        return bytes_out
+        prev_entry: typing.Optional[bytes] = None
+        bit_buffer: int = 0
+        bits_in_buffer: int = 0
+        for b in bytes_in:
+            bit_buffer = (bit_buffer << 8) | b
+            bits_in_buffer += 8
+            while bits_in_buffer >= code_length:
+                bits_in_buffer -= code_length
+                code: int = bit_buffer >> bits_in_buffer
+                bit_buffer &= (1 << bits_in_buffer) - 1
+
+                # clear-table marker
+                if code == LZWDecode.CLEAR_TABLE:
+                    table_size = 258
+                    code_length = 9
+                    prev_entry = None
+                    continue
+
+                # EOD marker
+                if code == LZWDecode.END_OF_DATA:
+                    return bytes(bytes_out)
+
+                # look up (or build) the entry for this code
+                entry: bytes = b""
+                if code < table_size:
+                    entry = table[code]
+                elif code == table_size and prev_entry is not None:
+                    entry = prev_entry + prev_entry[0:1]
+                else:
+                    # an illegal code ends the data
+                    return bytes(bytes_out)
+                bytes_out += entry
+
+                # add a new entry to the table
+                if prev_entry is not None and table_size < LZWDecode.MAX_TABLE_SIZE:
+                    table[table_size] = prev_entry + entry[0:1]
+                    table_size += 1
+                    if table_size + early_change >= (1 << code_length):
+                        code_length = min(code_length + 1, 12)
+                prev_entry = entry
+
+        # return
+        return bytes(bytes_out)
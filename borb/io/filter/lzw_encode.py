@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compresses data using the LZW (Lempel-Ziv-Welch) adaptive compression method.
+The output can be decompressed using LZWDecode.
+"""
+import typing
+
+from borb.io.filter.lzw_decode import LZWDecode
+
+
+class LZWEncode:
+    """
+    Compresses data using the LZW (Lempel-Ziv-Welch) adaptive compression method.
+    The output can be decompressed using LZWDecode.
+    """
+
+    @staticmethod
+    def encode(bytes_in: bytes, early_change: int = 1) -> bytes:
+        """
+        Compresses data using the LZW (Lempel-Ziv-Welch)
+        adaptive compression method
+        """
+
+        # fmt: off
+        assert early_change in [0, 1], "Illegal argument exception. early_change must be in [0, 1]."
+        # fmt: on
+
+        # The codes are written (most significant bit first) to an integer bit buffer.
+        # The code length follows the size of the table of the decoder,
+        # which adds its entries one code later than the encoder.
+        bytes_out: bytearray = bytearray()
+        bit_buffer: int = 0
+        bits_in_buffer: int = 0
+        code_length: int = 9
+        decoder_table_size: int = 258
+        is_first_code: bool = True
+
+        def _write_code(code: int) -> None:
+            nonlocal bit_buffer, bits_in_buffer, code_length, decoder_table_size, is_first_code
+            bit_buffer = (bit_buffer << code_length) | code
+            bits_in_buffer += code_length
+            while bits_in_buffer >= 8:
+                bits_in_buffer -= 8
+                bytes_out.append((bit_buffer >> bits_in_buffer) & 0xFF)
+            bit_buffer &= (1 << bits_in_buffer) - 1
+            if code == LZWDecode.CLEAR_TABLE:
+                code_length = 9
+                decoder_table_size = 258
+                is_first_code = True
+                return
+            if is_first_code:
+                is_first_code = False
+                return
+            if decoder_table_size < LZWDecode.MAX_TABLE_SIZE:
+                decoder_table_size += 1
+                if decoder_table_size + early_change >= (1 << code_length):
+                    code_length = min(code_length + 1, 12)
+
+        # The table maps (prefix code, next byte) to the code of the longer sequence
+        table: typing.Dict[int, int] = {}
+        table_size: int = 258
+        _write_code(LZWDecode.CLEAR_TABLE)
+        prefix_code: int = -1
+        for b in bytes_in:
+            if prefix_code == -1:
+                prefix_code = b
+                continue
+            code: typing.Optional[int] = table.get((prefix_code << 8) | b)
+            if code is not None:
+                prefix_code = code
+                continue
+            _write_code(prefix_code)
+            if table_size < LZWDecode.MAX_TABLE_SIZE - 1:
+                table[(prefix_code << 8) | b] = table_size
+                table_size += 1
+            else:
+                # the table is full, start over
+                _write_code(LZWDecode.CLEAR_TABLE)
+                table = {}
+                table_size = 258
+            prefix_code = b
+
+        # write the last code, and EOD marker
+        if prefix_code != -1:
+            _write_code(prefix_code)
+        _write_code(LZWDecode.END_OF_DATA)
+        if bits_in_buffer > 0:
+            bytes_out.append((bit_buffer << (8 - bits_in_buffer)) & 0xFF)
+
+        # return
+        return bytes(bytes_out)
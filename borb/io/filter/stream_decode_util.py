@@ -59,14 +59,28 @@ def decode_stream(s: Stream) -> Stream:
             )
             continue
 
+        # the remaining filters expect bytes (rather than a memoryview)
+        if isinstance(transformed_bytes, memoryview):
+            transformed_bytes = bytes(transformed_bytes)
+
         # ASCII85
         if filter_name in ["ASCII85Decode"]:
             transformed_bytes = ASCII85Decode.decode(transformed_bytes)
             continue
 
         # LZW
-        if filter_name in ["LZWDecode"]:
-            transformed_bytes = LZWDecode().decode(transformed_bytes)
+        if filter_name in ["LZWDecode", "LZW"]:
+            transformed_bytes = LZWDecode.decode(
+                bytes_in=transformed_bytes,
+                columns=int(decode_params[filter_index].get("Columns", Decimal(1))),
+                predictor=int(decode_params[filter_index].get("Predictor", Decimal(1))),
+                bits_per_component=int(
+                    decode_params[filter_index].get("BitsPerComponent", Decimal(8))
+                ),
+                early_change=int(
+                    decode_params[filter_index].get("EarlyChange", Decimal(1))
+                ),
+            )
             continue
 
         # RunLengthDecode
@@ -78,8 +92,13 @@ def decode_stream(s: Stream) -> Stream:
         assert False, "Unknown /Filter %s" % filter_name
 
     # set DecodedBytes
+    if isinstance(transformed_bytes, memoryview):
+        transformed_bytes = bytes(transformed_bytes)
     s[Name("DecodedBytes")] = transformed_bytes
 
+    # the (encoded) /Bytes match the /DecodedBytes
+    s.set_is_modified(False)
+
     # set Type if not yet set
     # if "Type" not in s:
     #    s[Name("Type")] = Name("Stream")
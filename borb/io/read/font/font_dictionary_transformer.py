@@ -25,6 +25,9 @@ class FontDictionaryTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading a Font object
     """
 
+    TRANSFORMABLE_TYPES = (dict,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def __init__(self):
         super(FontDictionaryTransformer, self).__init__()
         self._accept_true_type_standard_14_fonts: bool = True
@@ -20,6 +20,9 @@ class FunctionDictionaryTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading a Function Dictionary
     """
 
+    # can_be_transformed (also) depends on /FunctionType, so its result is not cached
+    TRANSFORMABLE_TYPES = (dict,)
+
     def __init__(self):
         super(FunctionDictionaryTransformer, self).__init__()
 
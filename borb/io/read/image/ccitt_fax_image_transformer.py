@@ -23,6 +23,9 @@ class CCITTFaxImageTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading CCITT fax images
     """
 
+    TRANSFORMABLE_TYPES = (Stream,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
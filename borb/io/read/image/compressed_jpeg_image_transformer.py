@@ -24,6 +24,9 @@ class CompressedJPEGImageTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading a jpeg image object
     """
 
+    TRANSFORMABLE_TYPES = (Stream,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
@@ -24,6 +24,9 @@ class GrayscaleImageTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading a grayscale image object
     """
 
+    # can_be_transformed (also) depends on /ColorSpace, so its result is not cached
+    TRANSFORMABLE_TYPES = (Stream,)
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
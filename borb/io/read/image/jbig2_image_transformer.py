@@ -23,6 +23,9 @@ class JBIG2ImageTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading a jbig2 image object
     """
 
+    TRANSFORMABLE_TYPES = (Stream,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
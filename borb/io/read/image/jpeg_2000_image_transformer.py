@@ -23,6 +23,9 @@ class JPEG2000ImageTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading a jpeg2000 image object
     """
 
+    TRANSFORMABLE_TYPES = (dict,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
@@ -18,6 +18,9 @@ class ArrayTransformer(Transformer):
     This implementation of BaseTransformer converts a PDFArray to a List
     """
 
+    TRANSFORMABLE_TYPES = (List,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
@@ -19,6 +19,9 @@ class StreamTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading Stream objects
     """
 
+    TRANSFORMABLE_TYPES = (Stream,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
@@ -26,6 +26,9 @@ class PageDictionaryTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading Page objects
     """
 
+    TRANSFORMABLE_TYPES = (dict,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
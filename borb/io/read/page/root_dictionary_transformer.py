@@ -12,7 +12,7 @@ from borb.io.read.object.dictionary_transformer import DictionaryTransformer
 from borb.io.read.transformer import ReadTransformerState, Transformer
 from borb.io.read.types import AnyPDFType, Decimal, Dictionary
 from borb.io.read.types import List as bList
-from borb.io.read.types import Name
+from borb.io.read.types import Name, Reference
 from borb.pdf.canvas.event.event_listener import EventListener
 from borb.pdf.page.page import Page
 
@@ -22,6 +22,9 @@ class RootDictionaryTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading the /Catalog object
     """
 
+    TRANSFORMABLE_TYPES = (dict,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
@@ -65,6 +68,62 @@ class RootDictionaryTransformer(Transformer):
             root_dictionary["Pages"]["Kids"].append(p)
         root_dictionary["Pages"][Name("Count")] = Decimal(len(pages_in_order))
 
+    def _re_order_pages_lazily(
+        self,
+        root_dictionary: dict,
+        context: ReadTransformerState,
+        event_listeners: typing.List[EventListener] = [],
+    ) -> None:
+
+        # the /Pages tree is explored using the (untransformed) objects in the XREF
+        # this avoids transforming each Page just to find out it is a Page
+        xref = context.root_object["XRef"]  # type: ignore [index]
+        src = context.source
+        tok = context.tokenizer
+
+        def _raw_object(obj: typing.Any) -> typing.Any:
+            if isinstance(obj, Reference):
+                return xref.get_object(obj, src, tok)
+            return obj
+
+        # stack to explore Page(s) DFS
+        pages_in_order: typing.List[AnyPDFType] = []
+        pages: Dictionary = root_dictionary["Pages"]
+        stack_to_handle: typing.List[AnyPDFType] = [
+            x for x in list(list.__iter__(pages["Kids"]))[::-1]
+        ]
+
+        # DFS
+        while len(stack_to_handle) > 0:
+            kid = stack_to_handle.pop(-1)
+            obj = _raw_object(kid)
+            # /Pages
+            if (
+                isinstance(obj, Dictionary)
+                and "Type" in obj
+                and obj["Type"] == "Pages"
+                and "Kids" in obj
+            ):
+                grand_kids = _raw_object(dict.__getitem__(obj, "Kids"))
+                if isinstance(grand_kids, bList):
+                    for k in list(list.__iter__(grand_kids))[::-1]:
+                        stack_to_handle.append(k)
+                continue
+            # /Page
+            pages_in_order.append(kid)
+
+        # change (Reference objects are deferred, not resolved)
+        kids: bList = bList()
+        kids.set_parent(pages)  # type: ignore [attr-defined]
+        for p in pages_in_order:
+            if isinstance(p, Reference):
+                p = self.get_root_transformer().transform(
+                    p, kids, context, event_listeners
+                )
+            kids.append(p)
+        pages[Name("Kids")] = kids
+        pages[Name("Count")] = Decimal(len(kids))
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -94,7 +153,12 @@ class RootDictionaryTransformer(Transformer):
         #
         # rebuild /Pages if needed
         #
-        self._re_order_pages(transformed_root_dictionary)
+        if context is not None and context.lazy:
+            self._re_order_pages_lazily(
+                transformed_root_dictionary, context, event_listeners
+            )
+        else:
+            self._re_order_pages(transformed_root_dictionary)
 
         # return
         return transformed_root_dictionary
@@ -9,483 +9,400 @@ information on these operators, see Appendix B of the PostScript Language Refere
 Although the semantics are those of the corresponding PostScript operators, a full PostScript interpreter is not
 required.
 """
+import math
+import re
 import typing
 from decimal import Decimal
-from math import atan, ceil, cos, degrees, exp, floor, log, sin, sqrt
 
+Operand = typing.Union[int, float, bool]
+Stack = typing.List[Operand]
+Instruction = typing.Callable[[Stack], None]
 
-class PostScriptEval:
+
+def _pop_number(stk: Stack, operator: str) -> Operand:
+    x = stk.pop()
+    # fmt: off
+    assert not isinstance(x, bool), "Unable to apply operator %s, arg must be numeric" % operator
+    # fmt: on
+    return x
+
+
+def _and(stk: Stack) -> None:
+    x = stk.pop()
+    y = stk.pop()
+    if isinstance(x, bool) and isinstance(y, bool):
+        stk.append(x and y)
+    else:
+        stk.append(int(y) & int(x))
+
+
+def _atan(stk: Stack) -> None:
+    # num den atan -> angle (in degrees, between 0 and 360)
+    den = _pop_number(stk, "atan")
+    num = _pop_number(stk, "atan")
+    stk.append(math.degrees(math.atan2(num, den)) % 360)
+
+
+def _bitshift(stk: Stack) -> None:
+    shift = int(_pop_number(stk, "bitshift"))
+    x = int(_pop_number(stk, "bitshift"))
+    stk.append(x << shift if shift >= 0 else x >> -shift)
+
+
+def _copy(stk: Stack) -> None:
+    n = int(stk.pop())
+    if n > 0:
+        stk.extend(stk[-n:])
+
+
+def _exch(stk: Stack) -> None:
+    stk[-1], stk[-2] = stk[-2], stk[-1]
+
+
+def _exp(stk: Stack) -> None:
+    # base exponent exp -> real
+    x = _pop_number(stk, "exp")
+    y = float(_pop_number(stk, "exp")) ** x
+    # a negative base with a fractional exponent has no real result
+    # fmt: off
+    assert not isinstance(y, complex), "Unable to apply operator exp, result must be real"
+    # fmt: on
+    stk.append(y)
+
+
+def _idiv(stk: Stack) -> None:
+    x = int(_pop_number(stk, "idiv"))
+    y = int(_pop_number(stk, "idiv"))
+    q: int = abs(y) // abs(x)
+    stk.append(q if (x < 0) == (y < 0) else -q)
+
+
+def _index(stk: Stack) -> None:
+    n = int(stk.pop())
+    stk.append(stk[-1 - n])
+
+
+def _mod(stk: Stack) -> None:
+    # the sign of the result is the sign of the dividend
+    x = int(_pop_number(stk, "mod"))
+    y = int(_pop_number(stk, "mod"))
+    r: int = abs(y) % abs(x)
+    stk.append(r if y >= 0 else -r)
+
+
+def _not(stk: Stack) -> None:
+    x = stk.pop()
+    stk.append((not x) if isinstance(x, bool) else ~int(x))
+
+
+def _or(stk: Stack) -> None:
+    x = stk.pop()
+    y = stk.pop()
+    if isinstance(x, bool) and isinstance(y, bool):
+        stk.append(x or y)
+    else:
+        stk.append(int(y) | int(x))
+
+
+def _roll(stk: Stack) -> None:
+    # n j roll -> performs a circular shift of the top n objects by j positions
+    j = int(stk.pop())
+    n = int(stk.pop())
+    if n <= 0:
+        return
+    j %= n
+    if j != 0:
+        stk[-n:] = stk[-j:] + stk[-n:-j]
+
+
+def _xor(stk: Stack) -> None:
+    x = stk.pop()
+    y = stk.pop()
+    if isinstance(x, bool) and isinstance(y, bool):
+        stk.append(x != y)
+    else:
+        stk.append(int(y) ^ int(x))
+
+
+def _unary(operator: str, f: typing.Callable[[Operand], Operand]) -> Instruction:
+    # an operator that takes (and returns) a number
+    def _instruction(stk: Stack) -> None:
+        stk.append(f(_pop_number(stk, operator)))
+
+    return _instruction
+
+
+def _binary(
+    operator: str, f: typing.Callable[[Operand, Operand], Operand]
+) -> Instruction:
+    # an operator that takes two numbers
+    def _instruction(stk: Stack) -> None:
+        x = _pop_number(stk, operator)
+        stk.append(f(_pop_number(stk, operator), x))
+
+    return _instruction
+
+
+def _push(x: Operand) -> Instruction:
+    def _instruction(stk: Stack) -> None:
+        stk.append(x)
+
+    return _instruction
+
+
+class PostScriptProgram:
     """
-    The language that shall be used in a type 4 function contains expressions involving integers, real numbers, and
-    boolean values only. There shall be no composite data structures such as strings or arrays, no procedures, and
-    no variables or names. Table 42 lists the operators that can be used in this type of function. (For more
-    information on these operators, see Appendix B of the PostScript Language Reference, Third Edition.)
-    Although the semantics are those of the corresponding PostScript operators, a full PostScript interpreter is not
-    required.
+    This class represents a (compiled) type 4 function.
+    The program is parsed once, into a sequence of instructions that operate on a stack of int, float and bool.
+    Constant operands of arithmetic operators are folded into the operator, and the procedures of if/ifelse
+    are compiled into their own sequence of instructions.
     """
 
+    OPERATORS: typing.Dict[str, Instruction] = {
+        # arithmetic operators
+        "abs": _unary("abs", abs),
+        "add": _binary("add", lambda y, x: y + x),
+        "atan": _atan,
+        "ceiling": _unary("ceiling", math.ceil),
+        "cos": _unary("cos", lambda x: math.cos(math.radians(x))),
+        "cvi": _unary("cvi", int),
+        "cvr": _unary("cvr", float),
+        "div": _binary("div", lambda y, x: y / x),
+        "exp": _exp,
+        "floor": _unary("floor", math.floor),
+        "idiv": _idiv,
+        "ln": _unary("ln", math.log),
+        "log": _unary("log", math.log10),
+        "mod": _mod,
+        "mul": _binary("mul", lambda y, x: y * x),
+        "neg": _unary("neg", lambda x: -x),
+        "round": _unary("round", lambda x: math.floor(x + 0.5)),
+        "sin": _unary("sin", lambda x: math.sin(math.radians(x))),
+        "sqrt": _unary("sqrt", math.sqrt),
+        "sub": _binary("sub", lambda y, x: y - x),
+        "truncate": _unary("truncate", math.trunc),
+        # relational, boolean, and bitwise operators
+        "and": _and,
+        "bitshift": _bitshift,
+        "eq": lambda stk: stk.append(stk.pop() == stk.pop()),
+        "false": _push(False),
+        "ge": _binary("ge", lambda y, x: y >= x),
+        "gt": _binary("gt", lambda y, x: y > x),
+        "le": _binary("le", lambda y, x: y <= x),
+        "lt": _binary("lt", lambda y, x: y < x),
+        "ne": lambda stk: stk.append(stk.pop() != stk.pop()),
+        "not": _not,
+        "or": _or,
+        "true": _push(True),
+        "xor": _xor,
+        # stack operators
+        "copy": _copy,
+        "dup": lambda stk: stk.append(stk[-1]),
+        "exch": _exch,
+        "index": _index,
+        "pop": lambda stk: stk.pop(),
+        "roll": _roll,
+    }
+
+    def __init__(
+        self,
+        s: str,
+        domain: typing.Optional[typing.List[float]] = None,
+        range_: typing.Optional[typing.List[float]] = None,
+    ):
+        self._source: str = s
+        self._domain: typing.Optional[typing.List[float]] = domain
+        self._range: typing.Optional[typing.List[float]] = range_
+        tokens: typing.List[str] = re.findall(r"[{}]|[^\s{}]+", s)
+        procedure, i = PostScriptProgram._parse(tokens, 0)
+        assert i == len(tokens), "Unbalanced brackets in postscript str"
+        # the program itself is (usually) enclosed in brackets
+        if len(procedure) == 1 and isinstance(procedure[0], list):
+            procedure = procedure[0]
+        self._instructions: typing.List[Instruction] = PostScriptProgram._compile(
+            procedure
+        )
+
+    def __reduce__(self):
+        # the compiled instructions are closures, the program is re-compiled when unpickled
+        return PostScriptProgram, (self._source, self._domain, self._range)
+
     @staticmethod
-    def evaluate(s: str, args: typing.List[Decimal]) -> typing.List[Decimal]:
-        """
-        This function evaluates a postscript str, using args as the (initial) stack.
-        This function returns a typing.List[Decimal], or throws an assertion error
-        """
-        stk: typing.List[typing.Union[Decimal, bool]] = [x for x in args]
-        ops: typing.List[str] = [
-            "abs",
-            "add",
-            "and",
-            "atan",
-            "bitshift",  # TODO
-            "ceiling",
-            "copy",
-            "cos",
-            "cvi",
-            "cvr",
-            "div",
-            "dup",
-            "eq",
-            "exch",
-            "exp",
-            "false",
-            "floor",
-            "ge",
-            "gt",
-            "idiv",
-            "index",  # TODO
-            "le",
-            "ln",
-            "log",
-            "lt",
-            "mod",
-            "mul",
-            "ne",
-            "neg",
-            "not",
-            "or",
-            "pop",
-            "roll",  # TODO
-            "round",
-            "sin",
-            "sqrt",
-            "sub",
-            "true",
-            "truncate",  # TODO
-            "xor",
-        ]
+    def _parse(tokens: typing.List[str], i: int) -> typing.Tuple[list, int]:
+        procedure: list = []
+        while i < len(tokens):
+            t: str = tokens[i]
+            i += 1
+            if t == "{":
+                p, i = PostScriptProgram._parse(tokens, i)
+                procedure.append(p)
+                continue
+            if t == "}":
+                return procedure, i
+            if t in PostScriptProgram.OPERATORS or t in ["if", "ifelse"]:
+                procedure.append(t)
+                continue
+            try:
+                procedure.append(int(t))
+            except ValueError:
+                try:
+                    procedure.append(float(t))
+                except ValueError:
+                    assert False, "Unknown operator %s in postscript str" % t
+        return procedure, i
 
+    @staticmethod
+    def _compile(procedure: list) -> typing.List[Instruction]:
+        instructions: typing.List[Instruction] = []
         i: int = 0
-        while i < len(s):
+        while i < len(procedure):
+            x = procedure[i]
 
-            # whitespace
-            if s[i] in " \n\t":
-                i += 1
-                continue
+            # {proc} if, {proc1} {proc2} ifelse
+            if isinstance(x, list):
+                if i + 1 < len(procedure) and procedure[i + 1] == "if":
+                    instructions.append(
+                        PostScriptProgram._compile_if(PostScriptProgram._compile(x))
+                    )
+                    i += 2
+                    continue
+                # fmt: off
+                if i + 2 < len(procedure) and isinstance(procedure[i + 1], list) and procedure[i + 2] == "ifelse":
+                    instructions.append(PostScriptProgram._compile_ifelse(PostScriptProgram._compile(x), PostScriptProgram._compile(procedure[i + 1])))
+                    i += 3
+                    continue
+                # fmt: on
+                assert False, "Unable to compile postscript str, unexpected procedure"
 
-            # brackets
-            if s[i] == "{" or s[i] == "}":
+            # constant operand (folded into the next operator, where possible)
+            if isinstance(x, (int, float)):
+                # fmt: off
+                if i + 1 < len(procedure) and procedure[i + 1] in ["add", "sub", "mul", "div"]:
+                    instructions.append(PostScriptProgram._compile_constant_operator(procedure[i + 1], x))
+                    i += 2
+                    continue
+                # fmt: on
+                instructions.append(_push(x))
                 i += 1
                 continue
 
-            # operand
-            if s[i] in "0123456789.-":
-                operand: str = ""
-                while i < len(s) and s[i] in "0123456789.-":
-                    operand += s[i]
-                    i += 1
-                stk.append(Decimal(operand))
-                continue
-
             # operator
-            if any([x.startswith(s[i]) for x in ops]):
-                operator: str = ""
-                while i < len(s) and s[i] in "abcdefghijklmnopqrstuvwxyz":
-                    operator += s[i]
-                    i += 1
-                if operator not in ops:
-                    assert False, "Unknown operator %s in postscript str" % operator
-
-                x: typing.Optional[typing.Union[Decimal, bool]] = None
-                y: typing.Optional[typing.Union[Decimal, bool]] = None
-
-                # abs
-                if operator == "abs":
-                    # fmt: off
-                    assert (len(stk) >= 1), "Unable to apply operator abs, stack underflow"
-                    assert isinstance(stk[-1], Decimal), "Unable to apply operator abs, arg 1 must be of type Decimal"
-                    # fmt: on
-                    x = stk[-1]
-                    stk.pop(len(stk) - 1)
-                    stk.append(abs(x))
-                    continue
-                # add
-                if operator == "add":
-                    # fmt: off
-                    assert (len(stk) >= 2), "Unable to apply operator add, stack underflow"
-                    assert isinstance(stk[-1], Decimal), "Unable to apply operator add, arg 1 must be of type Decimal"
-                    assert isinstance(stk[-2], Decimal), "Unable to apply operator add, arg 2 must be of type Decimal"
-                    # fmt: on
-                    x = stk[-1]
-                    y = stk[-2]
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(x + y)
-                    continue
-                # and
-                if operator == "and":
-                    # fmt: off
-                    assert (len(stk) >= 2), "Unable to apply operator and, stack underflow"
-                    assert isinstance(stk[-1], bool), "Unable to apply operator and, arg 1 must be of type bool"
-                    assert isinstance(stk[-2], bool), "Unable to apply operator and, arg 2 must be of type bool"
-                    # fmt: on
-                    x = stk[-1]
-                    y = stk[-2]
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(x and y)
-                    continue
-                # atan
-                if operator == "atan":
-                    # fmt: off
-                    assert (len(stk) >= 1), "Unable to apply operator atan, stack underflow"
-                    assert isinstance(stk[-1], Decimal), "Unable to apply operator atan, arg 1 must be of type Decimal"
-                    # fmt: on
-                    x = stk[-1]
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(atan(x)))
-                    continue
-                # ceiling
-                if operator == "ceiling":
-                    # fmt: off
-                    assert (len(stk) >= 1), "Unable to apply operator ceiling, stack underflow"
-                    assert isinstance(stk[-1], Decimal), "Unable to apply operator ceiling, arg 1 must be of type Decimal"
-                    # fmt: on
-                    x = stk[-1]
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(ceil(x)))
-                    continue
-                # cos
-                if operator == "cos":
-                    # fmt: off
-                    assert (len(stk) >= 1), "Unable to apply operator cos, stack underflow"
-                    assert isinstance(stk[-1], Decimal), "Unable to apply operator cos, arg 1 must be of type Decimal"
-                    # fmt: on
-                    x = stk[-1]
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(cos(degrees(x))))
-                    continue
-                # cvi
-                if operator == "cvi":
-                    # fmt: off
-                    assert (len(stk) >= 1), "Unable to apply operator cvi, stack underflow"
-                    assert isinstance(stk[-1], Decimal), "Unable to apply operator cvi, arg 1 must be of type Decimal"
-                    # fmt: on
-                    x = stk[-1]
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(int(x)))
-                    continue
-                # cvr
-                if operator == "cvr":
-                    # fmt: off
-                    assert (len(stk) >= 1), "Unable to apply operator cvr, stack underflow"
-                    # fmt: on
-                # div
-                if operator == "div":
-                    # fmt: off
-                    assert (len(stk) >= 2), "Unable to apply operator div, stack underflow"
-                    assert isinstance(stk[-1], Decimal), "Unable to apply operator div, arg 1 must be of type Decimal"
-                    assert isinstance(stk[-2], Decimal), "Unable to apply operator div, arg 2 must be of type Decimal"
-                    assert stk[-1] != Decimal(0), "Unable to apply operator div, arg1 must not be 0"
-                    # fmt: on
-                    x = stk[-1]
-                    y = stk[-2]
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(y / x)
-                    continue
-                # dup
-                if operator == "dup":
-                    # fmt: off
-                    assert (len(stk) >= 1), "Unable to apply operator dup, stack underflow"
-                    # fmt: on
-                    stk.append(stk[-1])
-                    continue
-                # eq
-                if operator == "eq":
-                    assert len(stk) >= 2, "Unable to apply operator eq, stack underflow"
-                    x = stk[-1]
-                    y = stk[-2]
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(x == y)
-                    continue
-                # exch
-                if operator == "exch":
-                    # fmt: off
-                    assert (len(stk) >= 2), "Unable to apply operator exch, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    y = stk[-2]
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(x)
-                    stk.append(y)
-                    continue
-                # exp
-                if operator == "exp":
-                    # fmt: off
-                    assert len(stk) >= 1, "Unable to apply operator exp, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    assert isinstance(
-                        x, Decimal
-                    ), "Unable to apply operator exp, unexpected type"
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(exp(x)))
-                    continue
-                # false
-                if operator == "false":
-                    stk.append(False)
-                    continue
-                # floor
-                if operator == "floor":
-                    # fmt: off
-                    assert len(stk) >= 1, "Unable to apply operator floor, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    assert isinstance(
-                        x, Decimal
-                    ), "Unable to apply operator floor, unexpected type"
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(floor(x)))
-                    continue
-                # ge
-                if operator == "ge":
-                    assert len(stk) >= 2, "Unable to apply operator ge, stack underflow"
-                    x = stk[-1]
-                    y = stk[-2]
-                    assert isinstance(
-                        x, Decimal
-                    ), "Unable to apply operator ge, unexpected type"
-                    assert isinstance(
-                        y, Decimal
-                    ), "Unable to apply operator ge, unexpected type"
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(y >= x)
-                    continue
-                # gt
-                if operator == "gt":
-                    assert len(stk) >= 2, "Unable to apply operator gt, stack underflow"
-                    x = stk[-1]
-                    y = stk[-2]
-                    assert isinstance(x, Decimal)
-                    assert isinstance(y, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(y > x)
-                    continue
-                # idiv
-                if operator == "idiv":
-                    # fmt: off
-                    assert len(stk) >= 2, "Unable to apply operator idiv, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    y = stk[-2]
-                    assert isinstance(x, Decimal)
-                    assert isinstance(y, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    # fmt: off
-                    assert x != Decimal(0), "Unable to apply operator idiv, division by zero"
-                    # fmt: on
-                    stk.append(Decimal(int(y / x)))
-                    continue
-                # le
-                if operator == "le":
-                    assert len(stk) >= 2, "Unable to apply operator le, stack underflow"
-                    x = stk[-1]
-                    y = stk[-2]
-                    assert isinstance(x, Decimal)
-                    assert isinstance(y, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(y <= x)
-                    continue
-                # ln
-                if operator == "ln":
-                    assert len(stk) >= 1, "Unable to apply operator ln, stack underflow"
-                    x = stk[-1]
-                    assert isinstance(x, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(log(x)))
-                    continue
-                # log
-                if operator == "log":
-                    # fmt: off
-                    assert len(stk) >= 1, "Unable to apply operator log, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    assert isinstance(x, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(log(x, Decimal(10))))
-                    continue
-                # lt
-                if operator == "lt":
-                    assert len(stk) >= 2, "Unable to apply operator lt, stack underflow"
-                    x = stk[-1]
-                    y = stk[-2]
-                    assert isinstance(x, Decimal)
-                    assert isinstance(y, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(y < x)
-                    continue
-                # mod
-                if operator == "mod":
-                    # fmt: off
-                    assert len(stk) >= 2, "Unable to apply operator mod, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    y = stk[-2]
-                    assert isinstance(x, Decimal)
-                    assert isinstance(y, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    # fmt: off
-                    assert y != Decimal(0), "Unable to apply operator mod, division by zero"
-                    # fmt: on
-                    stk.append(Decimal(int(y) % int(x)))
-                    continue
-                # mul
-                if operator == "mul":
-                    # fmt: off
-                    assert len(stk) >= 2, "Unable to apply operator mul, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    y = stk[-2]
-                    assert isinstance(x, Decimal)
-                    assert isinstance(y, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(y * x)
-                    continue
-                # ne
-                if operator == "ne":
-                    assert len(stk) >= 2, "Unable to apply operator ne, stack underflow"
-                    x = stk[-1]
-                    y = stk[-2]
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(y != x)
-                    continue
-                # neg
-                if operator == "neg":
-                    # fmt: off
-                    assert len(stk) >= 1, "Unable to apply operator neg, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    assert isinstance(x, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.append(-x)
-                    continue
-                # not
-                if operator == "not":
-                    # fmt: off
-                    assert len(stk) >= 1, "Unable to apply operator not, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    assert isinstance(x, bool)
-                    stk.pop(len(stk) - 1)
-                    stk.append(not x)
-                    continue
-                # or
-                if operator == "or":
-                    assert len(stk) >= 2, "Unable to apply operator or, stack underflow"
-                    x = stk[-1]
-                    y = stk[-2]
-                    assert isinstance(x, bool)
-                    assert isinstance(y, bool)
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(y or x)
-                    continue
-                # pop
-                if operator == "pop":
-                    # fmt: off
-                    assert len(stk) >= 1, "Unable to apply operator pop, stack underflow"
-                    # fmt: on
-                    stk.pop(-1)
-                    continue
-                # round
-                if operator == "round":
-                    # fmt: off
-                    assert len(stk) >= 1, "Unable to apply operator round, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    assert isinstance(x, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(round(x)))
-                    continue
-                # sin
-                if operator == "sin":
-                    # fmt: off
-                    assert len(stk) >= 1, "Unable to apply operator sin, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    assert isinstance(x, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(sin(degrees(x))))
-                    continue
-                # sqrt
-                if operator == "sqrt":
-                    # fmt: off
-                    assert len(stk) >= 1, "Unable to apply operator sqrt, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    assert isinstance(x, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.append(Decimal(sqrt(x)))
-                    continue
-                # sub
-                if operator == "sub":
-                    # fmt: off
-                    assert len(stk) >= 2, "Unable to apply operator sub, stack underflow"
-                    # fmt: on
-                    x = stk[-1]
-                    y = stk[-2]
-                    assert isinstance(x, Decimal)
-                    assert isinstance(y, Decimal)
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(y - x)
-                    continue
-                # true
-                if operator == "true":
-                    stk.append(True)
-                    continue
-                # xor
-                if operator == "xor":
+            # fmt: off
+            assert x not in ["if", "ifelse"], "Unable to apply operator %s, procedure expected" % x
+            # fmt: on
+            instructions.append(PostScriptProgram.OPERATORS[x])
+            i += 1
+        return instructions
+
+    @staticmethod
+    def _compile_constant_operator(operator: str, c: Operand) -> Instruction:
+        if operator == "add":
+            return lambda stk: stk.append(_pop_number(stk, "add") + c)
+        if operator == "sub":
+            return lambda stk: stk.append(_pop_number(stk, "sub") - c)
+        if operator == "mul":
+            return lambda stk: stk.append(_pop_number(stk, "mul") * c)
+        return lambda stk: stk.append(_pop_number(stk, "div") / c)
+
+    @staticmethod
+    def _compile_if(procedure: typing.List[Instruction]) -> Instruction:
+        def _instruction(stk: Stack) -> None:
+            if stk.pop():
+                for f in procedure:
+                    f(stk)
+
+        return _instruction
+
+    @staticmethod
+    def _compile_ifelse(
+        procedure_0: typing.List[Instruction], procedure_1: typing.List[Instruction]
+    ) -> Instruction:
+        def _instruction(stk: Stack) -> None:
+            for f in procedure_0 if stk.pop() else procedure_1:
+                f(stk)
+
+        return _instruction
+
+    @staticmethod
+    def _clip(xs: Stack, bounds: typing.List[float]) -> Stack:
+        return [
+            min(max(x, bounds[2 * i]), bounds[2 * i + 1])
+            if 2 * i + 1 < len(bounds)
+            else x
+            for i, x in enumerate(xs)
+        ]
+
+    def evaluate(self, xs: typing.Sequence[Operand]) -> typing.List[float]:
+        """
+        This function evaluates this PostScriptProgram, using xs as the (initial) stack.
+        Input values are clipped to the domain, output values are clipped to the range (if they are known).
+        This function returns a typing.List[float], or throws an assertion error
+        """
+        return self.evaluate_many([xs])[0]
+
+    def evaluate_many(
+        self, xss: typing.Iterable[typing.Sequence[Operand]]
+    ) -> typing.List[typing.List[float]]:
+        """
+        This function evaluates this PostScriptProgram for each of the given inputs.
+        This function returns a typing.List[typing.List[float]], or throws an assertion error
+        """
+        instructions: typing.List[Instruction] = self._instructions
+        domain: typing.Optional[typing.List[float]] = self._domain
+        range_: typing.Optional[typing.List[float]] = self._range
+        out: typing.List[typing.List[float]] = []
+        for xs in xss:
+            stk: Stack = [float(x) for x in xs]
+            if domain is not None:
+                stk = PostScriptProgram._clip(stk, domain)
+            try:
+                for f in instructions:
+                    f(stk)
+
+                # check type(s)
+                for y in stk:
                     # fmt: off
-                    assert len(stk) >= 2, "Unable to apply operator xor, stack underflow"
+                    assert not isinstance(y, bool), "Unable to evaluate postscript str, output must be numeric"
                     # fmt: on
-                    x = stk[-1]
-                    y = stk[-2]
-                    assert isinstance(x, bool)
-                    assert isinstance(y, bool)
-                    stk.pop(len(stk) - 1)
-                    stk.pop(len(stk) - 1)
-                    stk.append(x or y and not (x and y))
-                    continue
+                if range_ is not None:
+                    stk = PostScriptProgram._clip(stk, range_)
+                out.append([float(y) for y in stk])
+            except (IndexError, ZeroDivisionError, ValueError, TypeError) as e:
+                assert False, "Unable to evaluate postscript str, %s" % (
+                    "stack underflow" if isinstance(e, IndexError) else str(e)
+                )
+        return out
 
-            # unknown, advance by 1
-            i += 1
 
-        # check type(s)
-        out: typing.List[Decimal] = []
-        for x in stk:
-            assert isinstance(x, Decimal)
-            out.append(x)
+class PostScriptEval:
+    """
+    The language that shall be used in a type 4 function contains expressions involving integers, real numbers, and
+    boolean values only. There shall be no composite data structures such as strings or arrays, no procedures, and
+    no variables or names. Table 42 lists the operators that can be used in this type of function. (For more
+    information on these operators, see Appendix B of the PostScript Language Reference, Third Edition.)
+    Although the semantics are those of the corresponding PostScript operators, a full PostScript interpreter is not
+    required.
+    """
 
-        # return
-        return out
+    @staticmethod
+    def compile(
+        s: str,
+        domain: typing.Optional[typing.List[float]] = None,
+        range_: typing.Optional[typing.List[float]] = None,
+    ) -> PostScriptProgram:
+        """
+        This function compiles a postscript str into a PostScriptProgram, which can then be evaluated (many times).
+        This function returns a PostScriptProgram, or throws an assertion error
+        """
+        return PostScriptProgram(s, domain, range_)
+
+    @staticmethod
+    def evaluate(s: str, args: typing.List[Decimal]) -> typing.List[Decimal]:
+        """
+        This function evaluates a postscript str, using args as the (initial) stack.
+        This function returns a typing.List[Decimal], or throws an assertion error
+        """
+        # borb.io.read.types depends on this module
+        from borb.io.read.types import Decimal as bDecimal
+
+        return [bDecimal(repr(y)) for y in PostScriptProgram(s).evaluate(args)]
@@ -18,6 +18,9 @@ class NumberTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading Decimal objects
     """
 
+    TRANSFORMABLE_TYPES = (Decimal,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
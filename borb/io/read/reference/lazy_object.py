@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This module contains everything needed to load a PDF lazily.
+When a PDF is loaded lazily, Reference objects are not resolved while the Document is being read.
+Instead, the Dictionary (or List) holding the Reference resolves (and transforms) it the first time it is accessed.
+"""
+import typing
+
+from borb.io.read.types import Dictionary, List, Reference
+
+# a resolver takes the (unresolved) Reference, and the object that holds it
+Resolver = typing.Callable[[Reference, typing.Any], typing.Any]
+
+
+def _is_deferred(value: typing.Any) -> bool:
+    return isinstance(value, Reference) and getattr(value, "_resolver", None) is not None
+
+
+def _is_ancestor(obj: typing.Any, parent: typing.Any) -> bool:
+    e = parent
+    while e is not None:
+        if e is obj:
+            return True
+        e = e.get_parent() if hasattr(e, "get_parent") else None
+    return False
+
+
+def _resolve(value: Reference, parent: typing.Any) -> typing.Any:
+    # a Reference that can not be resolved (yet) remains deferred
+    # e.g. a Reference that is encountered while it is being resolved
+    resolver: Resolver = getattr(value, "_resolver")
+    setattr(value, "_resolver", None)
+    resolved_value = resolver(value, parent)
+    if resolved_value is None:
+        setattr(value, "_resolver", resolver)
+        return None
+    # a Reference to an ancestor remains a Reference (as it would when loading eagerly)
+    if _is_ancestor(resolved_value, parent):
+        return None
+    return resolved_value
+
+
+class LazyDictionary:
+    """
+    This class (mixin) resolves deferred Reference values of a Dictionary as they are accessed.
+    It is never instantiated directly, lazily loaded Dictionary objects have their class changed
+    to a subclass of both LazyDictionary and their original class (see make_lazy).
+    """
+
+    __slots__ = ()
+
+    def _resolve_key(self, key):
+        value = dict.__getitem__(self, key)  # type: ignore [arg-type]
+        if not _is_deferred(value):
+            return value
+        resolved_value = _resolve(value, self)
+        if resolved_value is None:
+            return value
+        dict.__setitem__(self, key, resolved_value)  # type: ignore [arg-type]
+        return resolved_value
+
+    def _resolve_all(self) -> None:
+        for k in [k for k, v in dict.items(self) if _is_deferred(v)]:  # type: ignore [arg-type]
+            self._resolve_key(k)
+
+    def __getitem__(self, key):
+        return self._resolve_key(key)
+
+    def __eq__(self, other):
+        self._resolve_all()
+        return super(LazyDictionary, self).__eq__(other)  # type: ignore [misc]
+
+    def __hash__(self):
+        return super(LazyDictionary, self).__hash__()  # type: ignore [misc]
+
+    def copy(self):
+        """
+        Return a shallow copy of the dictionary
+        """
+        self._resolve_all()
+        return super(LazyDictionary, self).copy()  # type: ignore [misc]
+
+    def get(self, key, default=None):
+        """
+        Return the value for key if key is in the dictionary, else default.
+        """
+        if key not in self:  # type: ignore [operator]
+            return default
+        return self._resolve_key(key)
+
+    def items(self):
+        """
+        Return a set-like object providing a view on the dictionary's items
+        """
+        self._resolve_all()
+        return super(LazyDictionary, self).items()  # type: ignore [misc]
+
+    def pop(self, key, *args):
+        """
+        Remove the specified key and return the corresponding value.
+        """
+        if key in self:  # type: ignore [operator]
+            self._resolve_key(key)
+        return super(LazyDictionary, self).pop(key, *args)  # type: ignore [misc]
+
+    def popitem(self):
+        """
+        Remove and return a (key, value) pair as a 2-tuple.
+        """
+        self._resolve_all()
+        return super(LazyDictionary, self).popitem()  # type: ignore [misc]
+
+    def setdefault(self, key, default=None):
+        """
+        Insert key with a value of default if key is not in the dictionary.
+        Return the value for key if key is in the dictionary, else default.
+        """
+        if key in self:  # type: ignore [operator]
+            return self._resolve_key(key)
+        return super(LazyDictionary, self).setdefault(key, default)  # type: ignore [misc]
+
+    def values(self):
+        """
+        Return an object providing a view on the dictionary's values
+        """
+        self._resolve_all()
+        return super(LazyDictionary, self).values()  # type: ignore [misc]
+
+
+class LazyList:
+    """
+    This class (mixin) resolves deferred Reference values of a List as they are accessed.
+    It is never instantiated directly, lazily loaded List objects have their class changed
+    to a subclass of both LazyList and their original class (see make_lazy).
+    """
+
+    __slots__ = ()
+
+    def _resolve_index(self, index: int):
+        value = list.__getitem__(self, index)  # type: ignore [call-overload]
+        if not _is_deferred(value):
+            return value
+        resolved_value = _resolve(value, self)
+        if resolved_value is None:
+            return value
+        list.__setitem__(self, index, resolved_value)  # type: ignore [call-overload]
+        return resolved_value
+
+    def _resolve_all(self) -> None:
+        for i in range(0, len(self)):  # type: ignore [arg-type]
+            self._resolve_index(i)
+
+    def __contains__(self, item):
+        self._resolve_all()
+        return super(LazyList, self).__contains__(item)  # type: ignore [misc]
+
+    def __eq__(self, other):
+        self._resolve_all()
+        return super(LazyList, self).__eq__(other)  # type: ignore [misc]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            for i in range(*index.indices(len(self))):  # type: ignore [arg-type]
+                self._resolve_index(i)
+            return super(LazyList, self).__getitem__(index)  # type: ignore [misc]
+        return self._resolve_index(index)
+
+    def __hash__(self):
+        return super(LazyList, self).__hash__()  # type: ignore [misc]
+
+    def __iter__(self):
+        i: int = 0
+        while i < len(self):  # type: ignore [arg-type]
+            yield self._resolve_index(i)
+            i += 1
+
+    def __reversed__(self):
+        self._resolve_all()
+        return super(LazyList, self).__reversed__()  # type: ignore [misc]
+
+    def copy(self):
+        """
+        Return a shallow copy of the list.
+        """
+        self._resolve_all()
+        return super(LazyList, self).copy()  # type: ignore [misc]
+
+    def index(self, *args):
+        """
+        Return first index of value.
+        """
+        self._resolve_all()
+        return super(LazyList, self).index(*args)  # type: ignore [misc]
+
+    def pop(self, index: int = -1):
+        """
+        Remove and return item at index (default last).
+        """
+        self._resolve_index(index)
+        return super(LazyList, self).pop(index)  # type: ignore [misc]
+
+
+_LAZY_CLASSES: typing.Dict[type, type] = {}
+
+
+def make_lazy(obj: typing.Any) -> typing.Any:
+    """
+    This function changes the class of a Dictionary (or List) to a (cached) subclass that resolves
+    deferred Reference values on access. The object keeps being an instance of its original class.
+    """
+    if isinstance(obj, (LazyDictionary, LazyList)):
+        return obj
+    if not isinstance(obj, (Dictionary, List)):
+        return obj
+    cls: type = obj.__class__
+    lazy_cls: typing.Optional[type] = _LAZY_CLASSES.get(cls, None)
+    if lazy_cls is None:
+        mixin: type = LazyDictionary if isinstance(obj, Dictionary) else LazyList
+        lazy_cls = type(
+            cls.__name__, (mixin, cls), {"__module__": cls.__module__, "__slots__": ()}
+        )
+        _LAZY_CLASSES[cls] = lazy_cls
+    obj.__class__ = lazy_cls
+    return obj
+
+
+def defer_reference(reference: Reference, parent: typing.Any, resolver: Resolver):
+    """
+    This function marks a Reference (held by parent) as deferred.
+    The resolver will be called (once) when the Reference is first accessed through its parent.
+    """
+    setattr(reference, "_resolver", resolver)
+    make_lazy(parent)
+    return reference
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This module keeps track of the (indirect) objects that were read from a PDF.
+It allows a Document to determine which objects were modified after they were read,
+so that only those objects (and any new objects) need to be written in an incremental update.
+"""
+import typing
+
+from borb.io.read.types import Dictionary, List, Reference, Stream
+
+
+class ObjectSnapshots:
+    """
+    This class keeps track of the (indirect) objects that were read from a PDF.
+    For every object it stores the Reference it was read from, and a shallow snapshot of its contents
+    (and of the contents of every direct object it holds). Values are compared by identity.
+    An object is modified if any of those contents were replaced, added or removed,
+    or if it is a Stream whose /DecodedBytes were replaced (and no longer match its /Bytes).
+
+    Objects are only snapshotted (see flush) once they (and the objects they hold) were completely read.
+    """
+
+    def __init__(self):
+        self._objects: typing.Dict[int, typing.Any] = {}
+        self._references: typing.Dict[int, Reference] = {}
+        self._contents: typing.Dict[int, typing.Tuple[typing.Any, tuple]] = {}
+        self._decoded_bytes: typing.Dict[int, typing.Any] = {}
+        self._pending: typing.List[typing.Any] = []
+        self._end_of_file: int = 0
+        self._start_of_xref: typing.Optional[int] = None
+
+    #
+    # PRIVATE
+    #
+
+    @staticmethod
+    def _get_contents(obj: typing.Any) -> tuple:
+        # values are accessed through dict and list (rather than obj)
+        # to avoid resolving References when the Document was loaded lazily
+        if isinstance(obj, Stream):
+            # /DecodedBytes are tracked by the Stream itself (see Stream.is_modified)
+            return tuple((k, v) for k, v in dict.items(obj) if k != "DecodedBytes")
+        if isinstance(obj, Dictionary):
+            return tuple(dict.items(obj))
+        return tuple(list.__iter__(obj))
+
+    @staticmethod
+    def _get_values(contents: tuple, obj: typing.Any) -> typing.Iterable:
+        if isinstance(obj, Dictionary):
+            return (v for _, v in contents)
+        return contents
+
+    def _is_direct(self, obj: typing.Any) -> bool:
+        return isinstance(obj, (Dictionary, List)) and id(obj) not in self._references
+
+    def _is_same_value(self, value_before: typing.Any, value_after: typing.Any) -> bool:
+        if value_before is value_after:
+            return True
+        # when loading lazily, a Reference is replaced by the object it refers to (once it is accessed)
+        if isinstance(value_before, Reference):
+            ref: typing.Optional[Reference] = self._references.get(id(value_after))
+            if ref is None or ref.object_number != value_before.object_number:
+                return False
+            return (ref.generation_number or 0) == (value_before.generation_number or 0)
+        return False
+
+    def _is_modified(self, obj: typing.Any) -> bool:
+        snapshot: typing.Optional[typing.Tuple[typing.Any, tuple]] = self._contents.get(
+            id(obj)
+        )
+        if snapshot is None:
+            return False
+        contents_before: tuple = snapshot[1]
+        contents_after: tuple = ObjectSnapshots._get_contents(obj)
+        if len(contents_before) != len(contents_after):
+            return True
+        if isinstance(obj, Dictionary):
+            for (k0, v0), (k1, v1) in zip(contents_before, contents_after):
+                if k0 != k1 or not self._is_same_value(v0, v1):
+                    return True
+        else:
+            for v0, v1 in zip(contents_before, contents_after):
+                if not self._is_same_value(v0, v1):
+                    return True
+        if isinstance(obj, Stream):
+            # /DecodedBytes may be added (when the Stream is decoded) without modifying the Stream
+            decoded_bytes: typing.Any = dict.get(obj, "DecodedBytes", None)
+            if (
+                decoded_bytes is not None
+                and decoded_bytes is not self._decoded_bytes.get(id(obj), None)
+                and obj.is_modified()
+            ):
+                return True
+        # direct objects are part of this object
+        return any(
+            [
+                self._is_modified(v)
+                for v in ObjectSnapshots._get_values(contents_before, obj)
+                if self._is_direct(v)
+            ]
+        )
+
+    def _snapshot(self, obj: typing.Any) -> None:
+        todo: typing.List[typing.Any] = [obj]
+        while len(todo) > 0:
+            o = todo.pop()
+            if not isinstance(o, (Dictionary, List)):
+                continue
+            contents: tuple = ObjectSnapshots._get_contents(o)
+            self._contents[id(o)] = (o, contents)
+            if isinstance(o, Stream):
+                self._decoded_bytes[id(o)] = dict.get(o, "DecodedBytes", None)
+            for v in ObjectSnapshots._get_values(contents, o):
+                if self._is_direct(v) and v is not o:
+                    todo.append(v)
+
+    #
+    # PUBLIC
+    #
+
+    def add(self, obj: typing.Any, reference: Reference) -> "ObjectSnapshots":
+        """
+        This function adds an (indirect) object (that was read from the given Reference) to these ObjectSnapshots.
+        The object is snapshotted the next time flush is called.
+        This function returns self.
+        """
+        self._objects[id(obj)] = obj
+        self._references[id(obj)] = reference
+        self._pending.append(obj)
+        return self
+
+    def flush(self) -> "ObjectSnapshots":
+        """
+        This function snapshots all objects that were added since the last call to flush.
+        This function returns self.
+        """
+        for obj in self._pending:
+            self._snapshot(obj)
+        self._pending = []
+        return self
+
+    def get_end_of_file(self) -> int:
+        """
+        This function returns the number of bytes in the (most recent revision of the) PDF
+        """
+        return self._end_of_file
+
+    def get_objects(self) -> typing.List[typing.Any]:
+        """
+        This function returns all (indirect) objects that were read
+        """
+        return [x for x in self._objects.values()]
+
+    def get_reference(self, obj: typing.Any) -> typing.Optional[Reference]:
+        """
+        This function returns the Reference an object was read from,
+        or None if the object was not read (e.g. a new object)
+        """
+        return self._references.get(id(obj), None)
+
+    def get_start_of_xref(self) -> typing.Optional[int]:
+        """
+        This function returns the byte offset of the (most recent) cross-reference section of the PDF
+        """
+        return self._start_of_xref
+
+    def is_modified(self, obj: typing.Any) -> bool:
+        """
+        This function returns True if the given (indirect) object was modified after it was read, False otherwise
+        """
+        return id(obj) in self._objects and self._is_modified(obj)
+
+    def set_revision(
+        self, end_of_file: int, start_of_xref: typing.Optional[int]
+    ) -> "ObjectSnapshots":
+        """
+        This function sets the number of bytes in the (most recent revision of the) PDF,
+        and the byte offset of its cross-reference section.
+        This function returns self.
+        """
+        self._end_of_file = end_of_file
+        self._start_of_xref = start_of_xref
+        return self
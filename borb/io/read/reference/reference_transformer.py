@@ -10,8 +10,9 @@ import logging
 import typing
 from typing import Any, Optional, Union
 
+from borb.io.read.reference.lazy_object import defer_reference
 from borb.io.read.transformer import ReadTransformerState, Transformer
-from borb.io.read.types import AnyPDFType, Reference
+from borb.io.read.types import AnyPDFType, Dictionary, List, Reference
 from borb.pdf.canvas.event.event_listener import EventListener
 from borb.pdf.xref.xref import XREF
 
@@ -24,6 +25,9 @@ class ReferenceTransformer(Transformer):
     e.g. 97 0 R
     """
 
+    TRANSFORMABLE_TYPES = (Reference,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def __init__(self):
         super(ReferenceTransformer, self).__init__()
         self._cache: typing.Dict[Reference, AnyPDFType] = {}
@@ -52,8 +56,30 @@ class ReferenceTransformer(Transformer):
         assert isinstance(object_to_transform, Reference), "object_to_transform must be of type Reference"
         # fmt: on
 
-        # check for circular reference
         assert context is not None
+
+        # defer (lazy loading)
+        if context.lazy and isinstance(parent_object, (Dictionary, List)):
+            return defer_reference(
+                object_to_transform,
+                parent_object,
+                lambda r, p: self._transform_reference(r, p, context, event_listeners),
+            )
+
+        # transform
+        return self._transform_reference(
+            object_to_transform, parent_object, context, event_listeners
+        )
+
+    def _transform_reference(
+        self,
+        object_to_transform: Reference,
+        parent_object: Any,
+        context: ReadTransformerState,
+        event_listeners: typing.List[EventListener] = [],
+    ) -> Any:
+
+        # check for circular reference
         if object_to_transform in context.indirect_reference_chain:
             return None
 
@@ -65,6 +91,10 @@ class ReferenceTransformer(Transformer):
             if ref_from_cache.get_parent() is None:  # type: ignore[union-attr]
                 ref_from_cache.set_parent(parent_object)  # type: ignore[union-attr]
                 return ref_from_cache
+            # when loading lazily, References are resolved in any order
+            # objects keep their first parent (to avoid creating a cycle of parents)
+            if context.lazy:
+                return ref_from_cache
             # copy because of linkage
             if ref_from_cache.get_parent() != parent_object:  # type: ignore[union-attr]
                 ref_from_cache_copy = ref_from_cache  # TODO
@@ -121,5 +151,17 @@ class ReferenceTransformer(Transformer):
             )
             pass
 
+        # keep track of the objects that were read (incremental updates)
+        # objects are snapshotted once the outermost Reference has been resolved
+        if (
+            context.object_snapshots is not None
+            and transformed_referenced_object is not None
+        ):
+            context.object_snapshots.add(
+                transformed_referenced_object, object_to_transform
+            )
+            if len(context.indirect_reference_chain) == 0:
+                context.object_snapshots.flush()
+
         # return
         return transformed_referenced_object
@@ -11,6 +11,7 @@ from decimal import Decimal
 from typing import Any, Optional, Union
 
 from borb.io.read.encryption.standard_security_handler import StandardSecurityHandler
+from borb.io.read.tokenize.buffer_io import BufferIO
 from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
 from borb.io.read.transformer import ReadTransformerState, Transformer
 from borb.io.read.types import AnyPDFType, Dictionary, Name
@@ -43,6 +44,9 @@ class XREFTransformer(Transformer):
     This implementation of ReadBaseTransformer is responsible for reading the XRef object
     """
 
+    TRANSFORMABLE_TYPES = (io.IOBase,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
     ) -> bool:
@@ -152,6 +156,11 @@ class XREFTransformer(Transformer):
             if k in xref["Trailer"]:
                 xref["Trailer"].pop(k)
 
+        # keep track of the objects that were read (incremental updates)
+        if context.object_snapshots is not None:
+            context.object_snapshots.set_revision(file_length, xref.get_start_of_xref())
+            context.root_object._object_snapshots = context.object_snapshots
+
         # notify
         for l in event_listeners:
             l._event_occurred(EndDocumentEvent())  # type: ignore [attr-defined]
@@ -179,6 +188,13 @@ class XREFTransformer(Transformer):
         except ValueError:
             pass
 
+        # truncate (without copying the bytes, if the source is a buffer)
+        # the same BufferIO is kept, so that whoever owns it (e.g. a memory-mapped Document) can still close it
+        if index_of_pdf_comment > 0 and isinstance(context.source, BufferIO):
+            context.source.remove_prefix(index_of_pdf_comment)
+            context.tokenizer = HighLevelTokenizer(context.source)
+            return
+
         # truncate
         if index_of_pdf_comment > 0:
             # determine end of file
@@ -0,0 +1,113 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This module contains a seekable, read-only byte stream on top of an in-memory buffer (bytes, mmap, memoryview).
+It allows the tokenizer (and everything else that reads the PDF) to share one buffer without copying it.
+"""
+import io
+import mmap
+import typing
+
+
+class BufferIO(io.RawIOBase):
+    """
+    This class represents a seekable, read-only byte stream on top of a buffer (bytes, bytearray, memoryview, mmap).
+    Unlike io.BytesIO it never copies the underlying buffer, which makes it suitable to wrap (large) memory-mapped files.
+    The LowLevelTokenizer recognizes this class, and scans its buffer directly.
+    """
+
+    def __init__(
+        self, buffer: typing.Union[bytes, bytearray, memoryview, mmap.mmap]
+    ):
+        super(BufferIO, self).__init__()
+        self._source: typing.Union[bytes, bytearray, memoryview, mmap.mmap] = buffer
+        self._buffer: memoryview = memoryview(buffer).cast("B")
+        self._pos: int = 0
+
+    def close(self) -> None:
+        """
+        Release the view over the buffer (closing the buffer if it is a memory-mapped file).
+        Views (e.g. the /Bytes of a Stream) that were returned by read_view must be released first.
+        """
+        if not self.closed:
+            self._buffer.release()
+            if isinstance(self._source, mmap.mmap):
+                self._source.close()
+        super(BufferIO, self).close()
+
+    def getbuffer(self) -> memoryview:
+        """
+        Return a (read-only) view over the contents of the buffer without copying them
+        """
+        return self._buffer
+
+    def remove_prefix(self, n: int) -> "BufferIO":
+        """
+        Skip the first n bytes of the buffer (e.g. bytes before the %PDF header) without copying the remaining bytes.
+        From then on, positions (and the view returned by getbuffer) are relative to the remaining bytes.
+        This function returns self.
+        """
+        buffer: memoryview = self._buffer[n:]
+        self._buffer.release()
+        self._buffer = buffer
+        self._pos = 0
+        return self
+
+    def read(self, size: typing.Optional[int] = -1) -> bytes:
+        """
+        Read up to size bytes from the buffer and return them.
+        As a convenience, if size is unspecified or -1, all bytes until EOF are returned.
+        """
+        return bytes(self.read_view(size))
+
+    def read_view(self, size: typing.Optional[int] = -1) -> memoryview:
+        """
+        Read up to size bytes from the buffer and return them as a memoryview (without copying them).
+        As a convenience, if size is unspecified or -1, all bytes until EOF are returned.
+        """
+        pos: int = min(self._pos, len(self._buffer))
+        end: int = len(self._buffer)
+        if size is not None and size >= 0:
+            end = min(pos + size, end)
+        self._pos = end
+        return self._buffer[pos:end]
+
+    def readable(self) -> bool:
+        """
+        Return True if the stream can be read from.
+        """
+        return True
+
+    def readinto(self, b) -> int:
+        """
+        Read bytes into a pre-allocated, writable bytes-like object b, and return the number of bytes read.
+        """
+        view: memoryview = self.read_view(len(b))
+        b[0 : len(view)] = view
+        return len(view)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Change the stream position to the given byte offset. offset is interpreted relative to the position indicated by whence.
+        Return the new absolute position.
+        """
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        assert offset >= 0, "negative seek position %d" % offset
+        self._pos = offset
+        return offset
+
+    def seekable(self) -> bool:
+        """
+        Return True if the stream supports random access.
+        """
+        return True
+
+    def tell(self) -> int:
+        """
+        Return the current stream position.
+        """
+        return self._pos
@@ -303,7 +303,7 @@ class HighLevelTokenizer(LowLevelTokenizer):
             ch = self._next_byte()
             assert ch == b"\n"
 
-        bytes = self._io_source.read(int(length_of_stream))
+        bytes = self._read_bytes(int(length_of_stream))
 
         # attempt to read token "endstream"
         end_of_stream_token = self.next_non_comment_token()
@@ -8,7 +8,29 @@ The high-level tokenizer will use this first pass to then build complex objects
 """
 import enum
 import io
-from typing import Optional
+import mmap
+import re
+from typing import Optional, Union
+
+from borb.io.read.tokenize.buffer_io import BufferIO
+
+# fmt: off
+_WHITESPACE: bytes = b"\x00\t\n\r\x0c "
+_DELIMITERS: bytes = _WHITESPACE + b"%()/<>[]"
+_PSEUDO_DIGITS: bytes = b"0123456789+-."
+# fmt: on
+
+# character classes, indexed by byte value
+_IS_WHITESPACE: bytes = bytes([int(i in _WHITESPACE) for i in range(0, 256)])
+_IS_PSEUDO_DIGIT: bytes = bytes([int(i in _PSEUDO_DIGITS) for i in range(0, 256)])
+
+# patterns used to find the end of a run of characters belonging to the same class
+_WHITESPACE_RUN = re.compile(b"[" + re.escape(_WHITESPACE) + b"]*")
+_NON_DELIMITER_RUN = re.compile(b"[^" + re.escape(_DELIMITERS) + b"]*")
+_PSEUDO_DIGIT_RUN = re.compile(b"[" + re.escape(_PSEUDO_DIGITS) + b"]*")
+_END_OF_LINE = re.compile(b"[\r\n]")
+_END_OF_HEX_STRING = re.compile(b">")
+_STRING_SPECIAL_CHARACTER = re.compile(b"[()\\\\]")
 
 
 class TokenType(enum.IntEnum):
@@ -80,7 +102,18 @@ class LowLevelTokenizer:
     and so forth.
     """
 
-    def __init__(self, io_source):
+    def __init__(
+        self,
+        io_source: Union[io.IOBase, bytes, bytearray, memoryview, mmap.mmap],
+    ):
+        # When given a bytes-like buffer (or a BufferIO) rather than a stream,
+        # the tokenizer scans the buffer directly. This avoids a read(1) call (and a seek) for every byte.
+        # The position is kept by the BufferIO, so that anyone holding the io_source sees the same position.
+        if isinstance(io_source, (bytes, bytearray, memoryview, mmap.mmap)):
+            io_source = BufferIO(io_source)
+        self._buffer: Optional[memoryview] = None
+        if isinstance(io_source, BufferIO):
+            self._buffer = io_source.getbuffer()
         self._io_source = io_source
         # fmt: off
         self._is_pseudo_digit = set([b'0', b'1', b'2', b'3', b'4', b'5', b'6', b'7', b'8', b'9', b'+', b'-', b'.']).__contains__
@@ -103,6 +136,9 @@ class LowLevelTokenizer:
         This function retrieves the next Token.
         It returns None if no such Token exists (end of stream/file)
         """
+        if self._buffer is not None:
+            return self._next_token_from_buffer()
+
         ch = self._next_byte()
         if len(ch) == 0:
             return None
@@ -226,6 +262,102 @@ class LowLevelTokenizer:
             self._prev_byte()
         return Token(out_pos, TokenType.OTHER, bytes(out_str))
 
+    def _next_token_from_buffer(self) -> Optional[Token]:
+        buf = self._buffer
+        src = self._io_source
+        assert buf is not None
+        n: int = len(buf)
+        pos: int = src._pos
+        if pos >= n:
+            return None
+
+        # skip whitespace
+        if _IS_WHITESPACE[buf[pos]]:
+            pos = _WHITESPACE_RUN.match(buf, pos).end()  # type: ignore[union-attr]
+            if pos >= n:
+                src._pos = n
+                return Token(n - 1, TokenType.OTHER, b"")
+
+        c: int = buf[pos]
+
+        # START_ARRAY
+        if c == 0x5B:
+            src._pos = pos + 1
+            return Token(pos, TokenType.START_ARRAY, b"[")
+
+        # END ARRAY
+        if c == 0x5D:
+            src._pos = pos + 1
+            return Token(pos, TokenType.END_ARRAY, b"]")
+
+        # NAME
+        if c == 0x2F:
+            end: int = _NON_DELIMITER_RUN.match(buf, pos + 1).end()  # type: ignore[union-attr]
+            src._pos = end
+            return Token(pos, TokenType.NAME, bytes(buf[pos:end]))
+
+        # END_DICT
+        if c == 0x3E:
+            # CHECK UNEXPECTED CHARACTER AFTER FIRST >
+            assert (
+                pos + 1 < n and buf[pos + 1] == 0x3E
+            ), "Unexpected character at end of dictionary."
+            src._pos = pos + 2
+            return Token(pos, TokenType.END_DICT, b">>")
+
+        # COMMENT
+        if c == 0x25:
+            m = _END_OF_LINE.search(buf, pos)
+            end = m.start() if m is not None else n
+            src._pos = end
+            return Token(pos, TokenType.COMMENT, bytes(buf[pos:end]))
+
+        # HEX_STRING OR DICT
+        if c == 0x3C:
+            # DICT
+            if pos + 1 < n and buf[pos + 1] == 0x3C:
+                src._pos = pos + 2
+                return Token(pos, TokenType.START_DICT, b"<<")
+            # HEX_STRING (including the empty hex string)
+            m = _END_OF_HEX_STRING.search(buf, pos + 1)
+            end = n if m is None else m.end()
+            src._pos = end
+            return Token(pos, TokenType.HEX_STRING, bytes(buf[pos:end]))
+
+        # NUMBER
+        if _IS_PSEUDO_DIGIT[c]:
+            end = _PSEUDO_DIGIT_RUN.match(buf, pos).end()  # type: ignore[union-attr]
+            src._pos = end
+            return Token(pos, TokenType.NUMBER, bytes(buf[pos:end]))
+
+        # STRING
+        if c == 0x28:
+            bracket_nesting_level: int = 1
+            end = pos + 1
+            while True:
+                m = _STRING_SPECIAL_CHARACTER.search(buf, end)
+                assert m is not None, "Unexpected end of string."
+                end = m.end()
+                c = buf[m.start()]
+                # escape char
+                if c == 0x5C:
+                    assert end < n, "Unexpected end of string."
+                    end += 1
+                    continue
+                if c == 0x28:
+                    bracket_nesting_level += 1
+                else:
+                    bracket_nesting_level -= 1
+                    if bracket_nesting_level == 0:
+                        break
+            src._pos = end
+            return Token(pos, TokenType.STRING, bytes(buf[pos:end]))
+
+        # OTHER
+        end = _NON_DELIMITER_RUN.match(buf, pos).end()  # type: ignore[union-attr]
+        src._pos = end
+        return Token(pos, TokenType.OTHER, bytes(buf[pos:end]))
+
     def seek(self, pos: int, whence: int = io.SEEK_SET):
         """
         Change the stream position to the given byte offset. offset is interpreted relative to the position indicated by whence.
@@ -248,3 +380,9 @@ class LowLevelTokenizer:
 
     def _prev_byte(self):
         return self._io_source.seek(-1, io.SEEK_CUR)
+
+    def _read_bytes(self, n: int) -> Union[bytes, memoryview]:
+        # buffers are not copied, the bytes are returned as a memoryview instead
+        if self._buffer is not None:
+            return self._io_source.read_view(n)
+        return self._io_source.read(n)
@@ -9,8 +9,9 @@ import io
 import typing
 from typing import Any, Optional, Union
 
+from borb.io.read.reference.object_snapshots import ObjectSnapshots
 from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
-from borb.io.read.types import AnyPDFType, Reference
+from borb.io.read.types import AnyPDFType, Name, Reference
 from borb.pdf.canvas.event.event_listener import EventListener
 
 
@@ -21,6 +22,8 @@ class ReadTransformerState:
     - the root object (the Document itself)
     - the tokenizer
     - references that have been resolved (to avoid endless loops)
+    - whether Reference objects should be resolved lazily
+    - whether the objects that are read should be tracked (to allow incremental updates)
     - etc
     """
 
@@ -30,6 +33,8 @@ class ReadTransformerState:
         tokenizer: Optional[HighLevelTokenizer] = None,
         root_object: Optional[Any] = None,
         password: typing.Optional[str] = None,
+        lazy: bool = False,
+        incremental: bool = False,
     ):
         self.source = source
         self.tokenizer = tokenizer
@@ -37,6 +42,10 @@ class ReadTransformerState:
         self.indirect_reference_chain: typing.Set[Reference] = set()
         self.password: typing.Optional[str] = password
         self.security_handler: typing.Optional[typing.Any] = None
+        self.lazy: bool = lazy
+        self.object_snapshots: typing.Optional[ObjectSnapshots] = (
+            ObjectSnapshots() if incremental else None
+        )
 
 
 class Transformer:
@@ -45,8 +54,20 @@ class Transformer:
     Add children to handle specific cases (transforming dictionaries, arrays, xref, etc)
     """
 
+    # the (Python) types of the objects this Transformer may be able to transform,
+    # can_be_transformed is only called for objects of these types
+    TRANSFORMABLE_TYPES: typing.Tuple[type, ...] = (object,)
+
+    # whether can_be_transformed only depends on the (Python) type of the object,
+    # and (for dictionaries) on its /Type, /Subtype and /Filter entries
+    # if so, its result is cached (see _get_handler)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE: bool = False
+
     def __init__(self):
         self._children = []
+        self._children_by_key: typing.Dict[
+            typing.Hashable, typing.List[typing.Tuple["Transformer", bool]]
+        ] = {}
         self._parent = None
         self._level = 0
         self._invocation_count = 0
@@ -66,6 +87,7 @@ class Transformer:
         :type handler:  Transformer
         """
         self._children.append(child_transformer)
+        self._children_by_key = {}
         child_transformer._parent = self
         return self
 
@@ -89,17 +111,62 @@ class Transformer:
         """
         return False
 
+    @staticmethod
+    def _get_cache_key(object: typing.Any) -> typing.Optional[typing.Hashable]:
+        if not isinstance(object, dict):
+            return type(object)
+        # values are accessed through dict (rather than object)
+        # to avoid resolving References when the Document is loaded lazily
+        key: typing.List[typing.Any] = [type(object)]
+        for k in ["Type", "Subtype", "Filter"]:
+            v = dict.get(object, k, None)
+            if isinstance(v, list) and all([isinstance(x, Name) for x in v]):
+                v = tuple(v)
+            elif v is not None and not isinstance(v, Name):
+                return None
+            key.append(v)
+        return tuple(key)
+
+    def _get_handler(
+        self, object: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO, AnyPDFType]
+    ) -> typing.Optional["Transformer"]:
+        # look up the children that may be able to transform this object
+        # (True if the child is known to be able to transform it, False if can_be_transformed needs to be called)
+        key: typing.Optional[typing.Hashable] = Transformer._get_cache_key(object)
+        children: typing.Optional[typing.List[typing.Tuple["Transformer", bool]]] = (
+            self._children_by_key.get(key, None) if key is not None else None
+        )
+        if children is None:
+            children = []
+            t: type = type(object)
+            for h in self._children:
+                if not issubclass(t, h.TRANSFORMABLE_TYPES):
+                    continue
+                if not h.CAN_BE_TRANSFORMED_IS_CACHEABLE:
+                    children.append((h, False))
+                    continue
+                if h.can_be_transformed(object):
+                    children.append((h, True))
+                    break
+            if key is not None:
+                self._children_by_key[key] = children
+        for h, is_known_to_transform in children:
+            if is_known_to_transform or h.can_be_transformed(object):
+                return h
+        return None
+
     def _is_recursive_object(self, object_to_transform) -> bool:
-        try:
-            p = object_to_transform
-            parents = [p]
-            while p is not None:
+        # parents are compared by identity (rather than by value)
+        p = object_to_transform
+        parents: typing.Set[int] = {id(p)}
+        while p is not None:
+            try:
                 p = p.get_parent()
-                if p in parents:
-                    return True
-                parents.append(p)
-        except:
-            pass
+            except:
+                return False
+            if id(p) in parents:
+                return True
+            parents.add(id(p))
         return False
 
     def transform(
@@ -115,18 +182,18 @@ class Transformer:
         """
         if self._is_recursive_object(object_to_transform):
             return object_to_transform
-        for h in self._children:
-            if h.can_be_transformed(object_to_transform):
-                # print("%s<%s level='%d' invocation='%d'>" % ("   " * self.level, h.__class__.__name__, self.level, self.invocation_count), flush=True)
-                self._level += 1
-                self._invocation_count += 1
-                out = h.transform(
-                    object_to_transform,
-                    parent_object=parent_object,
-                    context=context,
-                    event_listeners=event_listeners,
-                )
-                self._level -= 1
-                # print("%s</%s>" % ("   " * self.level, h.__class__.__name__))
-                return out
-        return None
+        h: typing.Optional[Transformer] = self._get_handler(object_to_transform)
+        if h is None:
+            return None
+        # print("%s<%s level='%d' invocation='%d'>" % ("   " * self.level, h.__class__.__name__, self.level, self.invocation_count), flush=True)
+        self._level += 1
+        self._invocation_count += 1
+        out = h.transform(
+            object_to_transform,
+            parent_object=parent_object,
+            context=context,
+            event_listeners=event_listeners,
+        )
+        self._level -= 1
+        # print("%s</%s>" % ("   " * self.level, h.__class__.__name__))
+        return out
@@ -5,111 +5,72 @@
 This module defines all the base types used in processing PDFs
 e.g. Boolean, CanvasOperatorName, Decimal, Dictionary, Element, Name, Stream, String, ..
 """
+import bisect
 import copy
+import sys
 import types
 import typing
 import xml.etree.ElementTree as ET
+from array import array
+from collections import OrderedDict
 from decimal import Decimal as oDecimal
-from math import ceil, floor
 from typing import Optional, Union
 
 from PIL.Image import Image  # type: ignore [import]
 
-from borb.io.read.postfix.postfix_eval import PostScriptEval
+from borb.io.read.postfix.postfix_eval import PostScriptEval, PostScriptProgram
 
 
-def add_base_methods(object: typing.Any) -> typing.Any:
+def _to_json_serializable(to_convert=None):
     """
-    This function / decorator adds methods to a given object.
-    These added methods are useful for:
+    Convert this object to a representation that
+    can be serialized as JSON
+    """
+    if isinstance(to_convert, dict):
+        return {
+            _to_json_serializable(k): _to_json_serializable(v)
+            for k, v in to_convert.items()
+        }
+    if isinstance(to_convert, list):
+        return [_to_json_serializable(x) for x in to_convert]
+    if isinstance(to_convert, Decimal):
+        return float(to_convert)
+    if (
+        isinstance(to_convert, HexadecimalString)
+        or isinstance(to_convert, String)
+        or isinstance(to_convert, Name)
+        or isinstance(to_convert, CanvasOperatorName)
+    ):
+        return str(to_convert)
+    return None
+
+
+class PDFObject:
+    """
+    This class (mixin) provides the base methods of all PDF objects.
+    These methods are useful for:
     - handling linkage (parent/child relationships),
     - serialization (JSON)
-    - hashing
     - implementing the "listener" design pattern
     - etc
+    The state these methods use (_parent, _reference, _is_inline, _is_unique) is stored in __slots__
+    (declared by each concrete class) rather than in a per-instance __dict__.
     """
 
-    def _to_json_serializable(to_convert=None):
-        """
-        Convert this object to a representation that
-        can be serialized as JSON
-        """
-        if isinstance(to_convert, dict):
-            return {
-                to_json_serializable(k): to_json_serializable(v)
-                for k, v in to_convert.items()
-            }
-        if isinstance(to_convert, list):
-            return [to_json_serializable(x) for x in to_convert]
-        if isinstance(to_convert, Decimal):
-            return float(to_convert)
-        if (
-            isinstance(to_convert, HexadecimalString)
-            or isinstance(to_convert, String)
-            or isinstance(to_convert, Name)
-            or isinstance(to_convert, CanvasOperatorName)
-        ):
-            return str(to_convert)
-        return None
-
-    def to_json_serializable(self):
-        """
-        This function converts this Object to something that can be JSON serialized
-        """
-        return _to_json_serializable(self)
-
-    def image_hash_method(self):
-        """
-        This function hashes Image objects
-        """
-        w = self.width
-        h = self.height
-        pixels = [
-            self.getpixel((0, 0)),
-            self.getpixel((0, h - 1)),
-            self.getpixel((w - 1, 0)),
-            self.getpixel((w - 1, h - 1)),
-        ]
-        hashcode = 1
-        for p in pixels:
-            if isinstance(p, typing.List) or isinstance(p, typing.Tuple):
-                hashcode += 32 * hashcode + sum(p)
-            else:
-                hashcode += 32 * hashcode + p
-        return hashcode
-
-    def deepcopy_mod(self, memodict={}):
-        """
-        This function overrides the __deepcopy__ method
-        this was needed
-        """
-        prev_function_ptr = self.__deepcopy__
-        self.__deepcopy__ = None
-        # copy
-        out = copy.deepcopy(self, memodict)
-        # restore
-        self.__deepcopy__ = prev_function_ptr
-        # add base methods
-        add_base_methods(out)
-        # return
-        return out
+    __slots__ = ()
 
     # get parent
     def get_parent(self):
         """
         This function returns the parent Object of the current Object
         """
-        if "_parent" not in vars(self):
-            setattr(self, "_parent", None)
-        return self._parent
+        return getattr(self, "_parent", None)
 
     # set parent
     def set_parent(self, parent):
         """
         This function sets the parent Object of the current Object
         """
-        if "_parent" not in vars(self):
-            setattr(self, "_parent", None)
         self._parent = parent
         return self
 
@@ -119,8 +80,10 @@ def add_base_methods(object: typing.Any) -> typing.Any:
         This function returns the root parent Object of the current Object
         """
         e = self
-        while e.get_parent() is not None:
-            e = e.get_parent()
+        p = e.get_parent()
+        while p is not None:
+            e = p
+            p = e.get_parent()
         return e
 
     # set_reference
@@ -128,17 +91,14 @@ def add_base_methods(object: typing.Any) -> typing.Any:
         """
         This function sets the Reference for this Object, returning self
         """
-        if "_reference" not in vars(self):
-            setattr(self, "_reference", None)
+        r: typing.Optional[Reference] = getattr(self, "_reference", None)
         assert (
-            self._reference is None
+            r is None
             or reference is None
-            or self._reference.object_number == reference.object_number
+            or r.object_number == reference.object_number
             or (
-                self._reference.parent_stream_object_number
-                == reference.parent_stream_object_number
-                and self._reference.index_in_parent_stream
-                == reference.index_in_parent_stream
+                r.parent_stream_object_number == reference.parent_stream_object_number
+                and r.index_in_parent_stream == reference.index_in_parent_stream
             )
         )
         self._reference = reference
@@ -149,30 +109,24 @@ def add_base_methods(object: typing.Any) -> typing.Any:
         """
         This function returns the Reference for this Object or None if no Reference was set
         """
-        if "_reference" not in vars(self):
-            setattr(self, "_reference", None)
-        return self._reference
+        return getattr(self, "_reference", None)
 
-    # is_uniaue
+    # is_unique
     def set_is_unique(self, a_flag: bool):
         """
         This function sets whether or not this Object is unique.
         When an object is unique, it is not checked against the cache.
         """
-        if "_is_unique" not in vars(self):
-            setattr(self, "_is_unique", None)
         self._is_unique = a_flag
         return self
 
-    # is_uniaue
-    def get_is_unique(self) -> bool:
+    # is_unique
+    def is_unique(self) -> bool:
         """
         This function returns whether or not this Object is unique.
         When an object is unique, it is not checked against the cache.
         """
-        if "_is_unique" not in vars(self):
-            setattr(self, "_is_unique", False)
-        return self._is_unique
+        return getattr(self, "_is_unique", False)
 
     # is_inline
     def set_is_inline(self, a_flag: bool):
@@ -180,31 +134,87 @@ def add_base_methods(object: typing.Any) -> typing.Any:
         This function sets whether or not this Object is written inline.
         When an object is inline, it is always embedded immediately in the PDF byte stream.
         """
-        if "_is_inline" not in vars(self):
-            setattr(self, "_is_inline", None)
         self._is_inline = a_flag
         return self
 
     # is_inline
-    def get_is_inline(self) -> bool:
+    def is_inline(self) -> bool:
         """
         This function returns whether or not this Object can be referenced.
         When an object can not be referenced, it is always embedded immediately in the PDF byte stream.
         """
-        if "_is_inline" not in vars(self):
-            setattr(self, "_is_inline", False)
-        return self._is_inline
-
-    object.set_parent = types.MethodType(set_parent, object)
-    object.get_parent = types.MethodType(get_parent, object)
-    object.get_root = types.MethodType(get_root, object)
-    object.set_reference = types.MethodType(set_reference, object)
-    object.get_reference = types.MethodType(get_reference, object)
-    object.set_is_inline = types.MethodType(set_is_inline, object)
-    object.is_inline = types.MethodType(get_is_inline, object)
-    object.set_is_unique = types.MethodType(set_is_unique, object)
-    object.is_unique = types.MethodType(get_is_unique, object)
-    object.to_json_serializable = types.MethodType(to_json_serializable, object)
+        return getattr(self, "_is_inline", False)
+
+    def to_json_serializable(self):
+        """
+        This function converts this Object to something that can be JSON serialized
+        """
+        return _to_json_serializable(self)
+
+
+def add_base_methods(object: typing.Any) -> typing.Any:
+    """
+    This function / decorator adds methods to a given object.
+    PDF objects (see PDFObject) already have these methods, this function is needed for objects
+    of classes outside borb (e.g. PIL.Image.Image).
+    These added methods are useful for:
+    - handling linkage (parent/child relationships),
+    - serialization (JSON)
+    - hashing
+    - implementing the "listener" design pattern
+    - etc
+    """
+    if isinstance(object, PDFObject):
+        return object
+
+    def image_hash_method(self):
+        """
+        This function hashes Image objects
+        """
+        w = self.width
+        h = self.height
+        pixels = [
+            self.getpixel((0, 0)),
+            self.getpixel((0, h - 1)),
+            self.getpixel((w - 1, 0)),
+            self.getpixel((w - 1, h - 1)),
+        ]
+        hashcode = 1
+        for p in pixels:
+            if isinstance(p, typing.List) or isinstance(p, typing.Tuple):
+                hashcode += 32 * hashcode + sum(p)
+            else:
+                hashcode += 32 * hashcode + p
+        return hashcode
+
+    def deepcopy_mod(self, memodict={}):
+        """
+        This function overrides the __deepcopy__ method
+        this was needed
+        """
+        prev_function_ptr = self.__deepcopy__
+        self.__deepcopy__ = None
+        # copy
+        out = copy.deepcopy(self, memodict)
+        # restore
+        self.__deepcopy__ = prev_function_ptr
+        # add base methods
+        add_base_methods(out)
+        # return
+        return out
+
+    object.set_parent = types.MethodType(PDFObject.set_parent, object)
+    object.get_parent = types.MethodType(PDFObject.get_parent, object)
+    object.get_root = types.MethodType(PDFObject.get_root, object)
+    object.set_reference = types.MethodType(PDFObject.set_reference, object)
+    object.get_reference = types.MethodType(PDFObject.get_reference, object)
+    object.set_is_inline = types.MethodType(PDFObject.set_is_inline, object)
+    object.is_inline = types.MethodType(PDFObject.is_inline, object)
+    object.set_is_unique = types.MethodType(PDFObject.set_is_unique, object)
+    object.is_unique = types.MethodType(PDFObject.is_unique, object)
+    object.to_json_serializable = types.MethodType(
+        PDFObject.to_json_serializable, object
+    )
     if isinstance(object, Image):
         object.__deepcopy__ = types.MethodType(deepcopy_mod, object)
         object.__hash__ = types.MethodType(image_hash_method, object)
@@ -237,11 +247,13 @@ class Boolean:
             return "False"
 
 
-class CanvasOperatorName:
+class CanvasOperatorName(PDFObject):
     """
     This class represents a canvas operator name in PDF syntax
     """
 
+    __slots__ = ("_text", "_parent", "_reference", "_is_inline", "_is_unique")
+
     # fmt: off
     VALID_NAMES = [
         "b", "B", "b*", "B*", "BDC", "BI", "BMC", "BT", "BX",
@@ -272,7 +284,6 @@ class CanvasOperatorName:
     def __init__(self, text: str):
         super(CanvasOperatorName, self).__init__()
         self._text = text
-        add_base_methods(self)
 
     def __eq__(self, other):
         if isinstance(other, CanvasOperatorName):
@@ -288,7 +299,7 @@ class CanvasOperatorName:
         return self._text
 
 
-class Decimal(oDecimal):  # type: ignore [no-redef]
+class Decimal(PDFObject, oDecimal):  # type: ignore [no-redef]
     """
     PDF provides two types of numeric objects: integer and real. Integer objects represent mathematical integers.
     Real objects represent mathematical real numbers. The range and precision of numbers may be limited by the
@@ -296,12 +307,13 @@ class Decimal(oDecimal):  # type: ignore [no-redef]
     limits for typical implementations.
     """
 
+    __slots__ = ("_parent", "_reference", "_is_inline", "_is_unique")
+
     def __init__(self, obj: typing.Union[str, float, int, oDecimal]):
         super(Decimal, self).__init__()
-        add_base_methods(self)
 
 
-class Dictionary(dict):
+class Dictionary(PDFObject, dict):
     """
     A dictionary object is an associative table containing pairs of objects, known as the dictionary’s entries. The first
     element of each entry is the key and the second element is the value. The key shall be a name (unlike
@@ -315,9 +327,10 @@ class Dictionary(dict):
     arbitrary order may be imposed upon them when written in a file. That ordering shall be ignored.
     """
 
+    __slots__ = ("_parent", "_reference", "_is_inline", "_is_unique")
+
     def __init__(self):
         super(Dictionary, self).__init__()
-        add_base_methods(self)
 
     def __hash__(self):
         hashcode: int = 1
@@ -332,12 +345,16 @@ class Dictionary(dict):
     def __deepcopy__(self, memodict={}):
         out = type(self).__new__(type(self))
         Dictionary.__init__(out)
+        memodict[id(self)] = out
         for k, v in self.items():
+            # memoryview (e.g. /Bytes of a memory-mapped file) can not be deepcopied
+            if isinstance(v, memoryview):
+                v = bytes(v)
             out[copy.deepcopy(k, memodict)] = copy.deepcopy(v, memodict)
         return out
 
 
-class Element(ET.Element):
+class Element(PDFObject, ET.Element):
     """
     An XML element.
 
@@ -357,20 +374,79 @@ class Element(ET.Element):
 
     def __init__(self, tag, **extra):
         super(Element, self).__init__(tag, **extra)
-        add_base_methods(self)
 
 
-class Name:
+class Name(PDFObject):
     """
     Beginning with PDF 1.2 a name object is an atomic symbol uniquely defined by a sequence of any characters
     (8-bit values) except null (character code 0). Uniquely defined means that any two name objects made up of
     the same sequence of characters denote the same object. Atomic means that a name has no internal structure;
     although it is defined by a sequence of characters, those characters are not considered elements of the name.
+    Name objects are interned (any two Name objects with the same text are the same Python object).
+    Because they are shared, Name objects have no parent, and can not be referenced.
     """
 
+    __slots__ = ("_text",)
+
+    _instances: typing.Dict[str, "Name"] = {}
+
+    def __new__(cls, text: str):
+        if cls is not Name:
+            return super(Name, cls).__new__(cls)
+        n: typing.Optional[Name] = Name._instances.get(text, None)
+        if n is None:
+            n = super(Name, cls).__new__(cls)
+            n._text = text
+            Name._instances[text] = n
+        return n
+
     def __init__(self, text: str):
         self._text = text
-        add_base_methods(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memodict={}):
+        return self
+
+    def __reduce__(self):
+        return Name, (self._text,)
+
+    def get_parent(self):
+        """
+        This function returns the parent Object of the current Object (which is always None for a Name)
+        """
+        return None
+
+    def set_parent(self, parent):
+        """
+        This function sets the parent Object of the current Object (which is ignored for a Name)
+        """
+        return self
+
+    def set_reference(self, reference: "Reference"):
+        """
+        This function sets the Reference for this Object (which is ignored for a Name), returning self
+        """
+        return self
+
+    def set_is_inline(self, a_flag: bool):
+        """
+        This function sets whether or not this Object is written inline (a Name is always written inline)
+        """
+        return self
+
+    def is_inline(self) -> bool:
+        """
+        This function returns whether or not this Object can be referenced (a Name can not be referenced)
+        """
+        return True
+
+    def set_is_unique(self, a_flag: bool):
+        """
+        This function sets whether or not this Object is unique (which is ignored for a Name)
+        """
+        return self
 
     def __eq__(self, other):
         if isinstance(other, Name):
@@ -391,10 +467,98 @@ class Stream(Dictionary):
     A stream object, like a string object, is a sequence of bytes. Furthermore, a stream may be of unlimited length,
     whereas a string shall be subject to an implementation limit. For this reason, objects with potentially large
     amounts of data, such as images and page descriptions, shall be represented as streams.
+
+    A Stream that was read from a PDF keeps its (encoded) /Bytes next to its /DecodedBytes.
+    As long as the entries that determine its encoding (/Bytes, /DecodedBytes, /DecodeParms, /Filter) are not modified,
+    the Stream can be written using its original /Bytes, rather than having to encode its /DecodedBytes again.
     """
 
+    ENCODING_KEYS: typing.FrozenSet[str] = frozenset(
+        ["Bytes", "DecodedBytes", "DecodeParms", "Filter"]
+    )
+
     def __init__(self):
         super(Stream, self).__init__()
+        self._is_modified: bool = True
+
+    def __deepcopy__(self, memodict={}):
+        out = super(Stream, self).__deepcopy__(memodict)
+        out._is_modified = self._is_modified
+        return out
+
+    def __delitem__(self, key):
+        if key in Stream.ENCODING_KEYS and dict.__contains__(self, key):
+            self._is_modified = True
+        super(Stream, self).__delitem__(key)
+
+    def __setitem__(self, key, value):
+        if key in Stream.ENCODING_KEYS and dict.get(self, key) is not value:
+            self._is_modified = True
+        super(Stream, self).__setitem__(key, value)
+
+    def clear(self) -> None:
+        """
+        Remove all items from the dictionary.
+        """
+        if any([dict.__contains__(self, k) for k in Stream.ENCODING_KEYS]):
+            self._is_modified = True
+        super(Stream, self).clear()
+
+    def is_modified(self) -> bool:
+        """
+        This function returns True if the (encoded) /Bytes of this Stream may no longer match its /DecodedBytes,
+        (e.g. because the Stream was built, rather than read, or because its /DecodedBytes were modified)
+        False otherwise
+        """
+        # a (mutable) bytearray may have been modified in place
+        return self._is_modified or isinstance(
+            dict.get(self, "DecodedBytes"), bytearray
+        )
+
+    def pop(self, key, *args):
+        """
+        Remove the specified key and return the corresponding value.
+        """
+        if key in Stream.ENCODING_KEYS and dict.__contains__(self, key):
+            self._is_modified = True
+        return super(Stream, self).pop(key, *args)
+
+    def popitem(self):
+        """
+        Remove and return a (key, value) pair as a 2-tuple.
+        """
+        key, value = super(Stream, self).popitem()
+        if key in Stream.ENCODING_KEYS:
+            self._is_modified = True
+        return key, value
+
+    def set_is_modified(self, a_flag: bool) -> "Stream":
+        """
+        This function sets whether the (encoded) /Bytes of this Stream may no longer match its /DecodedBytes,
+        returning self
+        """
+        self._is_modified = a_flag
+        return self
+
+    def setdefault(self, key, default=None):
+        """
+        Insert key with a value of default if key is not in the dictionary.
+        Return the value for key if key is in the dictionary, else default.
+        """
+        if key in Stream.ENCODING_KEYS and not dict.__contains__(self, key):
+            self._is_modified = True
+        return super(Stream, self).setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Update the dictionary with the key/value pairs from other, overwriting existing keys.
+        """
+        items: dict = dict(*args, **kwargs)
+        # fmt: off
+        if any([dict.get(self, k) is not v for k, v in items.items() if k in Stream.ENCODING_KEYS]):
+            self._is_modified = True
+        # fmt: on
+        super(Stream, self).update(items)
 
 
 class Function(Dictionary):
@@ -404,10 +568,81 @@ class Function(Dictionary):
     stream object. A function dictionary specifies the function’s representation, the set of attributes that
     parameterize that representation, and the additional data needed by that representation. Four types of
     functions are available, as indicated by the dictionary’s FunctionType entry.
+
+    A Function keeps its compiled PostScriptProgram, its unpacked sample table and its most recently used
+    inputs (and their outputs). These are discarded whenever an entry of the Function is set or removed.
+    Modifying a value in place (e.g. an element of /Domain, or one of the /Functions of a stitching Function)
+    is not detected.
     """
 
+    EVALUATE_CACHE_SIZE: int = 256
+
     def __init__(self):
         super(Function, self).__init__()
+        self._clear_caches()
+
+    def __delitem__(self, key):
+        self._clear_caches()
+        super(Function, self).__delitem__(key)
+
+    def __setitem__(self, key, value):
+        self._clear_caches()
+        super(Function, self).__setitem__(key, value)
+
+    def _clear_caches(self) -> None:
+        # least recently used first
+        self._evaluate_cache: typing.OrderedDict[
+            typing.Tuple[oDecimal, ...], typing.List[oDecimal]
+        ] = OrderedDict()
+        self._postscript_program: typing.Optional[PostScriptProgram] = None
+        self._sample_table: typing.Optional[array] = None
+
+    def clear(self) -> None:
+        """
+        Remove all items from the dictionary.
+        """
+        self._clear_caches()
+        super(Function, self).clear()
+
+    def pop(self, key, *args):
+        """
+        Remove the specified key and return the corresponding value.
+        """
+        self._clear_caches()
+        return super(Function, self).pop(key, *args)
+
+    def popitem(self):
+        """
+        Remove and return a (key, value) pair as a 2-tuple.
+        """
+        self._clear_caches()
+        return super(Function, self).popitem()
+
+    def setdefault(self, key, default=None):
+        """
+        Insert key with a value of default if key is not in the dictionary.
+        Return the value for key if key is in the dictionary, else default.
+        """
+        if not dict.__contains__(self, key):
+            self._clear_caches()
+        return super(Function, self).setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Update the dictionary with the key/value pairs from other, overwriting existing keys.
+        """
+        self._clear_caches()
+        super(Function, self).update(*args, **kwargs)
+
+    def _get_postscript_program(self) -> PostScriptProgram:
+        # type 4 functions are compiled (at most) once
+        if self._postscript_program is None:
+            self._postscript_program = PostScriptEval.compile(
+                self["DecodedBytes"].decode("latin1"),
+                [float(x) for x in self["Domain"]] if "Domain" in self else None,
+                [float(x) for x in self["Range"]] if "Range" in self else None,
+            )
+        return self._postscript_program
 
     @staticmethod
     def _interpolate(
@@ -415,104 +650,174 @@ class Function(Dictionary):
     ) -> oDecimal:
         return y_min + (x - x_min) * ((y_max - y_min) / (x_max - x_min))
 
-    def _get_sample_number(self, sample: typing.List[oDecimal]) -> typing.Optional[int]:
+    def _get_sample_table(self) -> array:
+        """
+        This function returns the (decoded) sample table of a type 0 Function.
+        The sample table is unpacked (at most) once, into an array of n values per sample.
+        """
+        if self._sample_table is not None:
+            return self._sample_table
         size: typing.List[int] = [int(x) for x in self["Size"]]
-        N: int = 1
-        for s in size:
-            N *= s
-        F: typing.List[int] = [int(N / size[0])]
-        for i in range(1, len(size)):
-            F[i] = int(F[i - 1] / size[i])
-        return sum([F[i] * int(sample[i]) for i in range(0, len(sample))])
-
-    def _get_sample(self, sample_number: int) -> typing.List[oDecimal]:
-        n: int = int(len(self["Range"]) / 2)
+        n: int = len(self["Range"]) // 2
         bps: int = int(self["BitsPerSample"])
-        byte_start_index: int = floor((sample_number * bps * n) / 8)
-        byte_stop_index: int = min(
-            byte_start_index + ceil((n * bps) / 8), len(self["DecodedBytes"])
-        )
-        bit_offset: int = (sample_number * bps * n) - byte_start_index * 8
-        bytes_to_use: bytes = self["DecodedBytes"][byte_start_index:byte_stop_index]
-        byte_str: str = "".join([bin(x)[2:].zfill(8) for x in bytes_to_use])[
-            bit_offset : (bit_offset + n * bps)
+        number_of_values: int = n
+        for s in size:
+            number_of_values *= s
+
+        # unpack the samples
+        bts: bytes = bytes(self["DecodedBytes"])
+        samples: typing.Union[bytes, array, typing.List[int]] = []
+        if bps == 8:
+            samples = bts[:number_of_values]
+        elif bps == 16:
+            samples = array("H", bts[: 2 * min(number_of_values, len(bts) // 2)])
+            if sys.byteorder == "little":
+                samples.byteswap()
+        else:
+            samples = []
+            mask: int = (1 << bps) - 1
+            acc: int = 0
+            acc_bits: int = 0
+            for b in bts:
+                acc = (acc << 8) | b
+                acc_bits += 8
+                while acc_bits >= bps:
+                    acc_bits -= bps
+                    samples.append((acc >> acc_bits) & mask)
+                acc &= (1 << acc_bits) - 1
+                if len(samples) >= number_of_values:
+                    break
+
+        # decode the samples (missing samples are treated as 0)
+        decode: typing.List[float] = [
+            float(x) for x in (self["Decode"] if "Decode" in self else self["Range"])
         ]
-        ys: typing.List[oDecimal] = [
-            Decimal(int(byte_str[i : i + bps], 2)) for i in range(0, len(byte_str), bps)
+        offsets: typing.List[float] = [decode[2 * j] for j in range(0, n)]
+        scales: typing.List[float] = [
+            (decode[2 * j + 1] - decode[2 * j]) / ((1 << bps) - 1) for j in range(0, n)
         ]
-        return ys
+        table: array = array("d", offsets * (number_of_values // n))
+        for k, r in enumerate(samples[:number_of_values]):
+            table[k] = offsets[k % n] + r * scales[k % n]
+        self._sample_table = table
+        return table
+
+    def _evaluate_sampled_function(
+        self, xs: typing.List[oDecimal]
+    ) -> typing.List[oDecimal]:
+        size: typing.List[int] = [int(x) for x in self["Size"]]
+        m: int = len(size)
+        n: int = len(self["Range"]) // 2
+        domain: typing.List[float] = [float(x) for x in self["Domain"]]
+        range2: typing.List[float] = [float(x) for x in self["Range"]]
+        encode: typing.List[float] = []
+        if "Encode" in self:
+            encode = [float(x) for x in self["Encode"]]
+        else:
+            encode = [
+                0.0 if (i % 2 == 0) else size[i // 2] - 1 for i in range(0, 2 * m)
+            ]
+        table: array = self._get_sample_table()
 
-    def evaluate(self, xs: typing.List[oDecimal]) -> typing.List[oDecimal]:
-        """
-        This function evaluates this Function in the given arguments, returning a typing.List[Decimal] as output
-        """
-        # Type 0 functions use a sequence of sample values (contained in a stream) to provide an approximation for
-        # functions whose domains and ranges are bounded. The samples are organized as an m-dimensional table in
-        # which each entry has n components.
-        if "FunctionType" in self and int(self["FunctionType"]) == 0:
-            size: typing.List[oDecimal] = self["Size"]
-            bps: int = int(self["BitsPerSample"])
-            m: int = len(size)
-            domain: typing.List[oDecimal] = self["Domain"]
-            encode: typing.List[oDecimal] = []
-            decode: typing.List[oDecimal] = []
-            range2: typing.List[oDecimal] = self["Range"]
-            if "Encode" in self:
-                encode = self["Encode"]
-            else:
-                encode = [
-                    oDecimal(0) if (i % 2 == 0) else size[int((i - 1) / 2)]
-                    for i in range(0, 2 * m)
-                ]
-            if "Decode" in self:
-                decode = self["Decode"]
-            else:
-                decode = range2
+        # The first dimension varies fastest in the sample table
+        strides: typing.List[int] = [n]
+        for i in range(1, m):
+            strides.append(strides[-1] * size[i - 1])
 
+        base: int = 0
+        ts: typing.List[float] = []
+        for i in range(0, m):
             # When a sampled function is called, each input value xi , for 0 £ i < m, shall be clipped to the domain:
-            xs_prime = [
-                min(max(xs[i], domain[2 * i]), domain[2 * i + 1]) for i in range(0, m)
-            ]
+            x: float = min(max(float(xs[i]), domain[2 * i]), domain[2 * i + 1])
 
             # That value shall be encoded:
-            es = [
-                Function._interpolate(
-                    xs_prime[i],
-                    domain[2 * i],
-                    domain[2 * i + 1],
-                    encode[2 * i],
-                    encode[2 * i + 1],
+            e: float = encode[2 * i]
+            if domain[2 * i + 1] != domain[2 * i]:
+                e += (
+                    (x - domain[2 * i])
+                    * (encode[2 * i + 1] - encode[2 * i])
+                    / (domain[2 * i + 1] - domain[2 * i])
                 )
-                for i in range(0, m)
-            ]
 
             # That value shall be clipped to the size of the sample table in that dimension:
-            es_prime = [
-                min(max(es[i], oDecimal(0)), size[i] - 1) for i in range(0, len(es))
-            ]
+            e = min(max(e, 0.0), size[i] - 1.0)
+            j: int = min(int(e), max(size[i] - 2, 0))
+            base += j * strides[i]
+            ts.append(e - j)
+
+        # The encoded input values shall be real numbers, not restricted to integers. Interpolation shall be used to
+        # determine output values from the nearest surrounding values in the sample table.
+        # (multilinear interpolation between the 2^m surrounding samples, /Order 3 is treated as /Order 1)
+        ys: typing.List[float] = [0.0] * n
+        for corner in range(0, 1 << m):
+            w: float = 1.0
+            offset: int = base
+            for i in range(0, m):
+                if (corner >> i) & 1:
+                    w *= ts[i]
+                    offset += strides[i]
+                else:
+                    w *= 1.0 - ts[i]
+            if w == 0:
+                continue
+            for j in range(0, n):
+                ys[j] += w * table[offset + j]
 
-            # The encoded input values shall be real numbers, not restricted to integers. Interpolation shall be used to
-            # determine output values from the nearest surrounding values in the sample table.
-            sample_number: typing.Optional[int] = self._get_sample_number(es_prime)
-            assert sample_number is not None
-            rs = self._get_sample(sample_number)
+        # Finally, each decoded value shall be clipped to the range:
+        return [
+            oDecimal(min(max(ys[j], range2[2 * j]), range2[2 * j + 1]))
+            for j in range(0, n)
+        ]
 
-            # Each output value rj, for 0 £ j < n, shall then be decoded:
-            rs_prime: typing.List[oDecimal] = [
-                Function._interpolate(
-                    rs[j], oDecimal(0), 2**bps - 1, decode[2 * j], decode[2 * j + 1]
-                )
-                for j in range(0, len(rs))
-            ]
+    def _evaluate_stitching_function(
+        self, xs: typing.List[oDecimal]
+    ) -> typing.List[oDecimal]:
+        domain: typing.List[oDecimal] = self["Domain"]
+        bounds: typing.List[oDecimal] = self["Bounds"]
+        encode: typing.List[oDecimal] = self["Encode"]
+        functions: typing.List["Function"] = self["Functions"]
+        k: int = len(functions)
+        x: oDecimal = min(max(xs[0], domain[0]), domain[1])
+
+        # Bounds shall be in order of increasing value, and each value shall be within the domain defined by Domain.
+        # The subdomain of function i is [Bounds(i-1), Bounds(i)), the last subdomain also includes Domain1.
+        i: int = bisect.bisect_right(bounds, x)
+        if i > 0 and x == domain[0]:
+            i = 0
+        x_min: oDecimal = domain[0] if i == 0 else bounds[i - 1]
+        x_max: oDecimal = domain[1] if i == k - 1 else bounds[i]
+
+        # The value of x shall be mapped from its subdomain to the domain of function i, using Encode
+        x_prime: oDecimal = encode[2 * i]
+        if x_max != x_min:
+            x_prime = Function._interpolate(
+                x, x_min, x_max, encode[2 * i], encode[2 * i + 1]
+            )
+        assert isinstance(functions[i], Function)
+        return functions[i].evaluate([x_prime])
 
-            # Finally, each decoded value shall be clipped to the range:
-            ys = [
-                min(max(rs_prime[j], range2[2 * j]), range2[2 * j + 1])
-                for j in range(0, len(rs_prime))
-            ]
+    def evaluate(self, xs: typing.List[oDecimal]) -> typing.List[oDecimal]:
+        """
+        This function evaluates this Function in the given arguments, returning a typing.List[Decimal] as output
+        The most recently used inputs (and their outputs) are remembered.
+        """
+        key: typing.Tuple[oDecimal, ...] = tuple(xs)
+        ys: typing.Optional[typing.List[oDecimal]] = self._evaluate_cache.get(key)
+        if ys is None:
+            ys = self._evaluate(xs)
+            if len(self._evaluate_cache) >= Function.EVALUATE_CACHE_SIZE:
+                self._evaluate_cache.popitem(last=False)
+            self._evaluate_cache[key] = ys
+        else:
+            self._evaluate_cache.move_to_end(key)
+        return [y for y in ys]
 
-            # return
-            return ys
+    def _evaluate(self, xs: typing.List[oDecimal]) -> typing.List[oDecimal]:
+        # Type 0 functions use a sequence of sample values (contained in a stream) to provide an approximation for
+        # functions whose domains and ranges are bounded. The samples are organized as an m-dimensional table in
+        # which each entry has n components.
+        if "FunctionType" in self and int(self["FunctionType"]) == 0:
+            return self._evaluate_sampled_function(xs)
 
         # Type 2 functions (PDF 1.3) include a set of parameters that define an exponential interpolation of one input
         # value and n output values:
@@ -528,24 +833,44 @@ class Function(Dictionary):
             c1: typing.List[oDecimal] = self["C1"]
             return [(c0[j] + xs[0] ** N * (c1[j] - c0[j])) for j in range(0, n)]
 
+        # Type 3 functions (PDF 1.3) define a stitching of the subdomains of several 1-input functions to produce a
+        # single new 1-input function.
         if "FunctionType" in self and int(self["FunctionType"]) == 3:
-            # TODO : implement stitching function
-            pass
+            return self._evaluate_stitching_function(xs)
 
         if "FunctionType" in self and int(self["FunctionType"]) == 4:
-            return PostScriptEval.evaluate(self["DecodedBytes"].decode("latin1"), xs)
+            return [
+                Decimal(repr(y)) for y in self._get_postscript_program().evaluate(xs)
+            ]
 
         # this should be impossible
         assert False
 
+    def evaluate_many(
+        self, xss: typing.List[typing.List[oDecimal]]
+    ) -> typing.List[typing.List[oDecimal]]:
+        """
+        This function evaluates this Function in each of the given arguments, returning a typing.List[typing.List[Decimal]]
+        Type 4 functions evaluate all arguments in a single call to their (compiled) PostScriptProgram.
+        """
+        if "FunctionType" in self and int(self["FunctionType"]) == 4:
+            return [
+                [Decimal(repr(y)) for y in ys]
+                for ys in self._get_postscript_program().evaluate_many(xss)
+            ]
+        return [self.evaluate(xs) for xs in xss]
+
     def __deepcopy__(self, memodict={}):
         out: Function = Function()
         for k, v in self.items():
+            # memoryview (e.g. /Bytes of a memory-mapped file) can not be deepcopied
+            if isinstance(v, memoryview):
+                v = bytes(v)
             out[k] = copy.deepcopy(v, memodict)
         return out
 
 
-class String:
+class String(PDFObject):
     """
     A literal string shall be written as an arbitrary number of characters enclosed in parentheses. Any characters
     may appear in a string except unbalanced parentheses (LEFT PARENHESIS (28h) and RIGHT
@@ -553,12 +878,13 @@ class String:
     described in this sub-clause. Balanced pairs of parentheses within a string require no special treatment.
     """
 
+    __slots__ = ("_text", "_parent", "_reference", "_is_inline", "_is_unique")
+
     def __init__(self, bts: typing.Union[bytes, str]):  # type: ignore [name-defined]
         if isinstance(bts, str):
             self._text: str = bts
         if isinstance(bts, bytes):
             self._text = [(b & 0xFF) for b in bts]
-        add_base_methods(self)
 
     def __eq__(self, other):
         if isinstance(other, String):
@@ -695,7 +1021,7 @@ class HexadecimalString(String):
         return arr
 
 
-class List(list):
+class List(PDFObject, list):
     """
     An array object is a one-dimensional collection of objects arranged sequentially. Unlike arrays in many other
     computer languages, PDF arrays may be heterogeneous; that is, an array’s elements may be any combination
@@ -703,9 +1029,10 @@ class List(list):
     elements.
     """
 
+    __slots__ = ("_parent", "_reference", "_is_inline", "_is_unique")
+
     def __init__(self):
         super(List, self).__init__()
-        add_base_methods(self)
 
     def __hash__(self):
         hashcode: int = 1
@@ -714,7 +1041,7 @@ class List(list):
         return hashcode
 
 
-class Reference:
+class Reference(PDFObject):
     """
     Any object in a PDF file may be labelled as an indirect object. This gives the object a unique object identifier by
     which other objects can refer to it (for example, as an element of an array or as the value of a dictionary entry).
@@ -757,7 +1084,6 @@ class Reference:
         self.byte_offset = byte_offset
         self.is_in_use = is_in_use
         self.document = document
-        add_base_methods(self)
 
     def __hash__(self):
         hashcode: int = 1
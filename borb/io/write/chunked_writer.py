@@ -0,0 +1,88 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This module contains a write-only byte stream that collects (small) writes in an in-memory buffer,
+and passes them on to the underlying destination in large chunks.
+"""
+import io
+import typing
+
+
+class ChunkedWriter(io.RawIOBase):
+    """
+    This class represents a write-only byte stream on top of another (writable, seekable) byte stream.
+    Writing a PDF involves many small writes (a single token, or even a single space).
+    This class collects them in a buffer, which is written to the destination once it holds (at least) chunk_size bytes,
+    whenever this ChunkedWriter is flushed, or before it seeks.
+    Closing a ChunkedWriter flushes it, but does not close the underlying destination.
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 1 << 20
+
+    def __init__(
+        self,
+        destination: typing.Union[io.BufferedIOBase, io.RawIOBase],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        super(ChunkedWriter, self).__init__()
+        self._destination: typing.Union[io.BufferedIOBase, io.RawIOBase] = destination
+        self._chunk_size: int = chunk_size
+        self._buffer: bytearray = bytearray()
+        self._offset: int = destination.tell()
+
+    def close(self) -> None:
+        """
+        Flush this ChunkedWriter, and mark it as closed (the underlying destination is not closed)
+        """
+        if not self.closed:
+            self.flush()
+        super(ChunkedWriter, self).close()
+
+    def flush(self) -> None:
+        """
+        Write the buffered bytes to the underlying destination
+        """
+        if len(self._buffer) == 0:
+            return
+        self._destination.write(self._buffer)
+        self._offset += len(self._buffer)
+        self._buffer = bytearray()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Change the stream position to the given byte offset. offset is interpreted relative to the position indicated by whence.
+        The buffered bytes are written before seeking.
+        Return the new absolute position.
+        """
+        self.flush()
+        self._offset = self._destination.seek(offset, whence)
+        return self._offset
+
+    def seekable(self) -> bool:
+        """
+        Return True if the stream supports random access.
+        """
+        return True
+
+    def tell(self) -> int:
+        """
+        Return the current stream position.
+        """
+        return self._offset + len(self._buffer)
+
+    def writable(self) -> bool:
+        """
+        Return True if the stream supports writing.
+        """
+        return True
+
+    def write(self, b) -> int:
+        """
+        Write the given bytes-like object b to the buffer, and return the number of bytes written.
+        The buffer is written to the underlying destination once it holds (at least) chunk_size bytes.
+        """
+        self._buffer += b
+        if len(self._buffer) >= self._chunk_size:
+            self.flush()
+        return len(b)
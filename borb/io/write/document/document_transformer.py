@@ -4,14 +4,24 @@
 """
 This implementation of WriteBaseTransformer is responsible for writing Document objects
 """
+import io
 import logging
 import random
 import typing
 from typing import Any, Optional
 
-from borb.io.read.types import AnyPDFType, Dictionary, HexadecimalString, List, Name
+from borb.io.read.reference.object_snapshots import ObjectSnapshots
+from borb.io.read.types import (
+    AnyPDFType,
+    Dictionary,
+    HexadecimalString,
+    List,
+    Name,
+    Reference,
+)
 from borb.io.write.transformer import Transformer, WriteTransformerState
 from borb.pdf.document.document import Document
+from borb.pdf.xref.xref import XREF
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +31,9 @@ class DocumentTransformer(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing Document objects
     """
 
+    TRANSFORMABLE_TYPES = (Document,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be transformed is a Document
@@ -45,12 +58,17 @@ class DocumentTransformer(Transformer):
         """
         This method writes a Document object to a byte stream
         """
-        # write header
         # fmt: off
         assert context is not None, "A WriteTransformerState must be defined in order to write Document objects."
         assert context.destination is not None, "A WriteTransformerState must be defined in order to write Document objects."
         # fmt: on
 
+        # incremental update
+        if context.incremental:
+            self._transform_incremental_update(object_to_transform, context)
+            return
+
+        # write header
         context.destination.write(b"%PDF-1.7\n")
         context.destination.write(b"%")
         context.destination.write(bytes([226, 227, 207, 211]))
@@ -60,6 +78,16 @@ class DocumentTransformer(Transformer):
         DocumentTransformer._invalidate_all_references(object_to_transform)
 
         # set /ID
+        DocumentTransformer._set_id(object_to_transform)
+
+        # /Info
+        self._build_empty_document_info_dictionary(object_to_transform)
+
+        # transform XREF
+        self.get_root_transformer().transform(object_to_transform["XRef"], context)
+
+    @staticmethod
+    def _set_id(object_to_transform: Dictionary) -> None:
         random_id = HexadecimalString("%032x" % random.randrange(16**32))
         if "ID" not in object_to_transform["XRef"]["Trailer"]:
             # fmt: off
@@ -71,21 +99,90 @@ class DocumentTransformer(Transformer):
             object_to_transform["XRef"]["Trailer"]["ID"][1] = random_id
         object_to_transform["XRef"]["Trailer"]["ID"].set_is_inline(True)  # type: ignore [attr-defined]
 
-        # /Info
-        self._build_empty_document_info_dictionary(object_to_transform)
+    def _transform_incremental_update(
+        self, document: Document, context: WriteTransformerState
+    ) -> None:
+        # fmt: off
+        object_snapshots: typing.Optional[ObjectSnapshots] = document._object_snapshots
+        assert object_snapshots is not None, "A Document must be read with incremental=True in order to write an incremental update."
+        assert object_snapshots.get_start_of_xref() is not None, "An incremental update can only be written for a Document with a valid cross-reference section."
+        assert context.destination is not None, "A WriteTransformerState must be defined in order to write Document objects."
+        # fmt: on
+
+        # the incremental update is appended to the original bytes
+        context.destination.seek(0, io.SEEK_END)
+        # fmt: off
+        assert context.destination.tell() == object_snapshots.get_end_of_file(), "An incremental update must be appended to the original bytes of the Document."
+        # fmt: on
+        context.destination.write(b"\n")
+
+        # new objects do not re-use object numbers
+        xref: XREF = document["XRef"]
+        # fmt: off
+        for r in xref._entries + [object_snapshots.get_reference(x) for x in object_snapshots.get_objects()]:
+            if r is not None and r.object_number is not None:
+                context.object_numbers_in_use.add(int(r.object_number))
+        # fmt: on
+        if "Size" in xref["Trailer"]:
+            context.next_object_number = int(xref["Trailer"]["Size"])
+
+        # set /ID
+        DocumentTransformer._set_id(document)
+
+        # a new /Root or /Info is written (and may modify objects that were read)
+        for k in ["Root", "Info"]:
+            if k in xref["Trailer"]:
+                self.get_reference(xref["Trailer"][k], context)
+                self.get_root_transformer().transform(xref["Trailer"][k], context)
+
+        # write modified objects (until writing them no longer modifies other objects)
+        written_objects: typing.Set[int] = set()
+        while True:
+            # fmt: off
+            modified_objects: typing.List[AnyPDFType] = [x for x in object_snapshots.get_objects() if id(x) not in written_objects and object_snapshots.is_modified(x)]
+            # fmt: on
+            if len(modified_objects) == 0:
+                break
+
+            # modified objects keep their object number
+            for x in modified_objects:
+                written_objects.add(id(x))
+                ref: typing.Optional[Reference] = object_snapshots.get_reference(x)
+                assert ref is not None
+                context.resolved_object_numbers.discard(ref.object_number)
+                x.set_reference(  # type: ignore [union-attr]
+                    Reference(
+                        object_number=ref.object_number,
+                        generation_number=ref.generation_number,
+                    )
+                )
+                context.indirect_objects_by_id[id(x)] = x
+                context.indirect_objects_by_hash.setdefault(self._hash(x), []).append(x)
+
+            # write
+            for x in modified_objects:
+                self.get_root_transformer().transform(x, context)
 
         # transform XREF
-        self.get_root_transformer().transform(object_to_transform["XRef"], context)
+        self.get_root_transformer().transform(xref, context)
+
+        # the objects that were written are now part of the (most recent revision of the) Document
+        for v in context.indirect_objects_by_hash.values():
+            for x in v:
+                object_snapshots.add(x, x.get_reference())  # type: ignore [union-attr]
+        object_snapshots.flush()
 
     @staticmethod
     def _invalidate_all_references(object: AnyPDFType) -> None:
-        objects_done: typing.List[AnyPDFType] = []
+        # objects are tracked by identity (rather than by equality)
+        # comparing every object to every object that was done before is quadratic
+        objects_done: typing.Set[int] = set()
         objects_todo: typing.List[AnyPDFType] = [object]
         while len(objects_todo) > 0:
-            obj = objects_todo.pop(0)
-            if obj in objects_done:
+            obj = objects_todo.pop()
+            if id(obj) in objects_done:
                 continue
-            objects_done.append(obj)
+            objects_done.add(id(obj))
             try:
                 obj.set_reference(None)  # type: ignore [union-attr]
             except Exception as ex:
@@ -13,7 +13,7 @@ from typing import Any, Optional
 
 from borb.io.read.types import AnyPDFType
 from borb.io.read.types import Decimal as bDecimal
-from borb.io.read.types import Dictionary, Name, Stream, String
+from borb.io.read.types import Dictionary, Name, Reference, Stream, String
 from borb.io.write.conformance_level import ConformanceLevel
 from borb.io.write.object.dictionary_transformer import DictionaryTransformer
 from borb.io.write.object.stream_transformer import StreamTransformer
@@ -30,6 +30,9 @@ class InformationDictionaryTransformer(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing /Info Dictionary objects
     """
 
+    # can_be_transformed (also) depends on the parent of the object, so its result is not cached
+    TRANSFORMABLE_TYPES = (Dictionary,)
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be transformed is an /Info Dictionary
@@ -252,6 +255,15 @@ class InformationDictionaryTransformer(Transformer):
         """
         This method writes an /Info Dictionary to a byte stream
         """
+        assert context is not None
+
+        # avoid resolving objects twice
+        object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
+        if (
+            object_ref is not None
+            and object_ref.object_number in context.resolved_object_numbers
+        ):
+            return
 
         # get Document
         document: Document = object_to_transform.get_root()
@@ -21,6 +21,9 @@ class ImageTransformer(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing Image objects
     """
 
+    TRANSFORMABLE_TYPES = (PILImage.Image,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be converted represents an Image object
@@ -68,6 +71,14 @@ class ImageTransformer(Transformer):
         assert isinstance(object_to_transform, PILImage.Image), "object_to_transform must be of type PILImage.Image"
         # fmt: on
 
+        # avoid resolving objects twice
+        object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
+        if (
+            object_ref is not None
+            and object_ref.object_number in context.resolved_object_numbers
+        ):
+            return
+
         # get image bytes
         contents: typing.Optional[bytes] = None
         filter_name: Optional[Name] = None
@@ -21,6 +21,9 @@ class DictionaryTransformer(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing Dictionary objects
     """
 
+    TRANSFORMABLE_TYPES = (Dictionary,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be converted represents an Dictionary object
@@ -43,7 +46,10 @@ class DictionaryTransformer(Transformer):
 
         # avoid resolving objects twice
         object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
-        if object_ref is not None and object_ref in context.resolved_references:
+        if (
+            object_ref is not None
+            and object_ref.object_number in context.resolved_object_numbers
+        ):
             assert object_ref is not None
             assert object_ref.object_number is not None
             logger.debug(
@@ -77,30 +83,30 @@ class DictionaryTransformer(Transformer):
             if object_ref.object_number is not None and object_ref.byte_offset is None:
                 started_object = True
                 self._start_object(object_to_transform, context)
-            context.resolved_references.append(object_ref)
+            context.resolved_object_numbers.add(object_ref.object_number)
 
         # write dictionary at current location
-        context.destination.write(bytes("<<", "latin1"))
+        context.destination.write(b"<<")
         N = len(out_value.items())
         for i, (k, v) in enumerate(out_value.items()):
             self.get_root_transformer().transform(k, context)
-            context.destination.write(bytes(" ", "latin1"))
+            context.destination.write(b" ")
             self.get_root_transformer().transform(v, context)
             if i != N - 1:
-                context.destination.write(bytes(" ", "latin1"))
+                context.destination.write(b" ")
 
         # write newline if the object is not inline
         if object_to_transform.is_inline():  # type: ignore [attr-defined]
-            context.destination.write(bytes(">>", "latin1"))
+            context.destination.write(b">>")
         else:
-            context.destination.write(bytes(">>\n", "latin1"))
+            context.destination.write(b">>\n")
 
         # end object if needed
         if started_object:
             self._end_object(object_to_transform, context)
 
-        for e in queue:
-            self.get_root_transformer().transform(e, context)
+        # write referenced objects (after this object)
+        self._queue(queue, context)
 
         # return
         return out_value
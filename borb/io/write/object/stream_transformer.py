@@ -22,6 +22,9 @@ class StreamTransformer(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing Stream objects
     """
 
+    TRANSFORMABLE_TYPES = (Stream,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be converted represents a Stream object
@@ -44,7 +47,10 @@ class StreamTransformer(Transformer):
 
         # avoid resolving objects twice
         object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
-        if object_ref is not None and object_ref in context.resolved_references:
+        if (
+            object_ref is not None
+            and object_ref.object_number in context.resolved_object_numbers
+        ):
             assert object_ref is not None
             assert object_ref.object_number is not None
             logger.debug(
@@ -60,7 +66,15 @@ class StreamTransformer(Transformer):
             if object_ref.object_number is not None and object_ref.byte_offset is None:
                 started_object = True
                 self._start_object(object_to_transform, context)
-            context.resolved_references.append(object_ref)
+            context.resolved_object_numbers.add(object_ref.object_number)
+
+        # unmodified Stream objects are written using their original (encoded) /Bytes
+        # all other Stream objects (that have /DecodedBytes) need to be encoded (again)
+        is_encoded_again: bool = "DecodedBytes" in object_to_transform and (
+            "Bytes" not in object_to_transform
+            or object_to_transform.is_modified()
+            or context.compression_level == 0
+        )
 
         # build stream dictionary
         stream_dictionary = Dictionary()
@@ -70,6 +84,9 @@ class StreamTransformer(Transformer):
         for k, v in object_to_transform.items():
             if k in ["Bytes", "DecodedBytes"]:
                 continue
+            # /Filter and /DecodeParms only apply to the original /Bytes
+            if k in ["DecodeParms", "Filter"] and is_encoded_again:
+                continue
             if (
                 isinstance(v, Dictionary)
                 or isinstance(v, List)
@@ -80,22 +97,20 @@ class StreamTransformer(Transformer):
             else:
                 stream_dictionary[k] = v
 
-        # if self.compression_level == 0, remove /Filter
-        if context.compression_level == 0 and Name("Filter") in stream_dictionary:
-            stream_dictionary.pop(Name("Filter"))
-
         # handle compression
-        if "DecodedBytes" in object_to_transform:
+        if is_encoded_again:
             if context.compression_level == 0:
                 bts = object_to_transform["DecodedBytes"]
             else:
                 bts = zlib.compress(
                     object_to_transform["DecodedBytes"], context.compression_level
                 )
-            stream_dictionary[Name("Length")] = bDecimal(len(bts))
+                if "Filter" in object_to_transform:
+                    stream_dictionary[Name("Filter")] = Name("FlateDecode")
         else:
             assert "Bytes" in object_to_transform
             bts = object_to_transform["Bytes"]
+        stream_dictionary[Name("Length")] = bDecimal(len(bts))
 
         # write stream dictionary
         self.get_root_transformer().transform(stream_dictionary, context)
@@ -113,5 +128,5 @@ class StreamTransformer(Transformer):
         if started_object:
             self._end_object(object_to_transform, context)
 
-        for e in queue:
-            self.get_root_transformer().transform(e, context)
+        # write referenced objects (after this object)
+        self._queue(queue, context)
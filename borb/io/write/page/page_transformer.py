@@ -6,9 +6,10 @@ This implementation of WriteBaseTransformer is responsible
 for writing Dictionary objects of /Type /Page
 """
 import logging
+import typing
 from typing import Optional
 
-from borb.io.read.types import AnyPDFType, Dictionary, Name
+from borb.io.read.types import AnyPDFType, Dictionary, Name, Reference
 from borb.io.write.font.subsetter import Subsetter
 from borb.io.write.object.dictionary_transformer import DictionaryTransformer
 from borb.io.write.transformer import WriteTransformerState
@@ -44,6 +45,14 @@ class PageTransformer(DictionaryTransformer):
         assert isinstance(context.root_object, Document), "context.root_object must be of type Document in order to write Page objects."
         # fmt: on
 
+        # avoid resolving objects twice
+        object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
+        if (
+            object_ref is not None
+            and object_ref.object_number in context.resolved_object_numbers
+        ):
+            return
+
         pages_dict = context.root_object["XRef"]["Trailer"]["Root"]["Pages"]
 
         # add /Parent reference to /Pages
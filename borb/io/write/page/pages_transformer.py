@@ -41,6 +41,14 @@ class PagesTransformer(DictionaryTransformer):
         assert context is not None, "A WriteTransformerState must be defined in order to write Pages Dictionary objects."
         # fmt: on
 
+        # avoid resolving objects twice
+        object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
+        if (
+            object_ref is not None
+            and object_ref.object_number in context.resolved_object_numbers
+        ):
+            return
+
         # /Kids can be written immediately
         object_to_transform[Name("Kids")].set_is_inline(True)  # type: ignore [attr-defined]
 
@@ -54,9 +62,8 @@ class PagesTransformer(DictionaryTransformer):
         # delegate to super
         super(PagesTransformer, self).transform(object_to_transform, context)
 
-        # write /Page objects
-        for p in queue:
-            self.get_root_transformer().transform(p, context)
+        # write /Page objects (after this object)
+        self._queue(queue, context)
 
         # restore /Kids
         for i, k in enumerate(queue):
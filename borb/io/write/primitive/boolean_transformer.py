@@ -15,6 +15,9 @@ class BooleanTransformer(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing booleans
     """
 
+    TRANSFORMABLE_TYPES = (Boolean,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be converted represents a Boolean object
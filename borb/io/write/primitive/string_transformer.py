@@ -15,6 +15,9 @@ class StringTransformer(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing String objects
     """
 
+    TRANSFORMABLE_TYPES = (String, HexadecimalString)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be converted represents a String or HexadecimalString
@@ -15,6 +15,9 @@ class ReferenceTransform(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing References
     """
 
+    TRANSFORMABLE_TYPES = (Reference,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be converted represents a Reference
@@ -7,8 +7,19 @@ This implementation of WriteBaseTransformer is responsible for writing XREF obje
 import typing
 from typing import Optional
 
-from borb.io.read.types import AnyPDFType, Decimal, Dictionary, Name, Reference
+from borb.io.read.reference.object_snapshots import ObjectSnapshots
+from borb.io.read.types import (
+    AnyPDFType,
+    Decimal,
+    Dictionary,
+    List,
+    Name,
+    Reference,
+    Stream,
+)
 from borb.io.write.transformer import Transformer, WriteTransformerState
+from borb.pdf.document.document import Document
+from borb.pdf.xref.stream_xref import StreamXREF
 from borb.pdf.xref.xref import XREF
 
 
@@ -17,6 +28,9 @@ class XREFTransformer(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing XREF objects
     """
 
+    TRANSFORMABLE_TYPES = (XREF,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be converted represents a cross-reference table
@@ -67,6 +81,16 @@ class XREFTransformer(Transformer):
         if "ID" in object_to_transform["Trailer"]:
             trailer_out[Name("ID")] = object_to_transform["Trailer"]["ID"]
 
+        # /Prev (incremental update)
+        # fmt: off
+        object_snapshots: typing.Optional[ObjectSnapshots] = None
+        if context.incremental:
+            assert isinstance(context.root_object, Document)
+            object_snapshots = context.root_object._object_snapshots
+            assert object_snapshots is not None
+            trailer_out[Name("Prev")] = Decimal(object_snapshots.get_start_of_xref())
+        # fmt: on
+
         # write /Info object
         # fmt: off
         if "Info" in object_to_transform["Trailer"]:
@@ -82,37 +106,98 @@ class XREFTransformer(Transformer):
         # fmt: on
 
         # write /XREF
-        start_of_xref = context.destination.tell()
+        # (as a cross-reference stream, or as a cross-reference table followed by the trailer)
+        if context.use_object_streams:
+            start_of_xref: int = self._write_xref_stream(trailer_out, context)
+        else:
+            start_of_xref = self._write_xref_table(trailer_out, context)
+        context.destination.write(bytes("startxref\n", "latin1"))
+
+        # write byte offset of last cross-reference section
+        context.destination.write(bytes(str(start_of_xref) + "\n", "latin1"))
+
+        # write EOF
+        context.destination.write(bytes("%%EOF", "latin1"))
+
+        # the next incremental update refers back to this cross-reference section
+        if object_snapshots is not None:
+            object_snapshots.set_revision(context.destination.tell(), start_of_xref)
+
+    def _write_xref_table(
+        self, trailer_out: Dictionary, context: WriteTransformerState
+    ) -> int:
+        assert context.destination is not None
+        start_of_xref: int = context.destination.tell()
         context.destination.write(bytes("xref\n", "latin1"))
         for section in self._section_xref(context):
             context.destination.write(
                 bytes("%d %d\n" % (section[0].object_number, len(section)), "latin1")
             )
             for r in section:
+                # fmt: off
                 if r.is_in_use:
                     context.destination.write(
-                        bytes("{0:010d} 00000 n\r\n".format(r.byte_offset), "latin1")
+                        bytes("{0:010d} {1:05d} n\r\n".format(r.byte_offset, r.generation_number or 0), "latin1")
                     )
                 else:
                     context.destination.write(
                         bytes("{0:010d} 00000 f\r\n".format(r.byte_offset), "latin1")
                     )
+                # fmt: on
 
         # update /Size
+        # (an incremental update may not use every object number, /Size is one more than the highest one)
         trailer_out[Name("Size")] = Decimal(
-            sum([len(v) for k, v in context.indirect_objects_by_hash.items()]) + 1
+            max(context.object_numbers_in_use, default=0) + 1
         )
 
         # write /Trailer
         context.destination.write(bytes("trailer\n", "latin1"))
         self.get_root_transformer().transform(trailer_out, context)
-        context.destination.write(bytes("startxref\n", "latin1"))
-
-        # write byte offset of last cross-reference section
-        context.destination.write(bytes(str(start_of_xref) + "\n", "latin1"))
-
-        # write EOF
-        context.destination.write(bytes("%%EOF", "latin1"))
+        return start_of_xref
+
+    def _write_xref_stream(
+        self, trailer_out: Dictionary, context: WriteTransformerState
+    ) -> int:
+        # write the last object stream
+        self._write_object_stream(context)
+
+        # the cross-reference stream holds its own entry,
+        # its byte offset is known once the object is started
+        xref_stream: Stream = Stream()
+        xref_stream.set_is_unique(True)
+        xref_stream_ref: Reference = self.get_reference(xref_stream, context)
+        self._start_object(xref_stream, context)
+        assert xref_stream_ref.byte_offset is not None
+        start_of_xref: int = xref_stream_ref.byte_offset
+
+        # build entries
+        index: List = List().set_is_inline(True)  # type: ignore [attr-defined]
+        entries: typing.List[typing.Tuple[int, int, int]] = []
+        for section in self._section_xref(context):
+            index.append(Decimal(section[0].object_number))
+            index.append(Decimal(len(section)))
+            entries.extend([StreamXREF.get_entry_for_reference(r) for r in section])
+        widths: typing.List[int] = StreamXREF.get_widths(entries)
+
+        # build cross-reference stream dictionary (which is also the trailer)
+        for k, v in trailer_out.items():
+            xref_stream[k] = v
+        xref_stream[Name("Type")] = Name("XRef")
+        xref_stream[Name("Size")] = Decimal(
+            max(context.object_numbers_in_use, default=0) + 1
+        )
+        xref_stream[Name("W")] = List().set_is_inline(True)  # type: ignore [attr-defined]
+        for w in widths:
+            xref_stream["W"].append(Decimal(w))
+        xref_stream[Name("Index")] = index
+        xref_stream[Name("DecodedBytes")] = StreamXREF.encode_entries(entries, widths)
+        xref_stream[Name("Filter")] = Name("FlateDecode")
+
+        # write
+        self.get_root_transformer().transform(xref_stream, context)
+        self._end_object(xref_stream, context)
+        return start_of_xref
 
     def _section_xref(self, context: Optional[WriteTransformerState] = None):
         assert (
@@ -8,7 +8,10 @@ import io
 import typing
 from typing import Optional
 
-from borb.io.read.types import AnyPDFType, Reference
+from borb.io.read.reference.lazy_object import LazyDictionary
+from borb.io.read.types import AnyPDFType
+from borb.io.read.types import Decimal as bDecimal
+from borb.io.read.types import Dictionary, Name, Reference, Stream, String
 from borb.io.write.conformance_level import ConformanceLevel
 
 
@@ -18,6 +21,7 @@ class WriteTransformerState:
     This includes:
     - the root object (the Document itself)
     - a cache of indirect objects (by id and hash)
+    - the object numbers that have been assigned
     - references that have been resolved (to avoid endless loops)
     - the default compression level
     - etc
@@ -33,9 +37,18 @@ class WriteTransformerState:
         self.root_object: Optional[AnyPDFType] = root_object                                # this is the root object (PDF)
         self.indirect_objects_by_id: typing.Dict[int, AnyPDFType] = {}                      # these are the indirect objects (by id)
         self.indirect_objects_by_hash: typing.Dict[int, typing.List[AnyPDFType]] = {}       # these are the indirect objects (by hash)
-        self.resolved_references: typing.List[Reference] = []                               # these references have already been written
+        self.object_numbers_in_use: typing.Set[int] = set()                                 # these object numbers have been assigned to indirect objects
+        self.next_object_number: int = 1                                                    # this is the lowest object number that may still be free
+        self.resolved_object_numbers: typing.Set[int] = set()                               # these objects (object numbers) have already been written
+        self.queued_objects: typing.List[AnyPDFType] = []                                   # these objects still need to be written (last in, first out)
         self.compression_level: int = 9                                                     # default compression level
         self.apply_font_subsetting: bool = False                                            # whether to apply Font subsetting or not
+        self.incremental: bool = False                                                      # whether to write an incremental update (only new and modified objects)
+        self.use_object_streams: bool = False                                               # whether to store (non-stream) objects in object streams (and write a cross-reference stream)
+        self.object_stream: Optional[Stream] = None                                         # this is the object stream that is being filled
+        self.object_stream_entries: typing.List[typing.Tuple[int, int, bytes]] = []         # these are the objects (object number, byte offset, bytes) in that object stream
+        self.object_stream_byte_offset: int = 0                                             # this is the byte offset (in that object stream) of the next object
+        self.object_stream_destinations: typing.List[typing.Any] = []                       # these destinations were replaced while writing an object (to an object stream)
         # fmt: on
 
 
@@ -46,8 +59,22 @@ class Transformer:
     such as persisting Image objects, or Dictionary objects, etc.
     """
 
+    MAX_NUMBER_OF_OBJECTS_PER_OBJECT_STREAM: int = 100
+
+    # the (Python) types of the objects this Transformer may be able to transform,
+    # can_be_transformed is only called for objects of these types
+    TRANSFORMABLE_TYPES: typing.Tuple[type, ...] = (object,)
+
+    # whether can_be_transformed only depends on the (Python) type of the object,
+    # and (for dictionaries) on its /Type, /Subtype and /Filter entries
+    # if so, its result is cached (see _get_handler)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE: bool = False
+
     def __init__(self):
         self._handlers: typing.List["Transformer"] = []
+        self._handlers_by_key: typing.Dict[
+            typing.Hashable, typing.List[typing.Tuple["Transformer", bool]]
+        ] = {}
         self._parent: typing.Optional["Transformer"] = None
 
     def add_child_transformer(
@@ -62,6 +89,7 @@ class Transformer:
         This function returns self.
         """
         self._handlers.append(handler)
+        self._handlers_by_key = {}
         handler._parent = self
         return self
 
@@ -90,21 +118,82 @@ class Transformer:
         context: Optional[WriteTransformerState] = None,
     ):
         """
-        This method writes an object (of type AnyPDFType) to a byte stream (specified in the WriteTransformerState)
+        This method writes an object (of type AnyPDFType) to a byte stream (specified in the WriteTransformerState).
+        Objects that were queued (see _queue) while writing this object are written before this method returns.
+        They are written one after the other (rather than recursively), so that deep object graphs
+        (e.g. long outline or /Kids chains) do not exceed the recursion limit.
         """
         # transform object
         return_value = None
-        for h in self._handlers:
-            if h.can_be_transformed(object_to_transform):
-                return_value = h.transform(
-                    object_to_transform,
-                    context=context,
-                )
-                break
+        h: Optional[Transformer] = self._get_handler(object_to_transform)
+        if h is None:
+            return return_value
+        if context is None:
+            return h.transform(object_to_transform, context=context)
+        number_of_queued_objects: int = len(context.queued_objects)
+        return_value = h.transform(object_to_transform, context=context)
+
+        # transform queued objects
+        while len(context.queued_objects) > number_of_queued_objects:
+            queued_object: AnyPDFType = context.queued_objects.pop()
+            h = self._get_handler(queued_object)
+            if h is not None:
+                h.transform(queued_object, context=context)
 
         # return
         return return_value
 
+    @staticmethod
+    def _get_cache_key(object: typing.Any) -> Optional[typing.Hashable]:
+        if not isinstance(object, dict):
+            return type(object)
+        key: typing.List[typing.Any] = [type(object)]
+        for k in ["Type", "Subtype", "Filter"]:
+            v = dict.get(object, k, None)
+            if isinstance(v, list) and all([isinstance(x, Name) for x in v]):
+                v = tuple(v)
+            elif v is not None and not isinstance(v, Name):
+                return None
+            key.append(v)
+        return tuple(key)
+
+    def _get_handler(self, object_to_transform: AnyPDFType) -> Optional["Transformer"]:
+        # look up the handlers that may be able to transform this object
+        # (True if the handler is known to be able to transform it, False if can_be_transformed needs to be called)
+        key: Optional[typing.Hashable] = Transformer._get_cache_key(object_to_transform)
+        handlers: Optional[typing.List[typing.Tuple["Transformer", bool]]] = (
+            self._handlers_by_key.get(key, None) if key is not None else None
+        )
+        if handlers is None:
+            handlers = []
+            t: type = type(object_to_transform)
+            for h in self._handlers:
+                if not issubclass(t, h.TRANSFORMABLE_TYPES):
+                    continue
+                if not h.CAN_BE_TRANSFORMED_IS_CACHEABLE:
+                    handlers.append((h, False))
+                    continue
+                if h.can_be_transformed(object_to_transform):
+                    handlers.append((h, True))
+                    break
+            if key is not None:
+                self._handlers_by_key[key] = handlers
+        for h, is_known_to_transform in handlers:
+            if is_known_to_transform or h.can_be_transformed(object_to_transform):
+                return h
+        return None
+
+    def _queue(
+        self,
+        objects_to_transform: typing.List[AnyPDFType],
+        context: WriteTransformerState,
+    ) -> None:
+        """
+        This function queues objects to be written (in the given order) by the root Transformer,
+        after the object that is currently being written
+        """
+        context.queued_objects.extend(reversed(objects_to_transform))
+
     def _start_object(
         self,
         object_to_transform: AnyPDFType,
@@ -120,12 +209,24 @@ class Transformer:
         assert context is not None, "A WriteTransformerState must be defined in order to write indirect objects."
         assert context.destination is not None, "A WriteTransformerState must be defined in order to write indirect objects."
         # fmt: on
-        byte_offset = context.destination.tell()
 
-        # update offset
+        # get reference
         ref = object_to_transform.get_reference()  # type: ignore [union-attr]
         assert ref is not None
         assert isinstance(ref, Reference)
+
+        # objects that are stored in an object stream are written to a buffer (see _end_object)
+        # all other objects are written to the original destination
+        if context.use_object_streams:
+            context.object_stream_destinations.append(context.destination)
+            if self._can_be_stored_in_object_stream(object_to_transform, context):
+                context.destination = io.BytesIO()
+                ref.byte_offset = 0
+                return
+            context.destination = context.object_stream_destinations[0]
+
+        # update offset
+        byte_offset = context.destination.tell()
         ref.byte_offset = byte_offset
 
         # write <object number> <generation number> obj
@@ -150,7 +251,83 @@ class Transformer:
         assert context is not None, "A WriteTransformerState must be defined in order to write indirect objects."
         assert context.destination is not None, "A WriteTransformerState must be defined in order to write indirect objects."
         # fmt: on
-        context.destination.write(bytes("endobj\n\n", "latin1"))
+        if not context.use_object_streams:
+            context.destination.write(bytes("endobj\n\n", "latin1"))
+            return
+
+        # restore destination
+        object_buffer = context.destination
+        context.destination = context.object_stream_destinations.pop()
+        if not self._can_be_stored_in_object_stream(object_to_transform, context):
+            object_buffer.write(bytes("endobj\n\n", "latin1"))
+            return
+
+        # add object to (current) object stream
+        assert isinstance(object_buffer, io.BytesIO)
+        if context.object_stream is None:
+            context.object_stream = Stream()
+            context.object_stream.set_is_unique(True)
+            self.get_reference(context.object_stream, context)
+        object_stream_ref = context.object_stream.get_reference()  # type: ignore [attr-defined]
+        ref = object_to_transform.get_reference()  # type: ignore [union-attr]
+        ref.parent_stream_object_number = object_stream_ref.object_number
+        ref.index_in_parent_stream = len(context.object_stream_entries)
+        object_bytes: bytes = object_buffer.getvalue()
+        context.object_stream_entries.append(
+            (ref.object_number, context.object_stream_byte_offset, object_bytes)
+        )
+        context.object_stream_byte_offset += len(object_bytes)
+
+        # write object stream (if it is full)
+        if (
+            len(context.object_stream_entries)
+            >= Transformer.MAX_NUMBER_OF_OBJECTS_PER_OBJECT_STREAM
+        ):
+            self._write_object_stream(context)
+
+    @staticmethod
+    def _can_be_stored_in_object_stream(
+        object_to_transform: AnyPDFType, context: WriteTransformerState
+    ) -> bool:
+        # stream objects (and objects with a generation number other than 0) can not be stored in an object stream
+        if isinstance(object_to_transform, Stream):
+            return False
+        ref = object_to_transform.get_reference()  # type: ignore [union-attr]
+        return (ref.generation_number or 0) == 0
+
+    def _write_object_stream(self, context: WriteTransformerState) -> None:
+        """
+        This function writes the object stream that is being filled (if any).
+        Its header holds pairs of object number and byte offset (relative to /First),
+        followed by the objects themselves.
+        """
+        if context.object_stream is None or len(context.object_stream_entries) == 0:
+            return
+        object_stream: Stream = context.object_stream
+        object_stream_entries: typing.List[
+            typing.Tuple[int, int, bytes]
+        ] = context.object_stream_entries
+        context.object_stream = None
+        context.object_stream_entries = []
+        context.object_stream_byte_offset = 0
+
+        # build header
+        header_bytes: bytes = bytes(
+            " ".join(["%d %d" % (x[0], x[1]) for x in object_stream_entries]) + "\n",
+            "latin1",
+        )
+
+        # build object stream
+        object_stream[Name("Type")] = Name("ObjStm")
+        object_stream[Name("N")] = bDecimal(len(object_stream_entries))
+        object_stream[Name("First")] = bDecimal(len(header_bytes))
+        object_stream[Name("DecodedBytes")] = header_bytes + b"".join(
+            [x[2] for x in object_stream_entries]
+        )
+        object_stream[Name("Filter")] = Name("FlateDecode")
+
+        # write
+        self.get_root_transformer().transform(object_stream, context)
 
     @staticmethod
     def _hash(obj: typing.Any) -> int:
@@ -167,8 +344,79 @@ class Transformer:
             pass
         if h is None:
             raise TypeError("unhashable type: %s" % obj.__class__.__name__)
+        # Dictionary.__hash__ only considers its keys (in insertion order),
+        # the hash of its entries is summed (so the order of the keys does not matter)
+        # the (primitive) values are added to avoid comparing every pair of Dictionary objects with the same keys
+        if isinstance(obj, Dictionary):
+            hs: int = 1
+            for k, v in dict.items(obj):
+                hv: int = 0
+                if isinstance(v, (bDecimal, Name, String)):
+                    try:
+                        hv = hash(v)
+                    except:
+                        pass
+                hs += 31 * hash(k) + hv
+            # subclasses (e.g. ContentStream) may hash more than just the keys
+            if type(obj).__hash__ in (Dictionary.__hash__, LazyDictionary.__hash__):
+                h = hs
+            else:
+                h = 31 * h + hs
         return h
 
+    @staticmethod
+    def _is_equal(obj0: typing.Any, obj1: typing.Any) -> bool:
+        try:
+            return obj0 == obj1
+        except RecursionError:
+            pass
+
+        # deep (or cyclic) object graphs are compared using an explicit stack (rather than recursively)
+        # pairs of containers that are already being compared are assumed to be equal
+        todo: typing.List[typing.Tuple[typing.Any, typing.Any]] = [(obj0, obj1)]
+        done: typing.Set[typing.Tuple[int, int]] = set()
+        while len(todo) > 0:
+            a, b = todo.pop()
+            if a is b:
+                continue
+            if isinstance(a, dict) and isinstance(b, dict):
+                if (id(a), id(b)) in done:
+                    continue
+                done.add((id(a), id(b)))
+                b_items: typing.Dict[typing.Any, typing.Any] = dict(b.items())
+                if len(a) != len(b_items):
+                    return False
+                for k, v in a.items():
+                    if k not in b_items:
+                        return False
+                    todo.append((v, b_items[k]))
+                continue
+            if isinstance(a, list) and isinstance(b, list):
+                if (id(a), id(b)) in done:
+                    continue
+                done.add((id(a), id(b)))
+                if len(a) != len(b):
+                    return False
+                todo.extend([(a[i], b[i]) for i in range(0, len(a))])
+                continue
+            if a != b:
+                return False
+        return True
+
+    def _get_reference_of_read_object(
+        self, object: AnyPDFType, context: WriteTransformerState
+    ) -> Optional[Reference]:
+        object_snapshots = getattr(context.root_object, "_object_snapshots", None)
+        if object_snapshots is None:
+            return None
+        ref: Optional[Reference] = object_snapshots.get_reference(object)
+        if ref is None:
+            return None
+        object.set_reference(ref)  # type: ignore [union-attr]
+        context.indirect_objects_by_id[id(object)] = object
+        context.resolved_object_numbers.add(ref.object_number)
+        return ref
+
     def get_reference(
         self, object: AnyPDFType, context: WriteTransformerState
     ) -> Reference:
@@ -189,11 +437,17 @@ class Transformer:
             assert not isinstance(cached_indirect_object, Reference)
             return cached_indirect_object.get_reference()  # type: ignore[union-attr]
 
+        # objects that were read keep their Reference, and are not written again (incremental update)
+        if context.incremental:
+            ref = self._get_reference_of_read_object(object, context)
+            if ref is not None:
+                return ref
+
         # look through existing indirect object hashes
         obj_hash: int = self._hash(object)
         if (not is_unique) and obj_hash in context.indirect_objects_by_hash:
             for obj in context.indirect_objects_by_hash[obj_hash]:
-                if obj == object:
+                if Transformer._is_equal(obj, object):
                     ref = obj.get_reference()  # type: ignore [union-attr]
                     assert ref is not None
                     assert isinstance(ref, Reference)
@@ -201,16 +455,11 @@ class Transformer:
                     return ref
 
         # generate new object number
-        existing_obj_numbers = set(
-            [
-                item.get_reference().object_number  # type: ignore [union-attr]
-                for sublist in [v for k, v in context.indirect_objects_by_hash.items()]
-                for item in sublist
-            ]
-        )
-        obj_number = len(existing_obj_numbers) + 1
-        while obj_number in existing_obj_numbers:  # type: ignore [union-attr]
+        obj_number: int = context.next_object_number
+        while obj_number in context.object_numbers_in_use:
             obj_number += 1
+        context.object_numbers_in_use.add(obj_number)
+        context.next_object_number = obj_number + 1
 
         # build reference
         ref = Reference(object_number=obj_number)
@@ -17,6 +17,9 @@ class VersionAsCommentTransformer(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing the borb version in every PDF
     """
 
+    # can_be_transformed (also) depends on whether this Transformer was used before, so its result is not cached
+    TRANSFORMABLE_TYPES = (Stream,)
+
     def __init__(self):
         super().__init__()
         self._has_been_used: bool = False
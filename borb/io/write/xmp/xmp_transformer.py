@@ -6,6 +6,7 @@ This implementation of WriteBaseTransformer
 is responsible for writing XMP meta-data information
 """
 import logging
+import typing
 import xml.etree.ElementTree as ET
 from typing import Optional
 
@@ -22,6 +23,9 @@ class XMPTransformer(Transformer):
     This implementation of WriteBaseTransformer is responsible for writing XMP meta-data information
     """
 
+    TRANSFORMABLE_TYPES = (ET.Element,)
+    CAN_BE_TRANSFORMED_IS_CACHEABLE = True
+
     def can_be_transformed(self, any: AnyPDFType):
         """
         This function returns True if the object to be converted represents an XML element
@@ -42,6 +46,14 @@ class XMPTransformer(Transformer):
         assert context.destination is not None, "A WriteTransformerState must be defined in order to write XMP objects."
         # fmt: on
 
+        # avoid resolving objects twice
+        object_ref: typing.Optional[Reference] = object_to_transform.get_reference()  # type: ignore [attr-defined]
+        if (
+            object_ref is not None
+            and object_ref.object_number in context.resolved_object_numbers
+        ):
+            return
+
         # build stream
         out_value = Stream()
         out_value[Name("Type")] = Name("Metadata")
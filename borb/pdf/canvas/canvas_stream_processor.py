@@ -235,7 +235,10 @@ class CanvasStreamProcessor:
         length = io_source.tell()
         io_source.seek(0)
 
-        canvas_tokenizer = HighLevelTokenizer(io_source)
+        # in-memory content streams are tokenized straight from their buffer
+        canvas_tokenizer = HighLevelTokenizer(
+            io_source.getvalue() if isinstance(io_source, io.BytesIO) else io_source
+        )
 
         # process content
         operand_stk: typing.List[AnyPDFType] = []
@@ -40,11 +40,12 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
         )
         m = graphics_state.text_matrix.mul(graphics_state.ctm)
         m[1][1] *= graphics_state.font_size
+        width_in_text_space: Decimal = self._glyph_line.get_width_in_text_space()
 
         # calculate baseline box
         p0 = m.cross(Decimal(0), graphics_state.text_rise, Decimal(1))
         p1 = m.cross(
-            self._glyph_line.get_width_in_text_space(),
+            width_in_text_space,
             graphics_state.text_rise
             + graphics_state.font.get_ascent() * Decimal(0.001),
             Decimal(1),
@@ -67,7 +68,7 @@ class ChunkOfTextRenderEvent(Event, ChunkOfText):
                 Decimal(1),
             )
             p1 = m.cross(
-                self._glyph_line.get_width_in_text_space(),
+                width_in_text_space,
                 graphics_state.text_rise
                 + graphics_state.font.get_ascent() * Decimal(0.001),
                 Decimal(1),
@@ -14,7 +14,6 @@ In traditional typesetting, the font would be made from metal or wood.
 Today, the font is a digital file.
 """
 import copy
-import io
 import typing
 from decimal import Decimal
 
@@ -156,7 +155,7 @@ class Font(Dictionary):
     def _read_cmap(cmap_bytes: bytes) -> typing.Dict[int, str]:
 
         out_map: typing.Dict[int, str] = {}
-        cmap_tokenizer: HighLevelTokenizer = HighLevelTokenizer(io.BytesIO(cmap_bytes))
+        cmap_tokenizer: HighLevelTokenizer = HighLevelTokenizer(cmap_bytes)
 
         # process stream
         prev_token: typing.Optional[Token] = None
@@ -208,9 +208,13 @@ class GlyphLine:
         """
         This function calculates the width (in text space) of this GlyphLine
         """
+        # these do not depend on the Glyph, calculate them once
+        one_thousandth: Decimal = Decimal(0.001)
+        horizontal_scaling: Decimal = self._horizontal_scaling / Decimal(100)
+
         w: Decimal = Decimal(0)
         for g in self._glyphs:
-            glyph_width_in_text_space = g.get_width() * self._font_size * Decimal(0.001)
+            glyph_width_in_text_space = g.get_width() * self._font_size * one_thousandth
 
             # add word spacing where applicable
             if len(g.get_unicode_str()) == 1 and GlyphLine._isspace(
@@ -219,7 +223,7 @@ class GlyphLine:
                 glyph_width_in_text_space += self._word_spacing
 
             # horizontal scaling
-            glyph_width_in_text_space *= self._horizontal_scaling / Decimal(100)
+            glyph_width_in_text_space *= horizontal_scaling
 
             # add character spacing to character_width
             glyph_width_in_text_space += self._character_spacing
@@ -381,6 +381,72 @@ class Type1Font(SimpleFont):
         # fmt: on
 
 
+class _StandardType1FontMetrics:
+    """
+    This class holds the (immutable) metrics of one of the standard 14 fonts.
+    The AFM file of each font is parsed (at most) once per process, the first time the font is needed.
+    All StandardType1Font objects with the same name share the same _StandardType1FontMetrics.
+    """
+
+    _instances: typing.Dict[str, "_StandardType1FontMetrics"] = {}
+
+    def __init__(self, font_name: str):
+
+        # check whether AFM directory exists
+        afm_directory: Path = Path(__file__).parent / "afm"
+        assert afm_directory.exists(), "AFM directory not found"
+
+        # check whether AFM file exists
+        afm_file: Path = afm_directory / (font_name.lower() + ".afm")
+        assert afm_file.exists(), "afm file not found"
+
+        # build AFM datastructure
+        afm: AFM = AFM(afm_file)
+        self.base_font: str = afm._attrs["FontName"]
+        self.ascent: bDecimal = bDecimal(afm._attrs.get("Ascender", 0))
+        self.descent: bDecimal = bDecimal(afm._attrs.get("Descender", 0))
+
+        # widths, indexed by character identifier
+        # a character identifier that matches no (or multiple) glyph(s) has width 0
+        glyphs_per_character_identifier: typing.Dict[int, typing.List[int]] = {}
+        for character_identifier, width, _ in afm._chars.values():
+            glyphs_per_character_identifier.setdefault(character_identifier, []).append(width)
+        self.widths: typing.List[bDecimal] = [bDecimal(0) for _ in range(0, 256)]
+        for character_identifier, widths in glyphs_per_character_identifier.items():
+            if 0 <= character_identifier < 256 and len(widths) == 1:
+                self.widths[character_identifier] = bDecimal(widths[0])
+
+        # unicode lookup tables
+        # fmt: off
+        self.character_identifier_to_unicode_lookup: typing.Dict[int, str] = {}
+        if font_name == "Symbol":
+            self.character_identifier_to_unicode_lookup = {c: symbol_decode(bytes([c])) for c in range(0, 256)}
+        elif font_name == "ZapfDingbats":
+            self.character_identifier_to_unicode_lookup = {c: zapfdingbats_decode(bytes([c])) for c in range(0, 256)}
+        else:
+            for c in range(0, 256):
+                try:
+                    self.character_identifier_to_unicode_lookup[c] = bytes([c]).decode("cp1252")
+                except:
+                    self.character_identifier_to_unicode_lookup[c] = ""
+        self.unicode_lookup_to_character_identifier: typing.Dict[str, int] = {v: k for k, v in self.character_identifier_to_unicode_lookup.items()}
+        # fmt: on
+
+    @staticmethod
+    def get(font_name: str) -> "_StandardType1FontMetrics":
+        """
+        This function returns the _StandardType1FontMetrics for a given (canonical) standard 14 font name,
+        parsing the corresponding AFM file if needed.
+        """
+        metrics: typing.Optional[
+            _StandardType1FontMetrics
+        ] = _StandardType1FontMetrics._instances.get(font_name)
+        if metrics is None:
+            metrics = _StandardType1FontMetrics(font_name)
+            _StandardType1FontMetrics._instances[font_name] = metrics
+        return metrics
+
+
 class StandardType1Font(Type1Font):
     """
     The PostScript names of 14 Type 1 fonts, known as the standard 14 fonts, are as follows: Times-Roman,
@@ -433,40 +499,18 @@ class StandardType1Font(Type1Font):
             font_name = StandardType1Font._canonical_name(font_name)
             assert font_name is not None, "font_name must be one of the 14 StandardType1Font names."
 
-            # check whether AFM directory exists
-            afm_directory: Path = Path(__file__).parent / "afm"
-            assert afm_directory.exists(), "AFM directory not found"
-
-            # check whether AFM file exists
-            afm_file: Path = afm_directory / (font_name.lower() + ".afm")
-            assert afm_file.exists(), "afm file not found"
-
-            # build AFM datastructure
-            self._afm: AFM = AFM(afm_file)
+            # get (shared) metrics
+            self._metrics: _StandardType1FontMetrics = _StandardType1FontMetrics.get(font_name)
 
             self[Name("Type")] = Name("Font")
             self[Name("Subtype")] = Name("Type1")
-            self[Name("BaseFont")] = Name(self._afm._attrs["FontName"])
-
-            self._character_identifier_to_unicode_lookup: typing.Dict[int, str] = {}
-            self._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {}
-
-            if font_name == "Symbol":
-                self._character_identifier_to_unicode_lookup  = {c:symbol_decode(bytes([c])) for c in range(0, 256)}
-                self._unicode_lookup_to_character_identifier = {v:k for k,v in self._character_identifier_to_unicode_lookup.items()}
-
-            elif font_name == "ZapfDingbats":
-                self._character_identifier_to_unicode_lookup = {c:zapfdingbats_decode(bytes([c])) for c in range(0, 256)}
-                self._unicode_lookup_to_character_identifier = {v:k for k,v in self._character_identifier_to_unicode_lookup.items()}
-
-            else:
+            self[Name("BaseFont")] = Name(self._metrics.base_font)
+            if font_name not in ["Symbol", "ZapfDingbats"]:
                 self[Name("Encoding")] = Name("WinAnsiEncoding")
-                for c in range(0, 256):
-                    try:
-                        self._character_identifier_to_unicode_lookup[c] = bytes([c]).decode("cp1252")
-                    except:
-                        self._character_identifier_to_unicode_lookup[c] = ""
-                self._unicode_lookup_to_character_identifier = {v:k for k,v in self._character_identifier_to_unicode_lookup.items()}
+
+            # the lookup tables are shared by all instances of the same font, they are never modified
+            self._character_identifier_to_unicode_lookup = self._metrics.character_identifier_to_unicode_lookup
+            self._unicode_lookup_to_character_identifier = self._metrics.unicode_lookup_to_character_identifier
 
     # fmt: on
 
@@ -492,13 +536,9 @@ class StandardType1Font(Type1Font):
         If this Font is unable to represent the glyph that corresponds to the character identifier,
         this function returns None
         """
-        widths: typing.List[bDecimal] = [
-            bDecimal(v[1])
-            for k, v in self._afm._chars.items()
-            if v[0] == character_identifier
-        ]
-        if len(widths) == 1:
-            return widths[0]
+        widths: typing.List[bDecimal] = self._metrics.widths
+        if 0 <= character_identifier < len(widths):
+            return widths[character_identifier]
         return bDecimal(0)
 
     def get_ascent(self) -> bDecimal:
@@ -506,18 +546,14 @@ class StandardType1Font(Type1Font):
         This function returns the maximum height above the baseline reached by glyphs in this font.
         The height of glyphs for accented characters shall be excluded.
         """
-        if "Ascender" in self._afm._attrs:
-            return bDecimal(self._afm._attrs["Ascender"])
-        return bDecimal(0)
+        return self._metrics.ascent
 
     def get_descent(self) -> bDecimal:
         """
         This function returns the maximum depth below the baseline reached by glyphs in this font.
         The value shall be a negative number.
         """
-        if "Descender" in self._afm._attrs:
-            return bDecimal(self._afm._attrs["Descender"])
-        return bDecimal(0)
+        return self._metrics.descent
 
     def _empty_copy(self) -> "Font":
         return StandardType1Font()
@@ -526,8 +562,8 @@ class StandardType1Font(Type1Font):
         # fmt: off
         f_out: Font = super(StandardType1Font, self).__deepcopy__(memodict)
         f_out[Name("Subtype")] = Name("Type1")
-        f_out._character_identifier_to_unicode_lookup: typing.Dict[int, str] = {k: v for k, v in self._character_identifier_to_unicode_lookup.items()}
-        f_out._unicode_lookup_to_character_identifier: typing.Dict[str, int] = {k: v for k, v in self._unicode_lookup_to_character_identifier.items()}
-        f_out._afm = self._afm
+        f_out._metrics = self._metrics
+        f_out._character_identifier_to_unicode_lookup = self._metrics.character_identifier_to_unicode_lookup
+        f_out._unicode_lookup_to_character_identifier = self._metrics.unicode_lookup_to_character_identifier
         return f_out
         # fmt: on
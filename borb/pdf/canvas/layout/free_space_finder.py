@@ -4,6 +4,8 @@
 """
 This implementation of EventListener keeps track of which space on a Page is available
 """
+import itertools
+import operator
 import typing
 from decimal import Decimal
 from math import ceil
@@ -27,6 +29,8 @@ class FreeSpaceFinder(EventListener):
         This class represents a rasterized, low-res view of a Page.
         But rather than rendering instructions on this raster, each cell simply keeps track
         of whether or not the cell is available. This enables a quick lookup for availability of a given Rectangle.
+        The availability of each cell is stored as a single byte (1 if available, 0 otherwise),
+        and a summed-area table (of available cells) tells whether a given Rectangle is free in constant time.
         """
 
         def __init__(
@@ -35,23 +39,44 @@ class FreeSpaceFinder(EventListener):
             self._page_width = page_width
             self._page_height = page_height
             self._resolution = resolution
-            self._availability: typing.List[typing.List[bool]] = [
-                [True for _ in range(0, ceil(self._page_width / self._resolution))]
+            self._availability: typing.List[bytearray] = [
+                bytearray(b"\x01" * ceil(self._page_width / self._resolution))
                 for _ in range(0, ceil(self._page_height / self._resolution))
             ]
+            self._summed_area_table: typing.Optional[
+                typing.List[typing.List[int]]
+            ] = None
+
+        def _get_summed_area_table(self) -> typing.List[typing.List[int]]:
+            """
+            This function returns the summed-area table of this Grid,
+            the value at [i][j] being the number of available cells in [0 .. i - 1][0 .. j - 1]
+            """
+            if self._summed_area_table is not None:
+                return self._summed_area_table
+            n: int = len(self._availability[0]) if len(self._availability) > 0 else 0
+            self._summed_area_table = [[0] * (n + 1)]
+            for row in self._availability:
+                prev_row: typing.List[int] = self._summed_area_table[-1]
+                self._summed_area_table.append(
+                    [0]
+                    + list(map(operator.add, itertools.accumulate(row), prev_row[1:]))
+                )
+            return self._summed_area_table
 
         def _mark_as_unavailable(self, rectangle: Rectangle) -> "FreeSpaceFinder.Grid":
             x_grid = int(int(rectangle.x) / self._resolution)
             y_grid = int(int(rectangle.y) / self._resolution)
             w = int(int(rectangle.width) / self._resolution)
             h = int(int(rectangle.height) / self._resolution)
-            for i in range(x_grid - 1, x_grid + w + 1):
-                for j in range(y_grid - 1, y_grid + h + 1):
-                    if i < 0 or i >= len(self._availability):
-                        continue
-                    if j < 0 or j >= len(self._availability[i]):
-                        continue
-                    self._availability[i][j] = False
+            for i in range(
+                max(x_grid - 1, 0), min(x_grid + w + 1, len(self._availability))
+            ):
+                j0: int = max(y_grid - 1, 0)
+                j1: int = min(y_grid + h + 1, len(self._availability[i]))
+                if j0 < j1:
+                    self._availability[i][j0:j1] = bytes(j1 - j0)
+            self._summed_area_table = None
             return self
 
         def _get_free_space(
@@ -62,63 +87,103 @@ class FreeSpaceFinder(EventListener):
             """
             w = int(int(desired_rectangle.width) / self._resolution)
             h = int(int(desired_rectangle.height) / self._resolution)
-            possible_points: typing.List[typing.Tuple[Decimal, Decimal]] = []
-            for i in range(0, len(self._availability) - w):
-                for j in range(0, len(self._availability[i]) - h):
-                    is_free = True
-                    for k in range(0, w):
-                        for l in range(0, h):
-                            if not self._availability[i + k][j + l]:
-                                is_free = False
-                                break
-                        if not is_free:
-                            break
-                    if is_free:
-                        possible_points.append(
-                            (
-                                Decimal(i * self._resolution),
-                                Decimal(j * self._resolution),
-                            )
-                        )
-
-            # find point closest to desired location
-            if len(possible_points) == 0:
+            if len(self._availability) == 0:
+                return None
+            max_i: int = len(self._availability) - w - 1
+            max_j: int = len(self._availability[0]) - h - 1
+            if max_i < 0 or max_j < 0:
                 return None
-            min_dist = (desired_rectangle.x - possible_points[0][0]) ** 2 + (
-                desired_rectangle.y - possible_points[0][1]
-            ) ** 2
-            min_dist_point = possible_points[0]
-            for p in possible_points:
-                d = (desired_rectangle.x - p[0]) ** 2 + (
-                    desired_rectangle.y - p[1]
-                ) ** 2
-                if d < min_dist:
-                    min_dist = d
-                    min_dist_point = p
+
+            # start searching at the cell closest to the desired location
+            sat: typing.List[typing.List[int]] = self._get_summed_area_table()
+            x: Decimal = desired_rectangle.x / self._resolution
+            y: Decimal = desired_rectangle.y / self._resolution
+            ci: int = min(max(int(round(x)), 0), max_i)
+            cj: int = min(max(int(round(y)), 0), max_j)
+            offset: Decimal = max(abs(x - ci), abs(y - cj))
+
+            # search (square) rings of cells around (ci, cj), moving outwards
+            min_dist: typing.Optional[Decimal] = None
+            min_dist_point: typing.Tuple[int, int] = (0, 0)
+            for r in range(0, max(ci, max_i - ci, cj, max_j - cj) + 1):
+
+                # cells in this ring are at least (r - offset) cells away from the desired location
+                lower_bound: Decimal = (r - offset - 1) * self._resolution
+                if (
+                    min_dist is not None
+                    and lower_bound > 0
+                    and lower_bound**2 > min_dist
+                ):
+                    break
+
+                for i, j in FreeSpaceFinder.Grid._get_ring(ci, cj, r, max_i, max_j):
+                    # fmt: off
+                    if sat[i + w][j + h] - sat[i][j + h] - sat[i + w][j] + sat[i][j] != w * h:
+                        continue
+                    # fmt: on
+                    d = (desired_rectangle.x - Decimal(i * self._resolution)) ** 2 + (
+                        desired_rectangle.y - Decimal(j * self._resolution)
+                    ) ** 2
+                    if (
+                        min_dist is None
+                        or d < min_dist
+                        or (d == min_dist and (i, j) < min_dist_point)
+                    ):
+                        min_dist = d
+                        min_dist_point = (i, j)
 
             # return
+            if min_dist is None:
+                return None
             return Rectangle(
-                min_dist_point[0],
-                min_dist_point[1],
+                Decimal(min_dist_point[0] * self._resolution),
+                Decimal(min_dist_point[1] * self._resolution),
                 desired_rectangle.width,
                 desired_rectangle.height,
             )
 
-    def __init__(self):
+        @staticmethod
+        def _get_ring(
+            ci: int, cj: int, r: int, max_i: int, max_j: int
+        ) -> typing.Iterator[typing.Tuple[int, int]]:
+            """
+            This function yields the cells (within [0 .. max_i][0 .. max_j]) at Chebyshev distance r of (ci, cj)
+            """
+            if r == 0:
+                yield ci, cj
+                return
+            j_range: range = range(max(cj - r, 0), min(cj + r, max_j) + 1)
+            for i in [ci - r, ci + r]:
+                if 0 <= i <= max_i:
+                    for j in j_range:
+                        yield i, j
+            i_range: range = range(max(ci - r + 1, 0), min(ci + r - 1, max_i) + 1)
+            for j in [cj - r, cj + r]:
+                if 0 <= j <= max_j:
+                    for i in i_range:
+                        yield i, j
+
+    def __init__(self, resolution: Decimal = Decimal(10)):
         self._page_number: int = -1
+        self._resolution: Decimal = resolution
         self._grid_per_page: typing.Dict[int, FreeSpaceFinder.Grid] = {}
 
     @staticmethod
     def find_free_space_for_page(
-        file: Path, page_number: int, desired_rectangle: Rectangle
+        file: Path,
+        page_number: int,
+        desired_rectangle: Rectangle,
+        resolution: Decimal = Decimal(10),
     ) -> typing.Optional[Rectangle]:
         """
         This function returns the nearest (euclidean distance)
         empty Rectangle that is at least as wide and tall as the
         desired Rectangle.
+        The Page is divided in cells of resolution x resolution (user space units),
+        a smaller resolution is more precise, but takes (a bit) longer.
         If no such Rectangle exists, this method returns None.
         """
-        l: FreeSpaceFinder = FreeSpaceFinder()
+        l: FreeSpaceFinder = FreeSpaceFinder(resolution)
         with open(file, "rb") as pdf_file_handle:
             PDF.loads(pdf_file_handle, [l])  # type: ignore [arg-type]
         return l.get_free_space_for_page(page_number, desired_rectangle)
@@ -144,15 +209,15 @@ class FreeSpaceFinder(EventListener):
             self._grid_per_page[self._page_number] = FreeSpaceFinder.Grid(
                 event.get_page().get_page_info().get_width() or Decimal(0),
                 event.get_page().get_page_info().get_height() or Decimal(0),
-                Decimal(10),
+                self._resolution,
             )
 
         # ChunkOfTextRenderEvent
         if isinstance(event, ChunkOfTextRenderEvent):
             assert isinstance(event, ChunkOfTextRenderEvent)
-            bounding_box_001: typing.Optional[
-                Rectangle
-            ] = event.get_previous_layout_box()
+            bounding_box_001: typing.Optional[Rectangle] = (
+                event.get_previous_layout_box()
+            )
             if bounding_box_001 is not None:
                 self._grid_per_page[self._page_number]._mark_as_unavailable(
                     bounding_box_001
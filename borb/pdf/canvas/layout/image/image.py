@@ -114,6 +114,10 @@ class Image(LayoutElement):
             self._height,
         )
 
+    def _get_min_content_width(self) -> Decimal:
+        # the width of an Image does not depend on the available space
+        return self._get_max_content_width()
+
     def _paint_content_box(self, page: Page, bounding_box: Rectangle):
 
         # add image to resources
@@ -383,6 +383,68 @@ class LayoutElement:
     def _paint_content_box(self, page: "Page", content_box: Rectangle) -> None:  # type: ignore[name-defined]
         pass
 
+    def _get_max_content_width(self) -> Decimal:
+        """
+        This function returns the maximum width of the content box of this LayoutElement,
+        e.g. the width of its content box when (practically) unlimited space is available
+        """
+        return self._get_content_box(
+            Rectangle(Decimal(0), Decimal(0), Decimal(2048), Decimal(2048))
+        ).get_width()
+
+    def _get_min_content_width(self) -> Decimal:
+        """
+        This function returns the minimum width of the content box of this LayoutElement,
+        e.g. the width of the narrowest content box in which its content does not overflow.
+        This (default) implementation performs a binary search, laying out the content at different widths.
+        Implementations of LayoutElement that are able to determine this width directly ought to override this method.
+        """
+        max_width: Decimal = self._get_max_content_width()
+        upper_bound: Decimal = max_width
+        lower_bound: Decimal = Decimal(1)
+        min_width: typing.Optional[Decimal] = None
+        while abs(upper_bound - lower_bound) > 1:
+            midpoint: Decimal = (upper_bound + lower_bound) / 2
+            try:
+                w: Decimal = self._get_content_box(
+                    Rectangle(Decimal(0), Decimal(0), midpoint, Decimal(2048))
+                ).get_width()
+                min_width = w
+                if w > midpoint:
+                    lower_bound = midpoint
+                else:
+                    upper_bound = midpoint
+            except:
+                lower_bound = midpoint
+                continue
+        return min_width if min_width is not None else max_width
+
+    def _get_horizontal_padding_and_border_width(self) -> Decimal:
+        w: Decimal = self._padding_left + self._padding_right
+        if self._border_left:
+            w += self._border_width
+        if self._border_right:
+            w += self._border_width
+        return w
+
+    def _get_max_width(self) -> Decimal:
+        """
+        This function returns the maximum width of this LayoutElement (content box, padding and borders)
+        """
+        return (
+            self._get_max_content_width()
+            + self._get_horizontal_padding_and_border_width()
+        )
+
+    def _get_min_width(self) -> Decimal:
+        """
+        This function returns the minimum width of this LayoutElement (content box, padding and borders)
+        """
+        return (
+            self._get_min_content_width()
+            + self._get_horizontal_padding_and_border_width()
+        )
+
     def _get_border_outline(
         self, border_box: Rectangle
     ) -> typing.List[typing.Optional[typing.Tuple[Decimal, Decimal]]]:
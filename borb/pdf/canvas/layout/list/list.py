@@ -163,6 +163,16 @@ class List(LayoutElement):
             max_y - min_y,
         )
 
+    def _get_max_content_width(self) -> Decimal:
+        return self._bullet_margin + max(
+            [Decimal(0)] + [e._get_max_width() for e in self._items]
+        )
+
+    def _get_min_content_width(self) -> Decimal:
+        return self._bullet_margin + max(
+            [Decimal(0)] + [e._get_min_width() for e in self._items]
+        )
+
     def _paint_content_box(self, page: "Page", available_space: Rectangle) -> None:
         previous_layout_box: typing.Optional[Rectangle] = None
         for index, e in enumerate(self._items):
@@ -123,6 +123,7 @@ class SingleColumnLayoutWithOverflow(SingleColumnLayout):
             for x in t0._content
             if all([y[0] <= best_row_for_split for y in x._table_coordinates])
         ]
+        t0._rebuild_index()
         SingleColumnLayoutWithOverflow._prepare_table_for_relayout(t0)
 
         # second half of split
@@ -137,6 +138,7 @@ class SingleColumnLayoutWithOverflow(SingleColumnLayout):
             tc._table_coordinates = [
                 (y - best_row_for_split - 1, x) for y, x in tc._table_coordinates
             ]
+        t1._rebuild_index()
         SingleColumnLayoutWithOverflow._prepare_table_for_relayout(t1)
 
         # return
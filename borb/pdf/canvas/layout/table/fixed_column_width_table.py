@@ -135,6 +135,40 @@ class FixedColumnWidthTable(Table):
         # return
         return [[(x, y) for y in grid_y_to_page_y] for x in grid_x_to_page_x]
 
+    def _get_max_content_width(self) -> Decimal:
+        return self._get_width_to_fit_table_cells(
+            [e._get_max_width() for e in self._content]
+        )
+
+    def _get_min_content_width(self) -> Decimal:
+        return self._get_width_to_fit_table_cells(
+            [e._get_min_width() for e in self._content]
+        )
+
+    def _get_width_to_fit_table_cells(
+        self, table_cell_widths: typing.List[Decimal]
+    ) -> Decimal:
+        # every TableCell ought to fit within (the fraction of the width taken up by) its columns
+        # if all columns have width 0, every column is given an equal share of the width
+        column_widths: typing.List[Decimal] = self._column_widths
+        total_column_width: Decimal = sum(column_widths, Decimal(0))
+        if total_column_width == 0:
+            column_widths = [Decimal(1) for _ in range(0, self._number_of_columns)]
+            total_column_width = Decimal(self._number_of_columns)
+        w: Decimal = Decimal(0)
+        for e, table_cell_width in zip(self._content, table_cell_widths):
+            columns: typing.Set[int] = set([p[1] for p in e._table_coordinates])
+            fraction: Decimal = (
+                sum(
+                    [column_widths[x] for x in columns if x < self._number_of_columns],
+                    Decimal(0),
+                )
+                / total_column_width
+            )
+            if fraction > 0:
+                w = max(w, table_cell_width / fraction)
+        return w
+
     def _get_content_box(self, available_space: Rectangle) -> Rectangle:
 
         # fill table
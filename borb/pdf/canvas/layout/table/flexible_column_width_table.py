@@ -128,10 +128,9 @@ class FlexibleColumnWidthTable(Table):
         # return
         return max(widths)
 
-    def _get_grid_coordinates(
+    def _get_min_and_max_column_widths(
         self,
-        available_space: Rectangle,  # type: ignore[name-defined]
-    ) -> typing.List[typing.List[typing.Tuple[Decimal, Decimal]]]:
+    ) -> typing.Tuple[typing.List[Decimal], typing.List[Decimal]]:
         # 1.    Calculate the minimum content width (MCW) of each cell: the formatted content may span any number of lines but may not overflow the cell box.
         #       If the specified 'width' (W) of the cell is greater than MCW, W is the minimum cell width.
         #       A value of 'auto' means that MCW is the minimum cell width.
@@ -139,7 +138,7 @@ class FlexibleColumnWidthTable(Table):
         #       Also, calculate the "maximum" cell width of each cell:
         #       formatting the content without breaking lines other than where explicit line breaks occur.
         for t in self._content:
-            t._calculate_min_and_max_layout_box()
+            t._calculate_min_and_max_width()
 
         # 2.    For each column, determine a maximum and minimum column width from the cells that span only that column.
         #       The minimum is that required by the cell with the largest minimum cell width (or the column 'width', whichever is larger).
@@ -184,6 +183,34 @@ class FlexibleColumnWidthTable(Table):
         #       so that together they are at least as wide as the column group's 'width'.
         #       This gives a maximum and minimum width for each column.
 
+        # return
+        return min_column_widths, max_column_widths
+
+    def _get_max_content_width(self) -> Decimal:
+        # every (expandable) column is widened (1 unit at a time) until it reaches its maximum width
+        min_column_widths, max_column_widths = self._get_min_and_max_column_widths()
+        return Decimal(
+            math.ceil(
+                sum(
+                    [
+                        w + math.ceil(max(max_column_widths[i] - w, Decimal(0)))
+                        for i, w in enumerate(min_column_widths)
+                    ]
+                )
+            )
+        )
+
+    def _get_min_content_width(self) -> Decimal:
+        min_column_widths, _ = self._get_min_and_max_column_widths()
+        return Decimal(math.ceil(sum(min_column_widths)))
+
+    def _get_grid_coordinates(
+        self,
+        available_space: Rectangle,  # type: ignore[name-defined]
+    ) -> typing.List[typing.List[typing.Tuple[Decimal, Decimal]]]:
+        # 1 - 4 (see _get_min_and_max_column_widths)
+        min_column_widths, max_column_widths = self._get_min_and_max_column_widths()
+
         # 5. calculate column width based on min, max and bounding box
         # start by assigning each column its minimum width
         column_widths: typing.List[Decimal] = [x for x in min_column_widths]
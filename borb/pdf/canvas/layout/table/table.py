@@ -5,7 +5,6 @@
 This class represents a common base for all LayoutElement implementations
 that attempt to represent tabular data.
 """
-import copy
 import typing
 from decimal import Decimal
 
@@ -148,47 +147,28 @@ class TableCell(LayoutElement):
     def _paint_content_box(self, page: "Page", available_space: Rectangle) -> None:
         self._layout_element.paint(page, available_space)
 
+    def _get_max_content_width(self) -> Decimal:
+        return self._layout_element._get_max_width()
+
+    def _get_min_content_width(self) -> Decimal:
+        return self._layout_element._get_min_width()
+
+    def _calculate_min_and_max_width(self) -> None:
+        self._min_width = self._get_min_width()
+        self._max_width = self._get_max_width()
+
     def _calculate_min_and_max_layout_box(self) -> None:
-        lbox_max: Rectangle = self.get_layout_box(
-            Rectangle(Decimal(0), Decimal(0), Decimal(2048), Decimal(2048))
-        )
-        upper_bound_lbox_min: Rectangle = copy.deepcopy(lbox_max)
-        lower_bound_lbox_min: Rectangle = copy.deepcopy(
-            Rectangle(
-                lbox_max.get_x(), lbox_max.get_y(), Decimal(1), lbox_max.get_height()
-            )
-        )
-        lbox_min: typing.Optional[Rectangle] = None
-        while (
-            abs(upper_bound_lbox_min.get_width() - lower_bound_lbox_min.get_width()) > 1
-        ):
-            midpoint_lbox_min: Rectangle = Rectangle(
-                upper_bound_lbox_min.get_x(),
-                upper_bound_lbox_min.get_y(),
-                (upper_bound_lbox_min.get_width() + lower_bound_lbox_min.get_width())
-                / 2,
-                upper_bound_lbox_min.get_height(),
-            )
-            try:
-                lbox_tmp: Rectangle = self.get_layout_box(midpoint_lbox_min)
-                lbox_min = lbox_tmp
-                if lbox_tmp.get_width() > midpoint_lbox_min.get_width():
-                    lower_bound_lbox_min = midpoint_lbox_min
-                else:
-                    upper_bound_lbox_min = midpoint_lbox_min
-            except:
-                lower_bound_lbox_min = midpoint_lbox_min
-                continue
-
-        # set properties
-        if lbox_min is None:
-            lbox_min = lbox_max
-        self._min_height = lbox_max.get_height()
-        self._min_width = lbox_min.get_width()
-        self._max_height = lbox_min.get_height()
-        self._max_width = lbox_max.get_width()
+        self._calculate_min_and_max_width()
+        assert self._min_width is not None
+        assert self._max_width is not None
 
-        # return
+        # the TableCell is at its shortest when it is at its widest (and vice versa)
+        self._min_height = self.get_layout_box(
+            Rectangle(Decimal(0), Decimal(0), self._max_width, Decimal(2048))
+        ).get_height()
+        self._max_height = self.get_layout_box(
+            Rectangle(Decimal(0), Decimal(0), self._min_width, Decimal(2048))
+        ).get_height()
 
 
 class Table(LayoutElement):
@@ -253,6 +233,13 @@ class Table(LayoutElement):
         self._number_of_columns = number_of_columns
         self._content: typing.List[TableCell] = []
 
+        # index of the TableCell objects (by grid coordinate, row and column)
+        self._cells_by_coordinates: typing.Dict[typing.Tuple[int, int], TableCell] = {}
+        self._cells_by_row: typing.Dict[int, typing.List[TableCell]] = {}
+        self._cells_by_column: typing.Dict[int, typing.List[TableCell]] = {}
+        self._occupied_columns_by_row: typing.Dict[int, typing.List[int]] = {}
+        self._first_incomplete_row: int = 0
+
     def set_background_color_on_all_cells(self, background_color: Color) -> "Table":
         """
         This method sets the background Color on all TableCell objects in this Table
@@ -413,27 +400,49 @@ class Table(LayoutElement):
         return self
 
     def _get_cells_at(self, row: int, column: int) -> typing.Optional[TableCell]:
-        for t in self._content:
-            if (
-                len([p for p in t._table_coordinates if p[0] == row and p[1] == column])
-                > 0
-            ):
-                return t
-        return None
+        return self._cells_by_coordinates.get((row, column), None)
 
     def _get_cells_at_column(self, column: int) -> typing.List[TableCell]:
-        out: typing.List[TableCell] = []
-        for t in self._content:
-            if len([p for p in t._table_coordinates if p[1] == column]) > 0:
-                out.append(t)
-        return out
+        return [x for x in self._cells_by_column.get(column, [])]
 
     def _get_cells_at_row(self, row: int) -> typing.List[TableCell]:
-        out: typing.List[TableCell] = []
+        return [x for x in self._cells_by_row.get(row, [])]
+
+    def _index_table_cell(self, table_cell: TableCell) -> None:
+        # add the TableCell to the index (using its _table_coordinates)
+        rows: typing.List[int] = []
+        columns: typing.List[int] = []
+        for p in table_cell._table_coordinates:
+            self._cells_by_coordinates.setdefault(p, table_cell)
+            self._occupied_columns_by_row.setdefault(p[0], []).append(p[1])
+            if p[0] not in rows:
+                rows.append(p[0])
+            if p[1] not in columns:
+                columns.append(p[1])
+        for r in rows:
+            self._cells_by_row.setdefault(r, []).append(table_cell)
+        for c in columns:
+            self._cells_by_column.setdefault(c, []).append(table_cell)
+
+        # a row is complete once (at least) _number_of_columns grid coordinates are occupied
+        while (
+            len(self._occupied_columns_by_row.get(self._first_incomplete_row, []))
+            >= self._number_of_columns
+        ):
+            self._first_incomplete_row += 1
+
+    def _rebuild_index(self) -> None:
+        """
+        This function rebuilds the index of TableCell objects,
+        it ought to be called whenever _content (or the _table_coordinates of a TableCell) is modified directly
+        """
+        self._cells_by_coordinates = {}
+        self._cells_by_row = {}
+        self._cells_by_column = {}
+        self._occupied_columns_by_row = {}
+        self._first_incomplete_row = 0
         for t in self._content:
-            if len([p for p in t._table_coordinates if p[0] == row]) > 0:
-                out.append(t)
-        return out
+            self._index_table_cell(t)
 
     def add(self, layout_element: LayoutElement) -> "Table":
         """
@@ -445,6 +454,11 @@ class Table(LayoutElement):
         if not isinstance(layout_element, TableCell):
             layout_element = TableCell(layout_element)
 
+        # check whether there is room for the new TableCell
+        assert self._first_incomplete_row < self._number_of_rows, (
+            "%s is full" % self.__class__.__name__
+        )
+
         # add content
         self._content.append(layout_element)
 
@@ -454,21 +468,11 @@ class Table(LayoutElement):
             self._font_size = inner_layout_element.get_font_size()
 
         # determine gridpoints occupied by the new TableCell
-        first_incomplete_row: int = min(
-            [
-                x
-                for x in range(0, self._number_of_rows)
-                if sum([y._col_span for y in self._get_cells_at_row(x)])
-                < self._number_of_columns
-            ]
-        )
-        # check which columns are already occupied in the current row
-        occupied_cols_in_row: typing.List[int] = []
-        for c in self._get_cells_at_row(first_incomplete_row):
-            occupied_cols_in_row.extend(
-                [x[1] for x in c._table_coordinates if x[0] == first_incomplete_row]
-            )
+        first_incomplete_row: int = self._first_incomplete_row
         # the first empty column is the lowest number that does not appear in occupied_cols_in_row
+        occupied_cols_in_row: typing.Set[int] = set(
+            self._occupied_columns_by_row.get(first_incomplete_row, [])
+        )
         first_empty_column: int = min(
             [
                 x
@@ -484,5 +488,8 @@ class Table(LayoutElement):
                     (first_incomplete_row + i, first_empty_column + j)
                 )
 
+        # update index
+        self._index_table_cell(layout_element)
+
         # return
         return self
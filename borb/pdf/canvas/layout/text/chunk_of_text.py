@@ -224,6 +224,16 @@ class ChunkOfText(LayoutElement):
             line_height,
         )
 
+    def _get_max_content_width(self) -> Decimal:
+        assert self._font_size is not None
+        return GlyphLine.from_str(
+            self._text, self._font, self._font_size
+        ).get_width_in_text_space()
+
+    def _get_min_content_width(self) -> Decimal:
+        # a ChunkOfText can not be broken into lines
+        return self._get_max_content_width()
+
     def _paint_content_box(self, page: "Page", content_box: Rectangle) -> None:
 
         # color
@@ -15,6 +15,7 @@ from borb.pdf.canvas.geometry.rectangle import Rectangle
 from borb.pdf.canvas.layout.emoji.emoji import Emoji
 from borb.pdf.canvas.layout.layout_element import Alignment
 from borb.pdf.canvas.layout.text.chunk_of_text import ChunkOfText
+from borb.pdf.canvas.layout.text.line_breaker import LineBreaker
 from borb.pdf.canvas.layout.text.line_of_text import LineOfText
 from borb.pdf.canvas.layout.text.paragraph import Paragraph
 from borb.pdf.page.page import Page
@@ -66,6 +67,7 @@ class HeterogeneousParagraph(Paragraph):
         fixed_leading: typing.Optional[Decimal] = None,
         multiplied_leading: typing.Optional[Decimal] = None,
         background_color: typing.Optional[Color] = None,
+        optimal_line_breaking: bool = False,
     ):
         super(HeterogeneousParagraph, self).__init__(
             text="",
@@ -93,14 +95,15 @@ class HeterogeneousParagraph(Paragraph):
             fixed_leading=fixed_leading,
             multiplied_leading=multiplied_leading,
             background_color=background_color,
+            optimal_line_breaking=optimal_line_breaking,
         )
         # fmt: off
         self._chunks_of_text: typing.List[typing.Union[ChunkOfText, LineOfText, Emoji, Image, str]] = chunks_of_text
         # fmt: on
 
-    def _split_to_lines_of_chunks_of_text(
-        self, available_space: Rectangle
-    ) -> typing.List[typing.List[typing.Union[ChunkOfText, Emoji, Image]]]:
+    def _get_chunks_of_text(
+        self,
+    ) -> typing.List[typing.Union[ChunkOfText, Emoji, Image]]:
 
         # build list
         initial_chunks_of_text: typing.List[
@@ -156,37 +159,71 @@ class HeterogeneousParagraph(Paragraph):
             if isinstance(e, ChunkOfText):
                 initial_chunks_of_text.append(e)
 
-        # perform initial layout (figure out where to break lines)
-        next_x: Decimal = available_space.get_x()
+        # return
+        return initial_chunks_of_text
+
+    def _get_max_content_width(self) -> Decimal:
+        # the width of the longest line, if lines are only broken at a LineBreakChunk
+        max_width: Decimal = Decimal(0)
         line_width: Decimal = Decimal(0)
-        line: typing.List[typing.Union[ChunkOfText, Emoji, Image]] = []
-        lines: typing.List[typing.List[typing.Union[ChunkOfText, Emoji, Image]]] = []
+        for e in self._get_chunks_of_text():
+            if isinstance(e, LineBreakChunk):
+                line_width = Decimal(0)
+            line_width += e._get_max_width()
+            max_width = max(max_width, line_width)
+        return max_width
+
+    def _get_min_content_width(self) -> Decimal:
+        # the width of the widest ChunkOfText (Emoji, Image)
+        return max(
+            [Decimal(0)] + [e._get_max_width() for e in self._get_chunks_of_text()]
+        )
+
+    def _split_to_lines_of_chunks_of_text(
+        self, available_space: Rectangle
+    ) -> typing.List[typing.List[typing.Union[ChunkOfText, Emoji, Image]]]:
+
+        # build list
+        initial_chunks_of_text: typing.List[
+            typing.Union[ChunkOfText, Emoji, Image]
+        ] = self._get_chunks_of_text()
+
+        # measure every element (once)
+        # fmt: off
+        elements: typing.List[typing.Optional[typing.Union[ChunkOfText, Emoji, Image]]] = []
+        widths: typing.List[typing.Optional[typing.List[Decimal]]] = []
+        # fmt: on
         for e in initial_chunks_of_text:
             w: Decimal = e.get_layout_box(
                 Rectangle(
-                    next_x,
+                    available_space.get_x(),
                     available_space.get_y(),
-                    available_space.get_width() - line_width,
+                    available_space.get_width(),
                     available_space.get_height(),
                 )
             ).get_width()
-            if (line_width + w > available_space.get_width()) or (
-                isinstance(e, LineBreakChunk)
-            ):
-                # get ready for next line
-                lines.append(copy.deepcopy(line))
-                next_x = available_space.get_x() + w
-                line_width = w
-                # fix the one element that does not fit
+            # a LineBreakChunk starts a new line
+            if isinstance(e, LineBreakChunk):
+                elements.append(None)
+                widths.append(None)
+            elements.append(e)
+            widths.append([w])
+
+        # perform initial layout (figure out where to break lines)
+        lines: typing.List[typing.List[typing.Union[ChunkOfText, Emoji, Image]]] = []
+        for line_of_pieces in LineBreaker(
+            maximum_width=available_space.get_width(),
+            optimal_fit=self._optimal_line_breaking,
+        ).break_lines(widths):
+            line: typing.List[typing.Union[ChunkOfText, Emoji, Image]] = []
+            next_x: Decimal = available_space.get_x()
+            for i, _, _ in line_of_pieces:
+                e = elements[i]
+                assert e is not None
                 assert e._previous_layout_box is not None
-                e._previous_layout_box.x = available_space.get_x()
-                line = [e]
-                continue
-            else:
-                next_x += w
-                line_width += w
+                e._previous_layout_box.x += next_x - available_space.get_x()
+                next_x += e._previous_layout_box.get_width()
                 line.append(e)
-        if len(line) > 0:
             lines.append(copy.deepcopy(line))
 
         # update ys
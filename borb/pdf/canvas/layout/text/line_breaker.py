@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This file contains the LineBreaker, which determines where a sequence of words (or other LayoutElement objects)
+needs to be broken into lines. It is used by Paragraph, HeterogeneousParagraph and LineOfText.
+"""
+import typing
+from decimal import Decimal
+
+from borb.pdf.canvas.font.font import Font
+from borb.pdf.canvas.font.glyph_line import GlyphLine
+
+# a piece of a line is (index of the word, index of its first part, index of its last part + 1)
+LinePiece = typing.Tuple[int, int, int]
+
+
+class LineBreaker:
+    """
+    This class determines where a sequence of words needs to be broken into lines of a given (maximum) width.
+    A word is represented by the widths of its parts (a word that can not be hyphenated has only one part),
+    or by None, which represents a forced line break.
+
+    Widths are measured once (by the caller) and accumulated incrementally,
+    so breaking N words into lines takes O(N) additions rather than re-measuring every potential line.
+    Words can be hyphenated lazily. The (optional) hyphenate function is only called (with the index of a word)
+    when that word does not fit on the line being built, it returns the widths of the parts of that word.
+
+    By default, lines are filled greedily (first fit).
+    Optionally, an optimal fit (in the style of Knuth and Plass) is calculated,
+    which minimizes the sum of the squared white space at the end of every line (except the last one).
+    """
+
+    def __init__(
+        self,
+        maximum_width: Decimal,
+        space_width: Decimal = Decimal(0),
+        hyphen_width: Decimal = Decimal(0),
+        optimal_fit: bool = False,
+        hyphenate: typing.Optional[typing.Callable[[int], typing.List[Decimal]]] = None,
+    ):
+        self._maximum_width: Decimal = maximum_width
+        self._hyphenate: typing.Optional[
+            typing.Callable[[int], typing.List[Decimal]]
+        ] = hyphenate
+        self._space_width: Decimal = space_width
+        self._hyphen_width: Decimal = hyphen_width
+        self._optimal_fit: bool = optimal_fit
+
+        # cost of breaking a line at a hyphen (when calculating an optimal fit)
+        self._hyphen_penalty: float = (float(maximum_width) / 10) ** 2
+
+    @staticmethod
+    def get_widths(
+        words: typing.List[str], font: Font, font_size: Decimal
+    ) -> typing.List[Decimal]:
+        """
+        This function returns the width (in text space) of each word, measuring every distinct word only once
+        """
+        widths: typing.Dict[str, Decimal] = {}
+        out: typing.List[Decimal] = []
+        for w in words:
+            width: typing.Optional[Decimal] = widths.get(w)
+            if width is None:
+                width = GlyphLine.from_str(w, font, font_size).get_width_in_text_space()
+                widths[w] = width
+            out.append(width)
+        return out
+
+    def _fits(self, width: Decimal) -> bool:
+        # checking with 0 is not a great idea due to rounding errors
+        # so, as a pre-emptive measure, we round the number to 2 digits
+        return round(self._maximum_width - width, 2) >= Decimal(0)
+
+    def _break_lines_greedy(
+        self, words: typing.List[typing.Optional[typing.List[Decimal]]]
+    ) -> typing.List[typing.List[LinePiece]]:
+        lines: typing.List[typing.List[LinePiece]] = []
+        line_width: Decimal = Decimal(0)
+        for i, parts in enumerate(words):
+
+            # forced line break
+            if parts is None:
+                lines.append([])
+                line_width = Decimal(0)
+                continue
+
+            # start the first line
+            if len(lines) == 0:
+                lines.append([])
+
+            # IF there is space left over, we add the word to the line being built
+            word_width: Decimal = sum(parts, Decimal(0))
+            potential_width: Decimal = line_width
+            if len(lines[-1]) > 0:
+                potential_width += self._space_width
+            if self._fits(potential_width + word_width):
+                lines[-1].append((i, 0, len(parts)))
+                line_width = potential_width + word_width
+                continue
+
+            # (ELSE) there is no more room on the line for this word,
+            # BUT perhaps we can hyphenate the word
+            if self._hyphenate is not None:
+                parts = self._hyphenate(i)
+            split_index: int = 0
+            for j in range(0, len(parts) - 1):
+                potential_width += parts[j]
+                # fmt: off
+                if round(self._maximum_width - potential_width - self._hyphen_width, 2) > Decimal(0):
+                    split_index = j + 1
+                else:
+                    break
+                # fmt: on
+
+            # no sensible split was found
+            # the word goes on the next line (or on the current line, if it is still empty)
+            if split_index == 0:
+                if len(lines[-1]) > 0:
+                    lines.append([])
+                lines[-1].append((i, 0, len(parts)))
+                line_width = word_width
+                continue
+
+            # break the word according to the hyphenation
+            lines[-1].append((i, 0, split_index))
+            lines.append([(i, split_index, len(parts))])
+            line_width = sum(parts[split_index:], Decimal(0))
+
+        # return
+        return lines
+
+    def _break_segment_optimally(
+        self,
+        words: typing.List[typing.Optional[typing.List[Decimal]]],
+        word_indices: typing.List[int],
+    ) -> typing.List[typing.List[LinePiece]]:
+
+        # build fragments (one per part of every word)
+        # every word is a potential line break, so every word is hyphenated
+        # fmt: off
+        fragment_word: typing.List[int] = []
+        fragment_part: typing.List[int] = []
+        fragment_width: typing.List[Decimal] = []
+        fragment_glue: typing.List[Decimal] = []
+        fragment_ends_word: typing.List[bool] = []
+        for i in word_indices:
+            parts: typing.List[Decimal] = words[i] if self._hyphenate is None else self._hyphenate(i)  # type: ignore[assignment]
+            for j, w in enumerate(parts):
+                fragment_word.append(i)
+                fragment_part.append(j)
+                fragment_width.append(w)
+                fragment_glue.append(self._space_width if j == 0 else Decimal(0))
+                fragment_ends_word.append(j == len(parts) - 1)
+        # fmt: on
+
+        # best[b] is the minimal cost of breaking fragments[0:b] into lines
+        n: int = len(fragment_width)
+        best: typing.List[typing.Optional[float]] = [None] * (n + 1)
+        previous_break: typing.List[int] = [0] * (n + 1)
+        best[0] = 0
+        for i in range(0, n):
+            best_i: typing.Optional[float] = best[i]
+            if best_i is None:
+                continue
+            width: Decimal = Decimal(0)
+            found_break: bool = False
+            for b in range(i + 1, n + 1):
+                width += fragment_width[b - 1]
+                if b - 1 > i:
+                    width += fragment_glue[b - 1]
+
+                # check whether the line can be broken after fragment b - 1
+                is_hyphen_break: bool = not fragment_ends_word[b - 1]
+                line_width: Decimal = width
+                if is_hyphen_break:
+                    line_width += self._hyphen_width
+
+                # determine the cost of this line
+                cost: float = 0
+                if self._fits(line_width):
+                    if b < n:
+                        cost = float(self._maximum_width - line_width) ** 2
+                    if is_hyphen_break:
+                        cost += self._hyphen_penalty
+                elif not found_break:
+                    # a line that holds a single word (or part of a word) that does not fit
+                    cost = (
+                        float(line_width - self._maximum_width) ** 2
+                        + float(self._maximum_width) ** 2
+                    )
+                else:
+                    break
+                found_break = True
+
+                # keep the best way of arriving at b
+                best_b: typing.Optional[float] = best[b]
+                if best_b is None or best_i + cost < best_b:
+                    best[b] = best_i + cost
+                    previous_break[b] = i
+
+        # backtrack
+        breaks: typing.List[int] = [n]
+        while breaks[-1] > 0:
+            breaks.append(previous_break[breaks[-1]])
+        breaks.reverse()
+
+        # convert fragments to line pieces
+        lines: typing.List[typing.List[LinePiece]] = []
+        for i in range(0, len(breaks) - 1):
+            line: typing.List[LinePiece] = []
+            for f in range(breaks[i], breaks[i + 1]):
+                if len(line) > 0 and line[-1][0] == fragment_word[f]:
+                    line[-1] = (line[-1][0], line[-1][1], fragment_part[f] + 1)
+                else:
+                    line.append(
+                        (fragment_word[f], fragment_part[f], fragment_part[f] + 1)
+                    )
+            lines.append(line)
+        return lines
+
+    def _break_lines_optimally(
+        self, words: typing.List[typing.Optional[typing.List[Decimal]]]
+    ) -> typing.List[typing.List[LinePiece]]:
+
+        # split into segments (on forced line breaks)
+        segments: typing.List[typing.List[int]] = [[]]
+        for i, parts in enumerate(words):
+            if parts is None:
+                segments.append([])
+            else:
+                segments[-1].append(i)
+
+        # break each segment
+        # a forced line break always starts a new (possibly empty) line
+        lines: typing.List[typing.List[LinePiece]] = []
+        for i, s in enumerate(segments):
+            if len(s) == 0:
+                if i > 0:
+                    lines.append([])
+                continue
+            lines.extend(self._break_segment_optimally(words, s))
+        return lines
+
+    def break_lines(
+        self, words: typing.List[typing.Optional[typing.List[Decimal]]]
+    ) -> typing.List[typing.List[LinePiece]]:
+        """
+        This function breaks a sequence of words into lines.
+        Each word is given by the widths of its parts (or None to force a line break).
+        This function returns the lines, each line being a list of (word index, first part, last part + 1) tuples.
+        A line that ends in the middle of a word needs to be hyphenated.
+        """
+        lines: typing.List[typing.List[LinePiece]] = (
+            self._break_lines_optimally(words)
+            if self._optimal_fit
+            else self._break_lines_greedy(words)
+        )
+
+        # last-minute cleanup
+        while len(lines) > 0 and len(lines[-1]) == 0:
+            lines.pop(len(lines) - 1)
+
+        # return
+        return lines
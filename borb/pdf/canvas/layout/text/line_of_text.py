@@ -21,10 +21,10 @@ from decimal import Decimal
 
 from borb.pdf.canvas.color.color import Color, HexColor
 from borb.pdf.canvas.font.font import Font
-from borb.pdf.canvas.font.glyph_line import GlyphLine
 from borb.pdf.canvas.geometry.rectangle import Rectangle
 from borb.pdf.canvas.layout.layout_element import Alignment
 from borb.pdf.canvas.layout.text.chunk_of_text import ChunkOfText
+from borb.pdf.canvas.layout.text.line_breaker import LineBreaker
 
 
 class LineOfText(ChunkOfText):
@@ -155,15 +155,22 @@ class LineOfText(ChunkOfText):
         if self._fixed_leading is not None:
             line_height += self._fixed_leading
 
+        # measure every word (and the space character) once
+        words: typing.List[str] = self._text.split(" ")
+        word_widths: typing.List[Decimal] = LineBreaker.get_widths(
+            words + [" "], self._font, self._font_size
+        )
+        space_width: Decimal = word_widths.pop(-1)
+
         # start calculating the remaining space per whitespace
-        text_width: Decimal = GlyphLine.from_str(
-            self._text, self._font, self._font_size
-        ).get_width_in_text_space()
+        text_width: Decimal = sum(word_widths, Decimal(0)) + space_width * (
+            len(words) - 1
+        )
         remaining_space: Decimal = available_space.get_width() - text_width
 
         # calculate how much "extra space" we have for every whitespace character
         remaining_space_per_whitespace: Decimal = Decimal(0)
-        number_of_whitespaces: int = sum([1 for x in self._text if x == " "])
+        number_of_whitespaces: int = len(words) - 1
         if number_of_whitespaces > 0:
             remaining_space_per_whitespace = remaining_space / number_of_whitespaces
 
@@ -177,13 +184,13 @@ class LineOfText(ChunkOfText):
                 multiplied_leading=self._multiplied_leading,
                 fixed_leading=self._fixed_leading,
             )
-            for x in self._text.split(" ")
+            for x in words
         ]
         chunks_of_text[-1]._text = chunks_of_text[-1]._text[:-1]
 
         # paint
         prev_x: Decimal = available_space.get_x()
-        for c in chunks_of_text:
+        for c, w in zip(chunks_of_text, word_widths):
             cbox: Rectangle = Rectangle(
                 prev_x,
                 available_space.get_y(),
@@ -191,5 +198,5 @@ class LineOfText(ChunkOfText):
                 line_height,
             )
             c.paint(page, cbox)
-            prev_x += c._get_content_box(available_space).get_width()
+            prev_x += w + space_width
             prev_x += remaining_space_per_whitespace
@@ -11,10 +11,10 @@ from typing import Union
 
 from borb.pdf.canvas.color.color import Color, HexColor
 from borb.pdf.canvas.font.font import Font
-from borb.pdf.canvas.font.glyph_line import GlyphLine
 from borb.pdf.canvas.geometry.rectangle import Rectangle
 from borb.pdf.canvas.layout.hyphenation.hyphenation import Hyphenation
 from borb.pdf.canvas.layout.layout_element import Alignment
+from borb.pdf.canvas.layout.text.line_breaker import LineBreaker, LinePiece
 from borb.pdf.canvas.layout.text.line_of_text import LineOfText
 from borb.pdf.page.page import Page
 
@@ -60,6 +60,7 @@ class Paragraph(LineOfText):
         multiplied_leading: typing.Optional[Decimal] = None,
         background_color: typing.Optional[Color] = None,
         hyphenation: typing.Optional[Hyphenation] = None,
+        optimal_line_breaking: bool = False,
     ):
         super().__init__(
             text=text,
@@ -93,6 +94,7 @@ class Paragraph(LineOfText):
         self._respect_newlines_in_text = respect_newlines_in_text
         self._respect_spaces_in_text = respect_spaces_in_text
         self._hyphenation = hyphenation
+        self._optimal_line_breaking = optimal_line_breaking
 
         # alignment
         assert text_alignment in [
@@ -108,7 +110,20 @@ class Paragraph(LineOfText):
         self._previous_attr_hash_for_layout: typing.Optional[int] = None
         self._previous_lines_of_text: typing.Optional[typing.List[LineOfText]] = None
 
-    def _split_text(self, bounding_box: Rectangle) -> typing.List[str]:
+    def _split_into_words(
+        self,
+    ) -> typing.Tuple[
+        typing.List[typing.List[str]],
+        typing.List[typing.Optional[typing.List[Decimal]]],
+        Decimal,
+        Decimal,
+    ]:
+        """
+        This function splits the text of this Paragraph into words.
+        It returns the parts of each word, the width of each part (None for a newline that needs to be respected),
+        the width of a space and the width of a hyphen. Every word has a single part,
+        words are only split (at potential hyphenation points) when needed (see _get_hyphenate_function)
+        """
         # asserts
         assert self._font_size is not None
 
@@ -140,95 +155,133 @@ class Paragraph(LineOfText):
                 words[-1] += c
         words = [x for x in words if len(x) > 0]
 
-        # build lines using words
-        lines_of_text = []
-        for i, w in enumerate(words):
+        # measure every word once
+        word_widths: typing.List[Decimal] = LineBreaker.get_widths(
+            words + [" ", "-"],
+            self._font,
+            self._font_size,
+        )
+        hyphen_width: Decimal = word_widths.pop(-1)
+        space_width: Decimal = word_widths.pop(-1)
+        word_parts: typing.List[typing.List[str]] = [[w] for w in words]
+        widths: typing.List[typing.Optional[typing.List[Decimal]]] = [
+            [x] for x in word_widths
+        ]
 
-            # split on \n
-            if w == "\n" and self._respect_newlines_in_text:
-                lines_of_text.append("")
-                continue
+        # split on \n
+        if self._respect_newlines_in_text:
+            widths = [None if w == "\n" else x for w, x in zip(words, widths)]
 
-            # build line of text to check if it fits the bounding box
-            potential_text = lines_of_text[-1] if len(lines_of_text) > 0 else ""
-            if len(potential_text) != 0 and not self._respect_spaces_in_text:
-                potential_text += " "
-            potential_text += w
-
-            # check the remaining space in the box
-            # checking with 0 is not a great idea due to rounding errors
-            # so, as a pre-emptive measure, we round the number to 2 digits
-            # fmt: off
-            potential_width = GlyphLine.from_str(potential_text, self._font, self._font_size).get_width_in_text_space()
-            remaining_space_in_box: Decimal = round(bounding_box.width - potential_width, 2)
-            # fmt: on
-
-            # IF there is space left over, we add the word to the lines of text being built
-            if remaining_space_in_box >= Decimal(0):
-                if len(lines_of_text) == 0:
-                    lines_of_text.append(w)
-                else:
-                    if len(lines_of_text[-1]) > 0 and not self._respect_spaces_in_text:
-                        lines_of_text[-1] += " "
-                    lines_of_text[-1] += w
+        # return
+        return word_parts, widths, space_width, hyphen_width
 
-            # (ELSE) there is no more room in the box for this word,
-            # BUT perhaps we can hyphenate the word
-            else:
-                # if no hyphenation class is provided, we can't hyphenate
-                if self._hyphenation is None:
-                    lines_of_text.append(w)
-                    continue
-
-                # if we have to respect the spacing in the text, we don't hyphenate
-                if self._respect_spaces_in_text:
-                    lines_of_text.append(w)
-                    continue
-
-                # calculate potential hyphenation breaks
-                # if the word can not be broken into parts, we can't hyphenate
-                hyphenated_word_parts = self._hyphenation.hyphenate(w).split(chr(173))
-                if len(hyphenated_word_parts) == 1:
-                    lines_of_text.append(w)
-                    continue
-
-                potential_text = lines_of_text[-1] if len(lines_of_text) > 0 else ""
-                if len(potential_text) != 0 and not self._respect_spaces_in_text:
-                    potential_text += " "
-
-                # check where the text can be split, in order to fit in the bounding box
-                hyphenation_split_index: int = 0
-                for i in range(1, len(hyphenated_word_parts)):
-                    # fmt: off
-                    potential_text_after_hyphenation = potential_text + "".join([x for x in hyphenated_word_parts[0:i]]) + "-"
-                    potential_width = GlyphLine.from_str(potential_text_after_hyphenation, self._font, self._font_size).get_width_in_text_space()
-                    remaining_space_in_box = round(bounding_box.width - potential_width, 2)
-                    # fmt: on
-                    if remaining_space_in_box > Decimal(0):
-                        hyphenation_split_index = i
-                    else:
-                        break
-
-                # no sensible split was found
-                if hyphenation_split_index == 0:
-                    lines_of_text.append(w)
-                    continue
-
-                # break the text according to the hyphenation
-                # fmt: off
-                if len(lines_of_text[-1]) > 0 and not self._respect_spaces_in_text:
-                    lines_of_text[-1] += " "
-                lines_of_text[-1] += "".join([x for x in hyphenated_word_parts[0:hyphenation_split_index]]) + "-"
-                lines_of_text.append("".join([x for x in hyphenated_word_parts[hyphenation_split_index:]]))
-                # fmt: on
-
-        # last-minute cleanup
-        while len(lines_of_text) > 0 and lines_of_text[-1] == "":
-            lines_of_text.pop(len(lines_of_text) - 1)
+    def _get_hyphenate_function(
+        self,
+        word_parts: typing.List[typing.List[str]],
+        widths: typing.List[typing.Optional[typing.List[Decimal]]],
+    ) -> typing.Optional[typing.Callable[[int], typing.List[Decimal]]]:
+        """
+        This function returns a function that splits the i-th word into parts (at potential hyphenation points),
+        updating word_parts and widths, and returning the width of each part.
+        Every distinct word is hyphenated (and its parts measured) at most once.
+        This function returns None if the text of this Paragraph is not hyphenated
+        """
+        # we only hyphenate if a hyphenation class is provided, and we don't have to respect the spacing in the text
+        if self._hyphenation is None or self._respect_spaces_in_text:
+            return None
+        hyphenation: Hyphenation = self._hyphenation
+        hyphenated_words: typing.Dict[
+            str, typing.Tuple[typing.List[str], typing.List[Decimal]]
+        ] = {}
+
+        def _hyphenate(i: int) -> typing.List[Decimal]:
+            word: str = "".join(word_parts[i])
+            parts_and_widths: typing.Optional[
+                typing.Tuple[typing.List[str], typing.List[Decimal]]
+            ] = hyphenated_words.get(word)
+            if parts_and_widths is None:
+                parts: typing.List[str] = hyphenation.hyphenate(word).split(chr(173))
+                part_widths: typing.List[Decimal] = widths[i]  # type: ignore[assignment]
+                if len(parts) > 1:
+                    part_widths = LineBreaker.get_widths(parts, self._font, self._font_size)  # type: ignore[arg-type]
+                parts_and_widths = (parts, part_widths)
+                hyphenated_words[word] = parts_and_widths
+            word_parts[i] = parts_and_widths[0]
+            widths[i] = parts_and_widths[1]
+            return parts_and_widths[1]
+
+        return _hyphenate
+
+    def _split_text(self, bounding_box: Rectangle) -> typing.List[str]:
+
+        # split into words
+        word_parts, widths, space_width, hyphen_width = self._split_into_words()
+
+        # build lines using words (which are hyphenated when they do not fit)
+        lines: typing.List[typing.List[LinePiece]] = LineBreaker(
+            maximum_width=bounding_box.width,
+            space_width=Decimal(0) if self._respect_spaces_in_text else space_width,
+            hyphen_width=hyphen_width,
+            optimal_fit=self._optimal_line_breaking,
+            hyphenate=self._get_hyphenate_function(word_parts, widths),
+        ).break_lines(widths)
+
+        # build text
+        lines_of_text: typing.List[str] = []
+        separator: str = "" if self._respect_spaces_in_text else " "
+        for line in lines:
+            lines_of_text.append(
+                separator.join(
+                    [
+                        "".join(word_parts[word_index][first_part:last_part])
+                        for word_index, first_part, last_part in line
+                    ]
+                )
+            )
+            if len(line) > 0 and line[-1][2] < len(word_parts[line[-1][0]]):
+                lines_of_text[-1] += "-"
 
         # return
         return lines_of_text if len(lines_of_text) > 0 else [""]
 
+    def _get_max_content_width(self) -> Decimal:
+        # the width of the longest line, if lines are only broken at (respected) newlines
+        _, widths, space_width, _ = self._split_into_words()
+        if self._respect_spaces_in_text:
+            space_width = Decimal(0)
+        max_width: Decimal = Decimal(0)
+        line_width: typing.Optional[Decimal] = None
+        for parts in widths + [None]:
+            if parts is None:
+                max_width = max(max_width, line_width or Decimal(0))
+                line_width = None
+                continue
+            if line_width is None:
+                line_width = sum(parts, Decimal(0))
+            else:
+                line_width += space_width + sum(parts, Decimal(0))
+        return max_width
+
+    def _get_min_content_width(self) -> Decimal:
+        # the width of the widest word (or part of a word, followed by a hyphen)
+        word_parts, widths, _, hyphen_width = self._split_into_words()
+        hyphenate = self._get_hyphenate_function(word_parts, widths)
+        # words are visited widest first, only a word that is wider than min_width needs to be hyphenated
+        # fmt: off
+        word_indices: typing.List[int] = sorted(range(0, len(widths)), key=lambda j: -sum(widths[j] or [], Decimal(0)))
+        # fmt: on
+        min_width: Decimal = Decimal(0)
+        for i in word_indices:
+            parts: typing.Optional[typing.List[Decimal]] = widths[i]
+            if parts is None or len(parts) == 0:
+                continue
+            if hyphenate is not None and parts[0] + hyphen_width > min_width:
+                parts = hyphenate(i)
+            min_width = max(
+                [min_width, parts[-1]] + [x + hyphen_width for x in parts[:-1]]
+            )
+        return min_width
+
     #
     #  RENDERING LOGIC
     #
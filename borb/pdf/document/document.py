@@ -8,6 +8,8 @@ import typing
 import zlib
 from decimal import Decimal
 
+from borb.io.read.reference.object_snapshots import ObjectSnapshots
+from borb.io.read.tokenize.buffer_io import BufferIO
 from borb.io.read.types import Decimal as bDecimal
 from borb.io.read.types import Dictionary, List, Name, Stream, String
 from borb.io.write.conformance_level import ConformanceLevel
@@ -16,6 +18,7 @@ from borb.pdf.document.name_tree import NameTree
 from borb.pdf.page.page import Page
 from borb.pdf.trailer.document_info import DocumentInfo, XMPDocumentInfo
 from borb.pdf.xref.plaintext_xref import PlainTextXREF
+from borb.pdf.xref.xref import XREF
 
 
 class Document(Dictionary):
@@ -28,6 +31,37 @@ class Document(Dictionary):
         self._conformance_level_upon_create: typing.Optional[
             ConformanceLevel
         ] = conformance_level
+        # the objects that were read (if the Document was read with incremental=True)
+        self._object_snapshots: typing.Optional[ObjectSnapshots] = None
+        # the buffer this Document was read from (if the Document was read with memory_map=True)
+        self._source: typing.Optional[BufferIO] = None
+
+    def __enter__(self) -> "Document":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        This function releases the (memory-mapped) buffer this Document was read from.
+        The (encoded) /Bytes of every Stream that was read are copied out of that buffer first,
+        so the Document can still be modified and written. Objects that were not read yet (lazy=True) can no longer be read.
+        """
+        # copies of a Document do not hold a buffer
+        source: typing.Optional[BufferIO] = getattr(self, "_source", None)
+        if source is None:
+            return
+        xref: typing.Optional[XREF] = self.get("XRef", None)
+        if xref is not None:
+            for obj in xref._cache.values():
+                if isinstance(obj, Stream) and isinstance(
+                    dict.get(obj, "Bytes"), memoryview
+                ):
+                    # the (encoded) bytes do not change, the Stream is not marked as modified
+                    dict.__setitem__(obj, Name("Bytes"), bytes(obj["Bytes"]))
+        source.close()
+        self._source = None
 
     def get_document_info(self) -> DocumentInfo:
         """
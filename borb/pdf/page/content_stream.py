@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This class represents the content stream of a Page.
+Content is appended in fragments, which are only joined (and compressed) when they are needed.
+"""
+
+import copy
+import typing
+import zlib
+
+from borb.io.read.types import Decimal as bDecimal
+from borb.io.read.types import Name, Stream
+
+
+class ContentStream(Stream):
+    """
+    This class represents the content stream of a Page.
+    Appending content (postfix operators) to a Stream used to mean re-compressing the entire Stream every time,
+    laying out a Page with many LayoutElement objects was quadratic in the size of its content stream.
+
+    A ContentStream keeps the appended content as a list of fragments.
+    The fragments are joined when /DecodedBytes is accessed,
+    and /Bytes (and /Length) are only calculated (compressed) when they are accessed (using __getitem__ or get).
+    Until then, they are not keys of this ContentStream (__contains__, keys, __iter__ and len do not list them).
+    When a Document is written, the StreamTransformer compresses /DecodedBytes itself, so the content is compressed once.
+    """
+
+    # fmt: off
+    WHITESPACE: typing.List[bytes] = [b" ", b"\t", b"\n"]
+    COMPUTED_KEYS: typing.List[str] = ["Bytes", "Length"]
+    # fmt: on
+
+    def __init__(self, decoded_bytes: bytes = b""):
+        super(ContentStream, self).__init__()
+        self._fragments: typing.List[bytes] = []
+        self._last_byte: bytes = b""
+        self[Name("DecodedBytes")] = decoded_bytes
+        self[Name("Filter")] = Name("FlateDecode")
+
+    #
+    # PRIVATE
+    #
+
+    def _join_fragments(self) -> None:
+        if len(self._fragments) == 0:
+            return
+        decoded_bytes: bytes = super(ContentStream, self).__getitem__("DecodedBytes")
+        decoded_bytes += b"".join(self._fragments)
+        super(ContentStream, self).__setitem__(Name("DecodedBytes"), decoded_bytes)
+        self._fragments = []
+
+    def _compress(self) -> None:
+        self._join_fragments()
+        # fmt: off
+        if not super(ContentStream, self).__contains__("Bytes"):
+            bts: bytes = zlib.compress(super(ContentStream, self).__getitem__("DecodedBytes"), 9)
+            super(ContentStream, self).__setitem__(Name("Bytes"), bts)
+        if not super(ContentStream, self).__contains__("Length"):
+            bts = super(ContentStream, self).__getitem__("Bytes")
+            super(ContentStream, self).__setitem__(Name("Length"), bDecimal(len(bts)))
+        # fmt: on
+
+    def _resolve_key(self, key):
+        if key in ContentStream.COMPUTED_KEYS:
+            self._compress()
+        elif key == "DecodedBytes":
+            self._join_fragments()
+        return super(ContentStream, self).__getitem__(key)
+
+    #
+    # PUBLIC
+    #
+
+    def __deepcopy__(self, memodict={}):
+        self._join_fragments()
+        out: ContentStream = ContentStream()
+        memodict[id(self)] = out
+        for k, v in self.items():
+            out[copy.deepcopy(k, memodict)] = copy.deepcopy(v, memodict)
+        return out
+
+    def __eq__(self, other):
+        self._join_fragments()
+        if isinstance(other, ContentStream):
+            other._join_fragments()
+        return super(ContentStream, self).__eq__(other)
+
+    def __getitem__(self, key):
+        return self._resolve_key(key)
+
+    def __hash__(self):
+        # Dictionary only hashes its keys (which are the same for every ContentStream)
+        self._join_fragments()
+        # /DecodedBytes may be a (mutable, unhashable) bytearray
+        decoded_bytes: bytes = bytes(
+            super(ContentStream, self).__getitem__("DecodedBytes")
+        )
+        return 31 * super(ContentStream, self).__hash__() + hash(decoded_bytes)
+
+    def __setitem__(self, key, value):
+        super(ContentStream, self).__setitem__(key, value)
+        if key == "DecodedBytes":
+            self._is_modified = True
+            self._fragments = []
+            self._last_byte = value[-1:]
+            dict.pop(self, "Bytes", None)
+            dict.pop(self, "Length", None)
+
+    def append(self, content: bytes) -> "ContentStream":
+        """
+        This function appends content (postfix operators) to this ContentStream, returning self.
+        Whitespace is inserted (if needed) to separate the content from the content that came before it.
+        :param content: the content to be appended
+        :return:        self
+        """
+        if len(content) == 0:
+            return self
+
+        # prepend whitespace if needed
+        if (
+            self._last_byte != b""
+            and self._last_byte not in ContentStream.WHITESPACE
+            and content[0:1] not in ContentStream.WHITESPACE
+        ):
+            self._fragments.append(b" ")
+        self._fragments.append(content)
+        self._last_byte = content[-1:]
+
+        # /Bytes and /Length are now outdated
+        self._is_modified = True
+        dict.pop(self, "Bytes", None)
+        dict.pop(self, "Length", None)
+
+        # return
+        return self
+
+    def get(self, key, default=None):
+        """
+        Return the value for key if key is in the dictionary, else default.
+        """
+        if key not in self and key not in ContentStream.COMPUTED_KEYS:
+            return default
+        return self._resolve_key(key)
+
+    def items(self):
+        """
+        Return a set-like object providing a view on the dictionary's items
+        """
+        self._join_fragments()
+        return super(ContentStream, self).items()
+
+    def values(self):
+        """
+        Return an object providing a view on the dictionary's values
+        """
+        self._join_fragments()
+        return super(ContentStream, self).values()
@@ -6,14 +6,14 @@
 """
 import io
 import typing
-import zlib
 from decimal import Decimal
 
 from borb.io.read.types import Decimal as bDecimal
-from borb.io.read.types import Dictionary, List, Name, Stream, String
+from borb.io.read.types import Dictionary, List, Name, String
 from borb.pdf.canvas.canvas import Canvas
 from borb.pdf.canvas.geometry.rectangle import Rectangle
 from borb.pdf.canvas.layout.annotation.annotation import Annotation
+from borb.pdf.page.content_stream import ContentStream
 from borb.pdf.page.page_info import PageInfo
 
 
@@ -269,26 +269,30 @@ class Page(Dictionary):
         )
 
         # update Page Contents (Stream)
-        self["Contents"][Name("DecodedBytes")] = redacted_canvas_content
-        self["Contents"][Name("Bytes")] = zlib.compress(
-            self["Contents"]["DecodedBytes"], 9
-        )
-        self["Contents"][Name("Length")] = bDecimal(len(self["Contents"]["Bytes"]))
+        self._get_content_stream()[Name("DecodedBytes")] = redacted_canvas_content
+
+    def _get_content_stream(self) -> ContentStream:
+        # a Page that was read from a PDF has a (plain) Stream as its content stream
+        # that Stream is replaced by a ContentStream (holding the same content, under the same Reference)
+        content_stream = self["Contents"]
+        if isinstance(content_stream, ContentStream):
+            return content_stream
+        new_content_stream: ContentStream = ContentStream(content_stream["DecodedBytes"])
+        for k, v in content_stream.items():
+            if k in ["Bytes", "DecodedBytes", "DecodeParms", "Filter", "Length"]:
+                continue
+            new_content_stream[k] = v
+        new_content_stream.set_parent(self)  # type: ignore [attr-defined]
+        if content_stream.get_reference() is not None:
+            new_content_stream.set_reference(content_stream.get_reference())
+        self[Name("Contents")] = new_content_stream
+        return new_content_stream
 
     def _initialize_page_content_stream(self) -> "Page":  # type: ignore[name-defined]
 
         # build content stream object
         if "Contents" not in self:
-            content_stream = Stream()
-            content_stream[Name("DecodedBytes")] = b""
-            content_stream[Name("Bytes")] = zlib.compress(
-                content_stream["DecodedBytes"], 9
-            )
-            content_stream[Name("Filter")] = Name("FlateDecode")
-            content_stream[Name("Length")] = bDecimal(len(content_stream["Bytes"]))
-
-            # set content of page
-            self[Name("Contents")] = content_stream
+            self[Name("Contents")] = ContentStream()
 
         # set Resources
         if "Resources" not in self:
@@ -304,19 +308,7 @@ class Page(Dictionary):
         :return:    self
         """
         self._initialize_page_content_stream()
-        content_stream = self["Contents"]
-
-        # prepend whitespace if needed
-        if len(content_stream[Name("DecodedBytes")]) != 0:
-            # fmt: off
-            decoded_bytes_last_char: str = str(content_stream["DecodedBytes"][-1:], encoding="latin1")
-            if decoded_bytes_last_char not in [" ", "\t", "\n"] and s[0] not in [" ", "\t", "\n"]:
-                content_stream[Name("DecodedBytes")] += " ".encode("latin1")
-            # fmt: on
-
-        content_stream[Name("DecodedBytes")] += s.encode("latin1")
-        content_stream[Name("Bytes")] = zlib.compress(content_stream["DecodedBytes"], 9)
-        content_stream[Name("Length")] = bDecimal(len(content_stream["Bytes"]))
+        self._get_content_stream().append(s.encode("latin1"))
 
         # return
         return self
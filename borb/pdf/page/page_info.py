@@ -7,7 +7,7 @@
 from decimal import Decimal
 from typing import Optional, Tuple
 
-from borb.io.read.types import Dictionary
+from borb.io.read.types import Dictionary, Reference
 from borb.pdf.page.page_size import PageSize
 
 
@@ -73,7 +73,13 @@ class PageInfo(Dictionary):
         kids = self._page.get_parent().get_parent().get("Kids")
         l = int(self._page.get_parent().get_parent().get("Count"))
         for i in range(0, l):
-            if kids[i] == self._page:
+            # (lazily loaded) Page objects that have not been read yet are not resolved
+            kid = list.__getitem__(kids, i)
+            if isinstance(kid, Reference):
+                if kid == self._page.get_reference():
+                    return Decimal(i)
+                continue
+            if kid == self._page:
                 return Decimal(i)
         return None
 
@@ -9,16 +9,19 @@
     PDF was standardized as ISO 32000 in 2008, and no longer requires any royalties for its implementation.
 """
 import io
+import mmap
 import typing
 from typing import List, Union
 
 from borb.io.read.any_object_transformer import (
     AnyObjectTransformer as ReadAnyObjectTransformer,
 )
+from borb.io.read.tokenize.buffer_io import BufferIO
 from borb.io.read.transformer import ReadTransformerState
 from borb.io.write.any_object_transformer import (
     AnyObjectTransformer as WriteAnyObjectTransformer,
 )
+from borb.io.write.chunked_writer import ChunkedWriter
 from borb.io.write.transformer import WriteTransformerState
 from borb.license.usage_statistics import UsageStatistics
 from borb.pdf.canvas.event.event_listener import EventListener
@@ -46,33 +49,72 @@ class PDF:
         file: Union[io.BufferedIOBase, io.RawIOBase],
         event_listeners: List[EventListener] = [],
         password: typing.Optional[str] = None,
+        memory_map: bool = False,
+        lazy: bool = False,
+        incremental: bool = False,
     ) -> Document:
         """
         This function reads a byte-stream input (which may be presented as an io.BufferedIOBase o io.RawIOBase)
         and returns a Document.
+        If memory_map is True, the file is memory-mapped (rather than read), and its bytes are shared (without copying)
+        between the tokenizer, the XREF and the /Bytes of every Stream (which will then be memoryview objects).
+        If lazy is True, objects are only read (and transformed) when they are first accessed.
+        Pages (and their event_listeners) are processed when they are accessed, rather than when the Document is read.
+        The file must remain open (or be memory-mapped) for as long as the Document is being used.
+        A memory-mapped file is unmapped when the Document is closed (see Document.close).
+        If incremental is True, the objects that are read are tracked (along with a shallow snapshot of their contents),
+        so that the Document can later be written as an incremental update (see PDF.dumps).
         """
         UsageStatistics.send_usage_statistics("PDF.loads")
-        return ReadAnyObjectTransformer().transform(
+        if memory_map:
+            # getvalue (rather than getbuffer) does not lock the io.BytesIO,
+            # so that it can still be closed while the Document is being used
+            if isinstance(file, io.BytesIO):
+                file = BufferIO(file.getvalue())
+            else:
+                file = BufferIO(
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                )
+        document: Document = ReadAnyObjectTransformer().transform(
             file,
             parent_object=None,
-            context=ReadTransformerState(password=password),
+            context=ReadTransformerState(
+                password=password, lazy=lazy, incremental=incremental
+            ),
             event_listeners=event_listeners,
         )
+        if memory_map and isinstance(document, Document):
+            document._source = file
+        return document
 
     @staticmethod
     def dumps(
         file: Union[io.BufferedIOBase, io.RawIOBase],
         document: Document,
+        incremental: bool = False,
+        use_object_streams: bool = False,
     ) -> None:
         """
         This function writes a Document to a byte-stream output (which may be presented as an io.BufferedIOBase o io.RawIOBase)
+        If incremental is True, only the objects that were modified (or added) since the Document was read are written,
+        followed by a cross-reference section that points back (/Prev) to the original one.
+        This incremental update is appended to the original bytes, the output must hold those
+        (e.g. the original file, opened in append mode). The Document must have been read with incremental=True.
+        If use_object_streams is True, (non-stream) objects are stored in (compressed) object streams,
+        and the cross-reference table is written as a (compressed) cross-reference stream (PDF 1.5).
         """
         UsageStatistics.send_usage_statistics("PDF.dumps")
+        # (small) writes are collected, and written to the file in large chunks
+        destination: ChunkedWriter = ChunkedWriter(file)
+        context: WriteTransformerState = WriteTransformerState(
+            root_object=document,
+            destination=destination,
+        )
+        context.incremental = incremental
+        context.use_object_streams = use_object_streams
         WriteAnyObjectTransformer().transform(
             object_to_transform=document,
-            context=WriteTransformerState(
-                root_object=document,
-                destination=file,
-            ),
-            destination=file,
+            context=context,
+            destination=destination,
         )
+        destination.flush()
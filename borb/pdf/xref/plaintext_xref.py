@@ -53,6 +53,7 @@ class PlainTextXREF(XREF):
             src.seek(initial_offset)
         else:
             self._seek_to_xref_token(src, tok)
+        self._start_of_xref = src.tell()
 
         # now we should be back to the start of XREF
         token = tok.next_non_comment_token()
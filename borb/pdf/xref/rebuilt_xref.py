@@ -11,6 +11,7 @@ import io
 import logging
 import typing
 
+from borb.io.read.tokenize.buffer_io import BufferIO
 from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
 from borb.io.read.types import Reference, Name
 from borb.pdf.xref.plaintext_xref import PlainTextXREF
@@ -50,7 +51,9 @@ class RebuiltXREF(PlainTextXREF):
         # get object declarations
         i: int = 0
         trailer_pos: typing.Optional[int] = None
-        bytes_in_pdf: typing.Optional[bytes] = src.read()
+        bytes_in_pdf: typing.Optional[typing.Union[bytes, memoryview]] = (
+            src.getbuffer() if isinstance(src, BufferIO) else src.read()
+        )
         assert (
             bytes_in_pdf is not None
         ), "rebuilding an XREF is only possible if all the bytes of the PDF are known"
@@ -69,7 +72,7 @@ class RebuiltXREF(PlainTextXREF):
                     "%d %d obj at %d"
                     % (bytes_in_pdf[i] - 48, bytes_in_pdf[i + 1] - 48, i)
                 )
-                self._entries.append(
+                self.add(
                     Reference(
                         object_number=bytes_in_pdf[i] - 48,
                         generation_number=bytes_in_pdf[i + 2] - 48,
@@ -98,7 +101,7 @@ class RebuiltXREF(PlainTextXREF):
                         i,
                     )
                 )
-                self._entries.append(
+                self.add(
                     Reference(
                         object_number=(bytes_in_pdf[i] - 48) * 10
                         + (bytes_in_pdf[i + 1] - 48),
@@ -127,7 +130,7 @@ class RebuiltXREF(PlainTextXREF):
                     + (bytes_in_pdf[i + 2] - 48)
                 )
                 logger.debug("%d %d obj at %d" % (obj_nr, bytes_in_pdf[i + 4] - 48, i))
-                self._entries.append(
+                self.add(
                     Reference(
                         object_number=obj_nr,
                         generation_number=bytes_in_pdf[i + 4] - 48,
@@ -6,6 +6,7 @@
     cross-reference table.
 """
 import io
+import typing
 from decimal import Decimal
 from typing import Optional, Union
 
@@ -31,6 +32,51 @@ class StreamXREF(XREF):
         super().__init__()
         self._initial_offset = initial_offset
 
+    @staticmethod
+    def get_entry_for_reference(reference: Reference) -> typing.Tuple[int, int, int]:
+        """
+        This function returns the (type, field 2, field 3) of the cross-reference stream entry of a Reference.
+        Free objects are type 0 entries, compressed objects (stored in an object stream) are type 2 entries,
+        all other objects are type 1 entries (see read).
+        """
+        if not reference.is_in_use:
+            return 0, reference.byte_offset or 0, reference.generation_number or 0
+        if reference.parent_stream_object_number is not None:
+            assert reference.index_in_parent_stream is not None
+            return (
+                2,
+                reference.parent_stream_object_number,
+                reference.index_in_parent_stream,
+            )
+        assert reference.byte_offset is not None
+        return 1, reference.byte_offset, reference.generation_number or 0
+
+    @staticmethod
+    def get_widths(
+        entries: typing.List[typing.Tuple[int, int, int]]
+    ) -> typing.List[int]:
+        """
+        This function returns the (smallest) /W array that is able to hold the given cross-reference stream entries
+        """
+        return [
+            max(1, (max([e[i] for e in entries], default=0).bit_length() + 7) // 8)
+            for i in range(0, 3)
+        ]
+
+    @staticmethod
+    def encode_entries(
+        entries: typing.List[typing.Tuple[int, int, int]], widths: typing.List[int]
+    ) -> bytes:
+        """
+        This function encodes cross-reference stream entries (big-endian, using the given /W array),
+        it is the inverse of the decoding done in read
+        """
+        out: bytearray = bytearray()
+        for e in entries:
+            for i in range(0, 3):
+                out += e[i].to_bytes(widths[i], "big")
+        return bytes(out)
+
     def read(
         self,
         io_source: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO],
@@ -46,6 +92,7 @@ class StreamXREF(XREF):
             io_source.seek(initial_offset)
         else:
             self._seek_to_xref_token(io_source, tokenizer)
+        self._start_of_xref = io_source.tell()
 
         xref_stream = tokenizer.read_object()
         assert isinstance(xref_stream, Stream)
@@ -74,6 +121,9 @@ class StreamXREF(XREF):
                 document=document,
             )
         ]
+        indirect_references_by_object_number: typing.Dict[int, Reference] = {
+            0: indirect_references[0]
+        }
 
         # check size
         assert "Size" in xref_stream
@@ -97,12 +147,13 @@ class StreamXREF(XREF):
         xref_stream = decode_stream(xref_stream)
 
         # read every range specified in /Index
+        # (the entries of every range are stored one after the other)
         xref_stream_decoded_bytes = xref_stream["DecodedBytes"]
+        bptr = 0
         for idx in range(0, len(index), 2):
             start = int(index[idx])
             length = int(index[idx + 1])
 
-            bptr = 0
             for i in range(0, length):
 
                 # object number
@@ -178,16 +229,8 @@ class StreamXREF(XREF):
                 assert pdf_indirect_reference is not None
 
                 # append
-                existing_indirect_ref = next(
-                    iter(
-                        [
-                            x
-                            for x in indirect_references
-                            if x.object_number is not None
-                            and x.object_number == Decimal(object_number)
-                        ]
-                    ),
-                    None,
+                existing_indirect_ref = indirect_references_by_object_number.get(
+                    int(object_number), None
                 )
                 ref_is_in_reading_state = (
                     existing_indirect_ref is not None
@@ -203,6 +246,9 @@ class StreamXREF(XREF):
                 if ref_is_first_encountered:
                     assert pdf_indirect_reference is not None
                     indirect_references.append(pdf_indirect_reference)
+                    indirect_references_by_object_number.setdefault(
+                        int(object_number), pdf_indirect_reference
+                    )
                 elif ref_is_in_reading_state:
                     assert existing_indirect_ref is not None
                     assert pdf_indirect_reference is not None
@@ -23,6 +23,52 @@ from borb.io.read.types import AnyPDFType, Dictionary, Name, Reference, Stream
 logger = logging.getLogger(__name__)
 
 
+class ObjectStream:
+    """
+    This class represents a (decoded) object stream (ObjStm).
+    Its header (pairs of object number and byte offset) is parsed once,
+    member objects are read (on demand) by seeking to their byte offset, and then cached.
+    """
+
+    def __init__(self, decoded_bytes: bytes, first_byte: int, number_of_objects: int):
+        self._first_byte: int = first_byte
+        self._size: int = len(decoded_bytes)
+        self._tokenizer: HighLevelTokenizer = HighLevelTokenizer(decoded_bytes)
+        self._objects: typing.Dict[int, Optional[AnyPDFType]] = {}
+        self._offsets: typing.List[int] = []
+        try:
+            header: typing.List[bytes] = bytes(decoded_bytes[0:first_byte]).split()
+            self._offsets = [
+                int(header[2 * i + 1]) for i in range(0, len(header) // 2)
+            ]
+        except ValueError:
+            # malformed header, find the byte offset of each object by reading it
+            self._offsets = []
+            self._tokenizer.seek(first_byte)
+            for i in range(0, number_of_objects):
+                self._offsets.append(self._tokenizer.tell() - first_byte)
+                self._objects[i] = self._tokenizer.read_object()
+
+    def get_object(self, index: int) -> Optional[AnyPDFType]:
+        """
+        This function returns the object at the given index in this ObjectStream
+        """
+        if index in self._objects:
+            return self._objects[index]
+        if index >= len(self._offsets):
+            return None
+        self._tokenizer.seek(self._first_byte + self._offsets[index])
+        obj: Optional[AnyPDFType] = self._tokenizer.read_object()
+        self._objects[index] = obj
+        return obj
+
+    def get_size(self) -> int:
+        """
+        This function returns the number of (decoded) bytes in this ObjectStream
+        """
+        return self._size
+
+
 class XREF(Dictionary):
     """
     Xref tables are part of the original PDF file specification
@@ -36,7 +82,18 @@ class XREF(Dictionary):
     def __init__(self):
         super(XREF, self).__init__()
         self._entries: typing.List[Reference] = []
+        # indexes (first entry wins), these keep lookup and merge O(1) per entry
+        self._entries_by_object_number: typing.Dict[int, Reference] = {}
+        self._entries_by_parent_stream: typing.Dict[
+            typing.Tuple[int, int], Reference
+        ] = {}
         self._cache: typing.Dict[int, Union[AnyPDFType, None]] = {}
+        # decoded object streams, least recently used first
+        self._object_streams: typing.Dict[int, ObjectStream] = {}
+        self._object_streams_size: int = 0
+        self._object_streams_max_size: int = 32 * 1024 * 1024
+        # byte offset of this cross-reference section (None if it was rebuilt)
+        self._start_of_xref: Optional[int] = None
 
     ##
     ## LOWLEVEL IO
@@ -59,8 +116,8 @@ class XREF(Dictionary):
         # look for 'startxref'
         while pos > 0:
             # get bytes in window
-            bytes_near_eof: bytes = b"".join([tok._next_byte() for _ in range(0, 1024)])
-            idx = bytes_near_eof.find(b"startxref")
+            bytes_near_eof: bytes = bytes(tok._read_bytes(1024))
+            idx = bytes_near_eof.rfind(b"startxref")
             if idx >= 0:
                 return pos + idx
             # next iteration
@@ -97,6 +154,71 @@ class XREF(Dictionary):
             start_of_xref_offset = int(token.get_text())
             src.seek(start_of_xref_offset)
 
+    def _get_object_stream(
+        self,
+        object_number: int,
+        src: Union[io.BufferedIOBase, io.RawIOBase, io.BytesIO],
+        tok: HighLevelTokenizer,
+    ) -> ObjectStream:
+
+        # cache
+        object_stream: Optional[ObjectStream] = self._object_streams.pop(
+            object_number, None
+        )
+        if object_stream is not None:
+            self._object_streams[object_number] = object_stream
+            return object_stream
+
+        stream_object = self.get_object(object_number, src, tok)
+        assert isinstance(stream_object, Stream)
+        assert "Length" in stream_object
+        assert "First" in stream_object
+
+        # Length may be Reference
+        if isinstance(stream_object["Length"], Reference):
+            stream_object[Name("Length")] = self.get_object(
+                stream_object["Length"], src=src, tok=tok
+            )
+
+        # First may be Reference
+        if isinstance(stream_object["First"], Reference):
+            stream_object[Name("First")] = self.get_object(
+                stream_object["First"], src=src, tok=tok
+            )
+
+        # decode
+        # the decoded bytes are kept by the (bounded) cache, rather than the stream object
+        decoded_bytes: typing.Optional[bytes] = stream_object.get(
+            "DecodedBytes", None
+        )
+        if decoded_bytes is None:
+            try:
+                decoded_bytes = decode_stream(stream_object)["DecodedBytes"]
+            except Exception as ex:
+                logger.debug("unable to inflate stream for object %d" % object_number)
+                raise ex
+            stream_object.pop("DecodedBytes")
+
+        # parse header
+        object_stream = ObjectStream(
+            decoded_bytes,
+            first_byte=int(stream_object.get("First", 0)),
+            number_of_objects=int(stream_object.get("N", 0)),
+        )
+
+        # update cache (evicting the least recently used object stream(s))
+        self._object_streams[object_number] = object_stream
+        self._object_streams_size += object_stream.get_size()
+        while (
+            self._object_streams_size > self._object_streams_max_size
+            and len(self._object_streams) > 1
+        ):
+            k: int = next(iter(self._object_streams))
+            self._object_streams_size -= self._object_streams.pop(k).get_size()
+
+        # return
+        return object_stream
+
     ##
     ## GETTERS AND SETTERS
     ##
@@ -106,29 +228,55 @@ class XREF(Dictionary):
         Add a new Reference to this XREF
         """
         self._entries.append(r)
+        if r.object_number is not None:
+            self._entries_by_object_number.setdefault(int(r.object_number), r)
+        if (
+            r.parent_stream_object_number is not None
+            and r.index_in_parent_stream is not None
+        ):
+            self._entries_by_parent_stream.setdefault(
+                (int(r.parent_stream_object_number), int(r.index_in_parent_stream)),
+                r,
+            )
         return self
 
+    def get_entry(self, object_number: int) -> Optional[Reference]:
+        """
+        This function returns the (first) Reference in this XREF with the given object number,
+        or None if no such Reference exists
+        """
+        return self._entries_by_object_number.get(int(object_number), None)
+
     def merge(self, other_xref: "XREF") -> "XREF":
         """
         Merge this XREF with another XREF
         """
         for r in other_xref._entries:
-            duplicate_entries = []
+            is_duplicate: bool = False
             if r.object_number is not None:
-                duplicate_entries = [
-                    x for x in self._entries if x.object_number == r.object_number
-                ]
+                is_duplicate = (
+                    int(r.object_number) in self._entries_by_object_number
+                )
             elif r.parent_stream_object_number is not None:
-                duplicate_entries = [
-                    x
-                    for x in self._entries
-                    if x.parent_stream_object_number == r.parent_stream_object_number
-                    and x.index_in_parent_stream == r.index_in_parent_stream
-                ]
-            if len(duplicate_entries) == 0:
+                is_duplicate = (
+                    r.index_in_parent_stream is not None
+                    and (
+                        int(r.parent_stream_object_number),
+                        int(r.index_in_parent_stream),
+                    )
+                    in self._entries_by_parent_stream
+                )
+            if not is_duplicate:
                 self.add(r)
         return self
 
+    def get_start_of_xref(self) -> Optional[int]:
+        """
+        This function returns the byte offset at which this XREF was read,
+        or None if this XREF was not read from a cross-reference section
+        """
+        return self._start_of_xref
+
     def get_object(
         self,
         indirect_reference: Union[Reference, int],
@@ -154,23 +302,19 @@ class XREF(Dictionary):
         if isinstance(indirect_reference, int) or isinstance(
             indirect_reference, Decimal
         ):
-            refs = [
-                x for x in self._entries if x.object_number == int(indirect_reference)
-            ]
-            if len(refs) == 0:
+            ref = self.get_entry(int(indirect_reference))
+            if ref is None:
                 return None
-            indirect_reference = refs[0]
+            indirect_reference = ref
 
         # lookup Reference (in self) for Reference
         elif isinstance(indirect_reference, Reference):
-            refs = [
-                x
-                for x in self._entries
-                if x.object_number == indirect_reference.object_number
-            ]
-            if len(refs) == 0:
+            if indirect_reference.object_number is None:
+                return None
+            ref = self.get_entry(indirect_reference.object_number)
+            if ref is None:
                 return None
-            indirect_reference = refs[0]
+            indirect_reference = ref
 
         # reference points to an object that is not in use
         assert isinstance(indirect_reference, Reference)
@@ -191,46 +335,9 @@ class XREF(Dictionary):
             and indirect_reference.index_in_parent_stream is not None
         ):
 
-            stream_object = self.get_object(
-                indirect_reference.parent_stream_object_number, src, tok
-            )
-            assert isinstance(stream_object, Stream)
-            assert "Length" in stream_object
-            assert "First" in stream_object
-
-            # Length may be Reference
-            if isinstance(stream_object["Length"], Reference):
-                stream_object[Name("Length")] = self.get_object(
-                    stream_object["Length"], src=src, tok=tok
-                )
-
-            # First may be Reference
-            if isinstance(stream_object["First"], Reference):
-                stream_object[Name("First")] = self.get_object(
-                    stream_object["First"], src=src, tok=tok
-                )
-
-            first_byte = int(stream_object.get("First", 0))
-            if "DecodedBytes" not in stream_object:
-                try:
-                    stream_object = decode_stream(stream_object)
-                except Exception as ex:
-                    logger.debug(
-                        "unable to inflate stream for object %d"
-                        % indirect_reference.parent_stream_object_number
-                    )
-                    raise ex
-            stream_bytes = stream_object["DecodedBytes"][first_byte:]
-
-            # tokenize parent stream
-            index = int(indirect_reference.index_in_parent_stream)
-            length = int(stream_object["Length"])
-            if index < length:
-                tok = HighLevelTokenizer(io.BytesIO(stream_bytes))
-                list_of_objs = [tok.read_object() for x in range(0, index + 1)]
-                obj = list_of_objs[-1]
-            else:
-                obj = None
+            obj = self._get_object_stream(
+                int(indirect_reference.parent_stream_object_number), src, tok
+            ).get_object(int(indirect_reference.index_in_parent_stream))
 
         # update cache
         if indirect_reference.parent_stream_object_number is None:
@@ -4,7 +4,13 @@
 """
     This implementation of EventListener renders a PDF to a PIL Image
 """
+import collections
+import concurrent.futures
+import copy
+import copyreg
 import io
+import os
+import pickle
 import platform
 import typing
 from decimal import Decimal
@@ -13,6 +19,8 @@ from pathlib import Path
 from PIL import Image as PILImage  # type: ignore [import]
 from PIL import ImageDraw, ImageFont
 
+from borb.io.read.reference.lazy_object import LazyDictionary, LazyList
+from borb.io.read.types import Name, PDFObject, Reference
 from borb.pdf import Page
 from borb.pdf.canvas.canvas import Canvas
 from borb.pdf.canvas.canvas_stream_processor import CanvasStreamProcessor
@@ -23,6 +31,162 @@ from borb.pdf.page.page_size import PageSize
 from borb.toolkit.export.pdf_to_svg import PDFToSVG
 
 
+class _SystemFonts:
+    """
+    This class holds an index of the TrueType fonts installed on this system (by file name).
+    The system font directory is walked (at most) once per process, the first time a font is needed.
+    ImageFont objects are cached by (path, size), and shared by all PDFToJPG objects.
+    """
+
+    _instance: typing.Optional["_SystemFonts"] = None
+    _image_fonts: typing.Dict[typing.Tuple[str, int], ImageFont.FreeTypeFont] = {}
+
+    def __init__(self):
+        system: str = platform.system()
+        assert system in ["Darwin", "Linux", "Windows"]
+        root_font_dir: typing.Optional[Path] = None
+        if system == "Linux":
+            root_font_dir = Path("/usr/share/fonts")
+        if system == "Darwin":
+            root_font_dir = Path("/Library/Fonts/")
+        if system == "Windows":
+            root_font_dir = Path("C:/Windows/Fonts")
+
+        # BFS directory (the first file with a given name is kept)
+        self._ttf_font_files: typing.Dict[str, Path] = {}
+        file_stk: typing.Deque[Path] = collections.deque([root_font_dir])
+        while len(file_stk) > 0:
+            f = file_stk.popleft()
+            if f.is_dir():
+                file_stk.extend(f.iterdir())
+            elif f.name.endswith(".ttf"):
+                self._ttf_font_files.setdefault(f.name, f)
+
+    @staticmethod
+    def get() -> "_SystemFonts":
+        """
+        This function returns the (shared) _SystemFonts, walking the system font directory if needed
+        """
+        if _SystemFonts._instance is None:
+            _SystemFonts._instance = _SystemFonts()
+        return _SystemFonts._instance
+
+    @staticmethod
+    def get_image_font(font_path: Path, font_size: int) -> ImageFont.FreeTypeFont:
+        """
+        This function returns the (shared) ImageFont for a given font file and size, loading it if needed
+        """
+        key: typing.Tuple[str, int] = (str(font_path), font_size)
+        font: typing.Optional[ImageFont.FreeTypeFont] = _SystemFonts._image_fonts.get(
+            key
+        )
+        if font is None:
+            font = ImageFont.truetype(str(font_path), font_size)
+            _SystemFonts._image_fonts[key] = font
+        return font
+
+    def get_font_family(
+        self, font_family: str
+    ) -> typing.Optional[typing.Tuple[Path, Path, Path, Path]]:
+        """
+        This function returns the regular, bold, italic and bold-italic font file of a given font family,
+        or None if (any of) these files are not installed
+        """
+        font_files: typing.List[typing.Optional[Path]] = [
+            self._ttf_font_files.get(font_family + x + ".ttf")
+            for x in ["-Regular", "-Bold", "-Italic", "-BoldItalic"]
+        ]
+        if any([x is None for x in font_files]):
+            return None
+        return font_files[0], font_files[1], font_files[2], font_files[3]  # type: ignore [return-value]
+
+    def get_font_files(self) -> typing.List[Path]:
+        """
+        This function returns all (TrueType) font files installed on this system
+        """
+        return [x for x in self._ttf_font_files.values()]
+
+
+class _PageDispatchTable(dict):
+    """
+    This class is the dispatch_table of _PagePickler.
+    It returns the reduction function for memoryview objects, Reference objects and PDF objects,
+    and the (copyreg) reduction function for every other type that has one.
+    """
+
+    @staticmethod
+    def _new_object(cls: type, *args):
+        return cls.__new__(cls, *args)
+
+    @staticmethod
+    def _reduce_memoryview(obj: memoryview):
+        # memoryview (e.g. /Bytes of a memory-mapped file) can not be pickled
+        return bytes, (bytes(obj),)
+
+    @staticmethod
+    def _reduce_reference(obj: Reference):
+        # an (unresolved) Reference is pickled without its Document (and resolver)
+        return Reference, (
+            obj.object_number,
+            obj.generation_number,
+            obj.parent_stream_object_number,
+            obj.index_in_parent_stream,
+            obj.byte_offset,
+            obj.is_in_use,
+        )
+
+    @staticmethod
+    def _reduce_pdf_object(obj: PDFObject):
+        if isinstance(obj, (LazyDictionary, LazyList)):
+            obj._resolve_all()
+        reduce_value = list(obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL))
+        if reduce_value[0] is not copyreg.__newobj__:
+            return tuple(reduce_value)
+
+        # lazily loaded objects are pickled as their original class
+        # (copyreg.__newobj__ only accepts the class of the object itself)
+        cls: type = type(obj)
+        if issubclass(cls, (LazyDictionary, LazyList)):
+            cls = cls.__bases__[1]
+            reduce_value[0] = _PageDispatchTable._new_object
+        reduce_value[1] = (cls,) + tuple(reduce_value[1][1:])
+
+        # the parent (and Reference) of a PDF object are not pickled
+        if isinstance(reduce_value[2], tuple):
+            instance_dict, slots = reduce_value[2]
+            slots = {
+                k: v
+                for k, v in (slots or {}).items()
+                if k not in ["_parent", "_reference"]
+            }
+            reduce_value[2] = (instance_dict, slots)
+        return tuple(reduce_value)
+
+    def __missing__(self, cls: type):
+        if issubclass(cls, memoryview):
+            return _PageDispatchTable._reduce_memoryview
+        if issubclass(cls, Reference):
+            return _PageDispatchTable._reduce_reference
+        if issubclass(cls, PDFObject):
+            return _PageDispatchTable._reduce_pdf_object
+        # everything else is pickled as usual (a KeyError is raised if copyreg has no reduction function)
+        return copyreg.dispatch_table[cls]
+
+
+class _PagePickler(pickle.Pickler):
+    """
+    This class pickles the (detached) Page objects that are sent to the worker processes of PDFToJPG.
+    PDF objects are pickled without their parent and Reference,
+    so that pickling a Page (and its resources) does not pickle the entire Document.
+    The reduction functions are looked up in a (per-pickler) dispatch_table,
+    rather than in reducer_override (which requires Python 3.8).
+    """
+
+    def __init__(self, file, protocol: typing.Optional[int] = None):
+        super(_PagePickler, self).__init__(file, protocol)
+        self.dispatch_table = _PageDispatchTable()
+
+
 class PDFToJPG(PDFToSVG):
     """
     This implementation of EventListener renders a PDF to a PIL Image
@@ -33,37 +197,127 @@ class PDFToJPG(PDFToSVG):
         """
         This function converts a PDF to an PIL.Image.Image
         """
-        image_of_each_page: typing.Dict[int, PILImage.Image] = {}
+        # a single EventListener renders every Page
+        cse: "PDFToJPG" = PDFToJPG()
         number_of_pages: int = int(pdf.get_document_info().get_number_of_pages() or 0)
         for page_nr in range(0, number_of_pages):
             # get Page object
             page: Page = pdf.get_page(page_nr)
             page_source: io.BytesIO = io.BytesIO(page["Contents"]["DecodedBytes"])
 
-            # register EventListener
-            cse: "PDFToJPG" = PDFToJPG()
-
             # process Page
             cse._event_occurred(BeginPageEvent(page))
             CanvasStreamProcessor(page, Canvas(), []).read(page_source, [cse])
             cse._event_occurred(EndPageEvent(page))
 
-            # set in page
-            image_of_each_page[page_nr] = cse.convert_to_jpg()[0]
+        # return
+        return cse.convert_to_jpg()
+
+    @staticmethod
+    def _render_page(
+        page_nr: int, page_bytes: bytes, dpi: Decimal
+    ) -> typing.Tuple[int, PILImage.Image]:  # type: ignore[valid-type]
+        # unpickle (detached) Page and content stream
+        page, content_bytes = pickle.loads(page_bytes)
+
+        # process Page
+        cse: "PDFToJPG" = PDFToJPG(dpi=dpi)
+        cse._event_occurred(BeginPageEvent(page))
+        CanvasStreamProcessor(page, Canvas(), []).read(io.BytesIO(content_bytes), [cse])
+        cse._event_occurred(EndPageEvent(page))
 
         # return
-        return image_of_each_page
+        return page_nr, cse.convert_to_jpg()[0]
+
+    @staticmethod
+    def _pickle_page(page: Page) -> bytes:
+        # build a (detached) Page holding (only) what is needed to render it
+        detached_page: Page = Page()
+        detached_page[Name("MediaBox")] = copy.deepcopy(page["MediaBox"])
+        if "Resources" in page:
+            detached_page[Name("Resources")] = page["Resources"]
+        content_bytes: bytes = bytes(page["Contents"]["DecodedBytes"])
+
+        # pickle
+        with io.BytesIO() as page_file_handle:
+            _PagePickler(page_file_handle, pickle.HIGHEST_PROTOCOL).dump(
+                (detached_page, content_bytes)
+            )
+            return page_file_handle.getvalue()
+
+    @staticmethod
+    def convert_pdf_to_jpg_in_parallel(
+        pdf: "Document",  # type: ignore[name-defined]
+        page_range: typing.Optional[typing.Iterable[int]] = None,
+        dpi: Decimal = Decimal(72),
+        number_of_workers: typing.Optional[int] = None,
+    ) -> typing.Iterator[typing.Tuple[int, PILImage.Image]]:  # type: ignore[valid-type]
+        """
+        This function converts (a range of) the pages of a PDF to PIL.Image.Image objects, at a given DPI.
+        The pages are rendered by a pool of (number_of_workers) worker processes.
+        Each worker receives the (decoded) content stream and resources of a Page, rather than the entire PDF.
+        This function yields (page_nr, PIL.Image.Image) tuples in the order in which the pages finish rendering.
+        At most 2 pages per worker are being rendered (or waiting to be yielded) at any time.
+        """
+        if page_range is None:
+            page_range = range(
+                0, int(pdf.get_document_info().get_number_of_pages() or 0)  # type: ignore[attr-defined]
+            )
+        if number_of_workers is None:
+            number_of_workers = os.cpu_count() or 1
+
+        # a single worker renders every Page in this process
+        if number_of_workers <= 1:
+            for page_nr in page_range:
+                yield PDFToJPG._render_page(
+                    page_nr, PDFToJPG._pickle_page(pdf.get_page(page_nr)), dpi  # type: ignore[attr-defined]
+                )
+            return
+
+        # multiple workers
+        page_nrs: typing.Iterator[int] = iter(page_range)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=number_of_workers
+        ) as executor:
+            pending: typing.Set[concurrent.futures.Future] = set()
+            while True:
+                # submit Page objects
+                while len(pending) < 2 * number_of_workers:
+                    page_nr: typing.Optional[int] = next(page_nrs, None)
+                    if page_nr is None:
+                        break
+                    pending.add(
+                        executor.submit(
+                            PDFToJPG._render_page,
+                            page_nr,
+                            PDFToJPG._pickle_page(pdf.get_page(page_nr)),  # type: ignore[attr-defined]
+                            dpi,
+                        )
+                    )
+                if len(pending) == 0:
+                    break
+
+                # yield rendered Page objects
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for f in done:
+                    yield f.result()
 
     def __init__(
         self,
         default_page_width: Decimal = Decimal(PageSize.A4_PORTRAIT.value[0]),
         default_page_height: Decimal = Decimal(PageSize.A4_PORTRAIT.value[1]),
+        dpi: Decimal = Decimal(72),
     ):
         super(PDFToJPG, self).__init__(
             default_page_width=default_page_width,
             default_page_height=default_page_height,
         )
+        # 1 user space unit is 1/72 inch
+        self._scale: Decimal = Decimal(dpi) / Decimal(72)
         self._jpg_image_per_page: typing.Dict[int, PILImage] = {}  # type: ignore[valid-type]
+        self._image_draw_per_page: typing.Dict[int, ImageDraw.ImageDraw] = {}
 
         # figure out fonts
         self._regular_font: typing.Optional[Path] = None
@@ -73,57 +327,27 @@ class PDFToJPG(PDFToSVG):
         self._find_font_families()
 
     def _find_font_families(self):
-        system: str = platform.system()
-        assert system in ["Darwin", "Linux", "Windows"]
-        root_font_dir: typing.Optional[Path] = None
-        if system == "Linux":
-            root_font_dir = Path("/usr/share/fonts")
-        if system == "Darwin":
-            root_font_dir = Path("/Library/Fonts/")
-        if system == "Windows":
-            root_font_dir = Path("C:/Windows/Fonts")
-
-        # BFS directory
-        ttf_font_files = []
-        file_stk: typing.List[Path] = [root_font_dir]
-        while len(file_stk) > 0:
-            f = file_stk[0]
-            file_stk.pop(0)
-            if f.is_dir():
-                for subdir in f.iterdir():
-                    file_stk.append(subdir)
-            else:
-                if f.name.endswith(".ttf"):
-                    ttf_font_files.append(f)
-
-        # find family of fonts
+        system_fonts: _SystemFonts = _SystemFonts.get()
         for c in ["LiberationSans", "LiberationMono"]:
-            suffixes = ["-Regular", "-Italic", "-Bold", "-BoldItalic"]
-            all_fonts_present = all(
-                [
-                    y in [x.name for x in ttf_font_files]
-                    for y in [c + x + ".ttf" for x in suffixes]
-                ]
-            )
-            if all_fonts_present:
-                self._regular_font = [
-                    x for x in ttf_font_files if x.name.endswith(c + "-Regular.ttf")
-                ][0]
-                self._bold_font = [
-                    x for x in ttf_font_files if x.name.endswith(c + "-Bold.ttf")
-                ][0]
-                self._italic_font = [
-                    x for x in ttf_font_files if x.name.endswith(c + "-Italic.ttf")
-                ][0]
-                self._bold_italic_font = [
-                    x for x in ttf_font_files if x.name.endswith(c + "-BoldItalic.ttf")
-                ][0]
+            font_family = system_fonts.get_font_family(c)
+            if font_family is not None:
+                (
+                    self._regular_font,
+                    self._bold_font,
+                    self._italic_font,
+                    self._bold_italic_font,
+                ) = font_family
 
     def _begin_page(
         self, page_nr: Decimal, page_width: Decimal, page_height: Decimal
     ) -> None:
         self._jpg_image_per_page[int(page_nr)] = PILImage.new(
-            "RGB", (int(page_width), int(page_height)), color=(255, 255, 255)
+            "RGB",
+            (int(page_width * self._scale), int(page_height * self._scale)),
+            color=(255, 255, 255),
+        )
+        self._image_draw_per_page[int(page_nr)] = ImageDraw.Draw(
+            self._jpg_image_per_page[int(page_nr)]
         )
 
     def _render_text(
@@ -156,20 +380,21 @@ class PDFToJPG(PDFToSVG):
         elif italic:
             font_path = self._italic_font
 
-        # instantiate font
-        font = ImageFont.truetype(str(font_path), int(font_size))
+        # get (cached) font
+        font = _SystemFonts.get_image_font(font_path, int(font_size * self._scale))
 
         # draw text
-        assert self._jpg_image_per_page.get(int(page_nr)) is not None
-        draw = ImageDraw.Draw(self._jpg_image_per_page[int(page_nr)])
+        draw = self._image_draw_per_page.get(int(page_nr))
+        assert draw is not None
+        font_color_rgb = font_color.to_rgb()
         draw.text(
-            (float(x), float(page_height - y)),
+            (float(x * self._scale), float((page_height - y) * self._scale)),
             text,
             font=font,
             fill=(
-                int(font_color.to_rgb().red),
-                int(font_color.to_rgb().green),
-                int(font_color.to_rgb().blue),
+                int(font_color_rgb.red),
+                int(font_color_rgb.green),
+                int(font_color_rgb.blue),
             ),
         )
 
@@ -188,10 +413,18 @@ class PDFToJPG(PDFToSVG):
         assert page_image is not None
 
         # resize
-        image = image.resize((int(image_width), int(image_height)))
+        image = image.resize(
+            (int(image_width * self._scale), int(image_height * self._scale))
+        )
 
         # paste
-        page_image.paste(image, (int(x), int(page_height - y - image_height)))
+        page_image.paste(
+            image,
+            (
+                int(x * self._scale),
+                int((page_height - y - image_height) * self._scale),
+            ),
+        )
 
     def convert_to_jpg(self) -> typing.Dict[int, PILImage.Image]:  # type: ignore[valid-type]
         """
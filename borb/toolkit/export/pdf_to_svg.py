@@ -37,26 +37,21 @@ class PDFToSVG(EventListener):
         """
         This function converts a PDF to an SVG ET.Element
         """
-        image_of_each_page: typing.Dict[int, ET.Element] = {}
+        # a single EventListener renders every Page
+        cse: "PDFToSVG" = PDFToSVG()
         number_of_pages: int = int(pdf.get_document_info().get_number_of_pages() or 0)
         for page_nr in range(0, number_of_pages):
             # get Page object
             page: Page = pdf.get_page(page_nr)
             page_source: io.BytesIO = io.BytesIO(page["Contents"]["DecodedBytes"])
 
-            # register EventListener
-            cse: "PDFToSVG" = PDFToSVG()
-
             # process Page
             cse._event_occurred(BeginPageEvent(page))
             CanvasStreamProcessor(page, Canvas(), []).read(page_source, [cse])
             cse._event_occurred(EndPageEvent(page))
 
-            # set in page
-            image_of_each_page[page_nr] = cse.convert_to_svg()[0]
-
         # return
-        return image_of_each_page
+        return cse.convert_to_svg()
 
     def __init__(
         self,
@@ -0,0 +1,107 @@
+import typing
+import unittest
+from decimal import Decimal
+
+from borb.io.read.types import Function, Name
+
+
+class TestEvaluateFunction(unittest.TestCase):
+    """
+    This test evaluates (type 0) sampled Function and (type 3) stitching Function objects,
+    and checks that the most recently used inputs (and their outputs) are remembered.
+    """
+
+    @staticmethod
+    def _build_sampled_function(
+        size: typing.List[int], bits_per_sample: int, samples: bytes, n: int
+    ) -> Function:
+        f: Function = Function()
+        f[Name("FunctionType")] = Decimal(0)
+        f[Name("Domain")] = [Decimal(0), Decimal(1)] * len(size)
+        f[Name("Range")] = [Decimal(0), Decimal(1)] * n
+        f[Name("Size")] = [Decimal(x) for x in size]
+        f[Name("BitsPerSample")] = Decimal(bits_per_sample)
+        f[Name("DecodedBytes")] = samples
+        return f
+
+    @staticmethod
+    def _build_exponential_function(c0: int, c1: int) -> Function:
+        f: Function = Function()
+        f[Name("FunctionType")] = Decimal(2)
+        f[Name("Domain")] = [Decimal(0), Decimal(1)]
+        f[Name("C0")] = [Decimal(c0)]
+        f[Name("C1")] = [Decimal(c1)]
+        f[Name("N")] = Decimal(1)
+        return f
+
+    def test_evaluate_sampled_function_with_multiple_inputs(self):
+
+        # 2 inputs (the first input varies fastest), 12 bits per sample
+        f: Function = TestEvaluateFunction._build_sampled_function(
+            [2, 2], 12, bytes([0x00, 0x0F, 0xFF, 0xFF, 0xFF, 0xFF]), 1
+        )
+        assert f.evaluate([Decimal(0), Decimal(0)]) == [Decimal(0)]
+        assert f.evaluate([Decimal(1), Decimal(0)]) == [Decimal(1)]
+        assert round(f.evaluate([Decimal(0.5), Decimal(0)])[0], 4) == Decimal("0.5")
+        assert round(f.evaluate([Decimal(0.5), Decimal(0.5)])[0], 4) == Decimal("0.75")
+
+    def test_evaluate_remembers_most_recently_used_inputs(self):
+
+        f: Function = TestEvaluateFunction._build_exponential_function(0, 1)
+        xs: typing.List[typing.List[Decimal]] = [
+            [Decimal(i) / Decimal(Function.EVALUATE_CACHE_SIZE)]
+            for i in range(0, Function.EVALUATE_CACHE_SIZE + 1)
+        ]
+
+        # fill the cache, then use the first input again
+        for x in xs[:-1]:
+            f.evaluate(x)
+        f.evaluate(xs[0])
+
+        # a new input evicts the least recently used input (the second one)
+        f.evaluate(xs[-1])
+        assert len(f._evaluate_cache) == Function.EVALUATE_CACHE_SIZE
+        assert tuple(xs[0]) in f._evaluate_cache
+        assert tuple(xs[1]) not in f._evaluate_cache
+
+    def test_evaluate_stitching_function(self):
+
+        f: Function = Function()
+        f[Name("FunctionType")] = Decimal(3)
+        f[Name("Domain")] = [Decimal(0), Decimal(1)]
+        f[Name("Bounds")] = [Decimal(0.5)]
+        f[Name("Encode")] = [Decimal(0), Decimal(1), Decimal(0), Decimal(1)]
+        f[Name("Functions")] = [
+            TestEvaluateFunction._build_exponential_function(0, 1),
+            TestEvaluateFunction._build_exponential_function(1, 0),
+        ]
+        assert f.evaluate([Decimal(0)]) == [Decimal(0)]
+        assert f.evaluate([Decimal(0.25)]) == [Decimal(0.5)]
+        assert f.evaluate([Decimal(0.5)]) == [Decimal(1)]
+        assert f.evaluate([Decimal(0.75)]) == [Decimal(0.5)]
+        assert f.evaluate([Decimal(1)]) == [Decimal(0)]
+
+    def test_evaluate_after_modifying_function(self):
+
+        # exponential Function
+        f: Function = TestEvaluateFunction._build_exponential_function(0, 1)
+        assert f.evaluate([Decimal(0.5)]) == [Decimal(0.5)]
+        f[Name("C1")] = [Decimal(2)]
+        assert f.evaluate([Decimal(0.5)]) == [Decimal(1)]
+
+        # sampled Function
+        f = TestEvaluateFunction._build_sampled_function([2], 8, bytes([0, 255]), 1)
+        assert f.evaluate([Decimal(1)]) == [Decimal(1)]
+        f.update({Name("DecodedBytes"): bytes([0, 0])})
+        assert f.evaluate([Decimal(1)]) == [Decimal(0)]
+
+        # PostScript calculator Function
+        f = Function()
+        f[Name("FunctionType")] = Decimal(4)
+        f[Name("Domain")] = [Decimal(0), Decimal(1)]
+        f[Name("Range")] = [Decimal(0), Decimal(1)]
+        f[Name("DecodedBytes")] = b"{ 2 div }"
+        assert f.evaluate([Decimal(1)]) == [Decimal(0.5)]
+        f.pop(Name("DecodedBytes"))
+        f[Name("DecodedBytes")] = b"{ 4 div }"
+        assert f.evaluate([Decimal(1)]) == [Decimal(0.25)]
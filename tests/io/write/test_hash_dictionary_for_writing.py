@@ -0,0 +1,44 @@
+import unittest
+from decimal import Decimal
+
+from borb.io.read.types import Dictionary, Name, String
+from borb.io.write.transformer import Transformer
+
+
+class TestHashDictionaryForWriting(unittest.TestCase):
+    """
+    This test checks the hash the write Transformer uses to find duplicate Dictionary objects.
+    Equal Dictionary objects should have the same hash, regardless of the order of their keys.
+    """
+
+    @staticmethod
+    def _build_dictionary(keys, value: str) -> Dictionary:
+        d: Dictionary = Dictionary()
+        for k in keys:
+            if k == "Type":
+                d[Name(k)] = Name("Annot")
+            elif k == "Contents":
+                d[Name(k)] = String(value)
+            else:
+                d[Name(k)] = Decimal(1)
+        return d
+
+    def test_hash_equal_dictionaries_with_different_key_order(self):
+        d0: Dictionary = TestHashDictionaryForWriting._build_dictionary(
+            ["Type", "Contents", "F"], "Lorem"
+        )
+        d1: Dictionary = TestHashDictionaryForWriting._build_dictionary(
+            ["F", "Contents", "Type"], "Lorem"
+        )
+        assert d0 == d1
+        assert Transformer._hash(d0) == Transformer._hash(d1)
+
+    def test_hash_dictionaries_with_different_values(self):
+        d0: Dictionary = TestHashDictionaryForWriting._build_dictionary(
+            ["Type", "Contents", "F"], "Lorem"
+        )
+        d1: Dictionary = TestHashDictionaryForWriting._build_dictionary(
+            ["Type", "Contents", "F"], "Ipsum"
+        )
+        assert d0 != d1
+        assert Transformer._hash(d0) != Transformer._hash(d1)
@@ -3,6 +3,7 @@ import unittest
 from decimal import Decimal
 
 from borb.io.read.postfix.postfix_eval import PostScriptEval
+from borb.io.read.types import Decimal as bDecimal
 
 
 class TestPostscriptEval(unittest.TestCase):
@@ -23,3 +24,60 @@ class TestPostscriptEval(unittest.TestCase):
         )
         for x in out:
             print(x)
+
+    def test_postscript_eval_conditional(self):
+
+        s: str = "{ dup 0.5 gt { 1 exch sub } if }"
+        assert PostScriptEval.evaluate(s, [Decimal(0.75)]) == [Decimal(0.25)]
+        assert PostScriptEval.evaluate(s, [Decimal(0.25)]) == [Decimal(0.25)]
+
+        s = "{ 0.5 gt { 1 } { 0 } ifelse }"
+        assert PostScriptEval.evaluate(s, [Decimal(0.75)]) == [Decimal(1)]
+        assert PostScriptEval.evaluate(s, [Decimal(0.25)]) == [Decimal(0)]
+
+    def test_postscript_eval_stack_operators(self):
+
+        assert PostScriptEval.evaluate("{ 1 2 3 3 1 roll }", []) == [3, 1, 2]
+        assert PostScriptEval.evaluate("{ 1 2 3 3 -1 roll }", []) == [2, 3, 1]
+        assert PostScriptEval.evaluate("{ 1 2 2 copy }", []) == [1, 2, 1, 2]
+        assert PostScriptEval.evaluate("{ 1 2 3 2 index }", []) == [1, 2, 3, 1]
+
+    def test_postscript_eval_stack_underflow(self):
+
+        with self.assertRaises(AssertionError):
+            PostScriptEval.evaluate("{ 1 add }", [])
+
+    def test_postscript_eval_exp_without_real_result(self):
+
+        assert PostScriptEval.evaluate("{ 2 0.5 exp }", [])[0] == Decimal(
+            "1.4142135623730951"
+        )
+        with self.assertRaises(AssertionError):
+            PostScriptEval.evaluate("{ -2 0.5 exp }", [])
+
+    def test_postscript_eval_arithmetic_operators_require_numbers(self):
+
+        for s in [
+            "{ true 1 add }",
+            "{ 1 true add }",
+            "{ false 1 add }",
+            "{ true neg }",
+            "{ true 2 exp }",
+            "{ false 1 gt }",
+            "{ true 1 idiv }",
+        ]:
+            with self.assertRaises(AssertionError):
+                PostScriptEval.evaluate(s, [])
+
+        # boolean operators (and eq, ne) still accept bool
+        for s in [
+            "{ true false or { 1 } { 0 } ifelse }",
+            "{ true true eq { 1 } { 0 } ifelse }",
+        ]:
+            assert PostScriptEval.evaluate(s, []) == [1]
+
+    def test_postscript_eval_returns_decimal_built_from_str(self):
+
+        out: typing.List[Decimal] = PostScriptEval.evaluate("{ 0.1 0.2 add }", [])
+        assert isinstance(out[0], bDecimal)
+        assert str(out[0]) == "0.30000000000000004"
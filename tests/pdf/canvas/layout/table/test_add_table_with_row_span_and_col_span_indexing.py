@@ -0,0 +1,43 @@
+import typing
+import unittest
+
+from borb.pdf.canvas.layout.table.fixed_column_width_table import (
+    FixedColumnWidthTable,
+)
+from borb.pdf.canvas.layout.table.table import Table, TableCell
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+
+
+class TestAddTableWithRowSpanAndColSpanIndexing(unittest.TestCase):
+    """
+    This test adds TableCell objects with non-trivial row_span and col_span to a Table,
+    and checks the index the Table keeps of its TableCell objects (by grid coordinate, row and column).
+    """
+
+    def test_add_table_cells_with_row_span_and_col_span(self):
+
+        # +---+---+---+
+        # | 0     | 1 |
+        # +---+---+   +
+        # | 2 | 3 |   |
+        # +---+---+---+
+        table: Table = FixedColumnWidthTable(number_of_rows=2, number_of_columns=3)
+        cells: typing.List[TableCell] = [
+            TableCell(Paragraph("0"), col_span=2),
+            TableCell(Paragraph("1"), row_span=2),
+            TableCell(Paragraph("2")),
+            TableCell(Paragraph("3")),
+        ]
+        for c in cells:
+            table.add(c)
+
+        # check
+        assert cells[1]._table_coordinates == [(0, 2), (1, 2)]
+        assert cells[3]._table_coordinates == [(1, 1)]
+        assert table._get_cells_at(1, 2) is cells[1]
+        assert table._get_cells_at_row(1) == [cells[1], cells[2], cells[3]]
+        assert table._get_cells_at_column(1) == [cells[0], cells[3]]
+
+        # the Table is full
+        with self.assertRaises(AssertionError):
+            table.add(Paragraph("4"))
@@ -0,0 +1,29 @@
+import unittest
+from decimal import Decimal
+
+from borb.pdf.canvas.layout.table.fixed_column_width_table import (
+    FixedColumnWidthTable,
+)
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+
+
+class TestGetWidthOfTableWithZeroColumnWidths(unittest.TestCase):
+    """
+    This test checks the (minimum and maximum) content width of a FixedColumnWidthTable
+    whose column widths are all 0. In that case every column is given an equal share of the width.
+    """
+
+    def test_get_width_of_table_with_zero_column_widths(self):
+        table: FixedColumnWidthTable = FixedColumnWidthTable(
+            number_of_rows=1,
+            number_of_columns=2,
+            column_widths=[Decimal(0), Decimal(0)],
+        )
+        table.add(Paragraph("Lorem"))
+        table.add(Paragraph("Ipsum dolor"))
+
+        # check
+        min_widths = [e._get_min_width() for e in table._content]
+        max_widths = [e._get_max_width() for e in table._content]
+        assert table._get_min_content_width() == 2 * max(min_widths)
+        assert table._get_max_content_width() == 2 * max(max_widths)
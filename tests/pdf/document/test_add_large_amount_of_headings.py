@@ -62,6 +62,7 @@ class TestAddLargeAmountOfHeadings(unittest.TestCase):
             .set_padding_on_all_cells(Decimal(2), Decimal(2), Decimal(2), Decimal(2))
         )
 
+        recursion_limit: int = sys.getrecursionlimit()
         sys.setrecursionlimit(100)
         N: int = 32
         for i in range(0, N):
@@ -87,16 +88,16 @@ class TestAddLargeAmountOfHeadings(unittest.TestCase):
         # determine output location
         out_file = self.output_dir / "output_001.pdf"
 
-        # attempt to store PDF
-        with self.assertRaises(RecursionError) as context:
-
-            # attempt to open
+        # store PDF (writing does not recurse, so this does not raise a RecursionError)
+        try:
             with open(out_file, "wb") as in_file_handle:
                 PDF.dumps(in_file_handle, pdf)
+        finally:
+            sys.setrecursionlimit(recursion_limit)
 
-            # compare visually
-            compare_visually_to_ground_truth(out_file)
-            check_pdf_using_validator(out_file)
+        # compare visually
+        compare_visually_to_ground_truth(out_file)
+        check_pdf_using_validator(out_file)
 
     def test_write_document_002(self):
 
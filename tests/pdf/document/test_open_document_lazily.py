@@ -0,0 +1,77 @@
+import copy
+import io
+import unittest
+from pathlib import Path
+
+from borb.io.read.types import Dictionary, Reference
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestOpenDocumentLazily(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.input_file: Path = (
+            Path(__file__).parent / "count_pages" / "input_001.pdf"
+        )
+
+    def test_open_document_lazily_does_not_resolve_pages(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            doc: Document = PDF.loads(file_handle, lazy=True)
+
+            # /Kids holds (unresolved) Reference objects until a Page is accessed
+            kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+            for i in range(0, len(kids)):
+                assert isinstance(list.__getitem__(kids, i), Reference)
+
+            # accessing a Page resolves it (and only it)
+            page: Page = doc.get_page(0)
+            assert isinstance(page, Page)
+            assert isinstance(list.__getitem__(kids, 0), Page)
+            if len(kids) > 1:
+                assert isinstance(list.__getitem__(kids, 1), Reference)
+
+            # page number can be determined without resolving other Page objects
+            assert page.get_page_info().get_page_number() == 0
+
+    def test_open_document_lazily(self):
+
+        # read document
+        l0: SimpleTextExtraction = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            doc_001: Document = PDF.loads(file_handle, [l0])
+
+        # read document (lazily)
+        l1: SimpleTextExtraction = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            doc_002: Document = PDF.loads(file_handle, [l1], lazy=True)
+
+            # compare
+            N: int = int(doc_001.get_document_info().get_number_of_pages())
+            assert N == int(doc_002.get_document_info().get_number_of_pages())
+            for i in range(0, N):
+                assert isinstance(doc_002.get_page(i), Page)
+                assert l0.get_text_for_page(i) == l1.get_text_for_page(i)
+
+    def test_write_document_opened_lazily(self):
+
+        with open(self.input_file, "rb") as file_handle:
+            doc: Document = PDF.loads(file_handle, lazy=True)
+
+            # copy
+            doc_copy: Document = copy.deepcopy(doc)
+            assert isinstance(doc_copy.get_page(0), Dictionary)
+
+            # write
+            with io.BytesIO() as pdf_file_handle:
+                PDF.dumps(pdf_file_handle, doc)
+                pdf_file_handle.seek(0)
+                doc_002: Document = PDF.loads(pdf_file_handle)
+
+            # compare
+            assert int(doc.get_document_info().get_number_of_pages()) == int(
+                doc_002.get_document_info().get_number_of_pages()
+            )
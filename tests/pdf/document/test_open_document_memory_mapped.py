@@ -0,0 +1,112 @@
+import copy
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from borb.pdf.document.document import Document
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+
+class TestOpenDocumentMemoryMapped(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.input_file: Path = (
+            Path(__file__).parent / "count_pages" / "input_001.pdf"
+        )
+
+    def test_open_document_memory_mapped(self):
+
+        # read document
+        l0: SimpleTextExtraction = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            doc_001: Document = PDF.loads(file_handle, [l0])
+
+        # read document (memory-mapped)
+        l1: SimpleTextExtraction = SimpleTextExtraction()
+        with open(self.input_file, "rb") as file_handle:
+            doc_002: Document = PDF.loads(file_handle, [l1], memory_map=True)
+
+        # compare
+        N: int = int(doc_001.get_document_info().get_number_of_pages())
+        assert N == int(doc_002.get_document_info().get_number_of_pages())
+        for i in range(0, N):
+            assert l0.get_text_for_page(i) == l1.get_text_for_page(i)
+
+    def test_write_document_memory_mapped(self):
+
+        # read document (memory-mapped)
+        with open(self.input_file, "rb") as file_handle:
+            doc: Document = PDF.loads(file_handle, memory_map=True)
+
+        # /Bytes are shared with the underlying buffer
+        contents = doc.get_page(0)["Contents"]
+        assert isinstance(contents["Bytes"], memoryview)
+        assert isinstance(contents["DecodedBytes"], bytes)
+
+        # copy
+        doc_copy: Document = copy.deepcopy(doc)
+        assert isinstance(doc_copy.get_page(0)["Contents"]["Bytes"], bytes)
+
+        # write
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            assert len(pdf_file_handle.getvalue()) > 0
+
+    def test_close_source_after_loading_memory_mapped(self):
+
+        # read document (memory-mapped) from an io.BytesIO, and close it
+        with open(self.input_file, "rb") as file_handle:
+            pdf_bytes: bytes = file_handle.read()
+        with io.BytesIO(pdf_bytes) as file_handle:
+            doc_001: Document = PDF.loads(file_handle, memory_map=True)
+        assert file_handle.closed
+
+        # read document (memory-mapped) from a file, and close it
+        with open(self.input_file, "rb") as file_handle:
+            doc_002: Document = PDF.loads(file_handle, memory_map=True)
+        assert file_handle.closed
+
+        # the Document can still be used
+        N: int = int(doc_001.get_document_info().get_number_of_pages())
+        assert N == int(doc_002.get_document_info().get_number_of_pages())
+        assert isinstance(doc_002.get_page(0)["Contents"]["Bytes"], memoryview)
+
+        # close (unmap) the Documents, and write them
+        for doc in [doc_001, doc_002]:
+            with doc:
+                pass
+            assert isinstance(doc.get_page(0)["Contents"]["Bytes"], bytes)
+            assert not doc.get_page(0)["Contents"].is_modified()
+            with io.BytesIO() as pdf_file_handle:
+                PDF.dumps(pdf_file_handle, doc)
+                assert N == int(
+                    PDF.loads(io.BytesIO(pdf_file_handle.getvalue()))
+                    .get_document_info()
+                    .get_number_of_pages()
+                )
+
+        # closing a Document twice (or a Document that was not memory-mapped) does nothing
+        doc_002.close()
+        copy.deepcopy(doc_001).close()
+
+    def test_close_document_with_prefix_memory_mapped(self):
+
+        # build a file with bytes before the %PDF header
+        with open(self.input_file, "rb") as file_handle:
+            pdf_bytes: bytes = file_handle.read()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            prefixed_file: Path = Path(temp_dir) / "input_with_prefix.pdf"
+            with open(prefixed_file, "wb") as file_handle:
+                file_handle.write(b"junk before the header\n" + pdf_bytes)
+
+            # read document (memory-mapped, lazy)
+            with open(prefixed_file, "rb") as file_handle:
+                doc: Document = PDF.loads(file_handle, memory_map=True, lazy=True)
+            assert b"BT" in doc.get_page(0)["Contents"]["DecodedBytes"]
+
+            # close (unmap) the Document, the objects that were read can still be used
+            doc.close()
+            assert isinstance(doc.get_page(0)["Contents"]["Bytes"], bytes)
+            assert b"BT" in doc.get_page(0)["Contents"]["DecodedBytes"]
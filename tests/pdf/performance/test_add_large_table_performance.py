@@ -0,0 +1,78 @@
+import time
+import unittest
+from decimal import Decimal
+
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.table.fixed_column_width_table import (
+    FixedColumnWidthTable,
+)
+from borb.pdf.canvas.layout.table.flexible_column_width_table import (
+    FlexibleColumnWidthTable,
+)
+from borb.pdf.canvas.layout.table.table import Table
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestAddLargeTablePerformance(unittest.TestCase):
+    """
+    This test builds (and lays out) a Table with many rows.
+    Table keeps an index of its TableCell objects (by grid coordinate, row and column),
+    so adding a TableCell (or looking one up) does not involve scanning every TableCell.
+    """
+
+    NUMBER_OF_ROWS: int = 10000
+
+    @staticmethod
+    def _build_table(table: Table) -> float:
+        delta: float = time.time()
+        for i in range(0, table._number_of_rows):
+            table.add(Paragraph("Item %d" % i))
+            table.add(Paragraph("1"))
+            table.add(Paragraph("%d.00" % i))
+        return time.time() - delta
+
+    @staticmethod
+    def _layout_table(table: Table) -> float:
+        delta: float = time.time()
+        table.get_layout_box(
+            Rectangle(Decimal(0), Decimal(0), Decimal(500), Decimal(10000000))
+        )
+        return time.time() - delta
+
+    def test_add_large_fixed_column_width_table(self):
+
+        table: Table = FixedColumnWidthTable(
+            number_of_rows=TestAddLargeTablePerformance.NUMBER_OF_ROWS,
+            number_of_columns=3,
+        )
+        delta_build: float = TestAddLargeTablePerformance._build_table(table)
+        delta_layout: float = TestAddLargeTablePerformance._layout_table(table)
+
+        # debug
+        print(
+            "FixedColumnWidthTable (%d rows), build: %f, layout: %f"
+            % (TestAddLargeTablePerformance.NUMBER_OF_ROWS, delta_build, delta_layout)
+        )
+
+        # check
+        assert len(table._get_cells_at_row(table._number_of_rows - 1)) == 3
+
+    def test_add_large_flexible_column_width_table(self):
+
+        table: Table = FlexibleColumnWidthTable(
+            number_of_rows=TestAddLargeTablePerformance.NUMBER_OF_ROWS,
+            number_of_columns=3,
+        )
+        delta_build: float = TestAddLargeTablePerformance._build_table(table)
+        delta_layout: float = TestAddLargeTablePerformance._layout_table(table)
+
+        # debug
+        print(
+            "FlexibleColumnWidthTable (%d rows), build: %f, layout: %f"
+            % (TestAddLargeTablePerformance.NUMBER_OF_ROWS, delta_build, delta_layout)
+        )
+
+        # check
+        assert len(table._get_cells_at_column(0)) == table._number_of_rows
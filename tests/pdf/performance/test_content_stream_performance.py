@@ -0,0 +1,142 @@
+import io
+import random
+import time
+import typing
+import unittest
+import zlib
+from decimal import Decimal
+
+from borb.io.read.types import Name
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.page_layout.page_layout import PageLayout
+from borb.pdf.canvas.layout.table.fixed_column_width_table import (
+    FixedColumnWidthTable,
+)
+from borb.pdf.canvas.layout.table.table import Table
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.content_stream import ContentStream
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestContentStreamPerformance(unittest.TestCase):
+    """
+    This test builds a 1000-page report (every Page holding a title, a Table and some Paragraph objects),
+    and writes it to a PDF.
+    """
+
+    NUMBER_OF_PAGES: int = 1000
+
+    WORDS: typing.List[str] = [
+        "lorem",
+        "ipsum",
+        "dolor",
+        "sit",
+        "amet",
+        "consectetur",
+        "adipiscing",
+        "elit",
+        "sed",
+        "do",
+    ]
+
+    def test_content_stream_is_compressed_lazily(self):
+        content_stream: ContentStream = ContentStream()
+        content_stream.append(b"q")
+        content_stream.append(b"1 0 0 1 0 0 cm")
+        content_stream.append(b"\nQ")
+
+        # nothing has been compressed (yet)
+        assert "Bytes" not in dict.keys(content_stream)
+        assert content_stream["DecodedBytes"] == b"q 1 0 0 1 0 0 cm\nQ"
+        assert "Bytes" not in dict.keys(content_stream)
+
+        # /Bytes and /Length are calculated when they are needed
+        assert zlib.decompress(content_stream["Bytes"]) == b"q 1 0 0 1 0 0 cm\nQ"
+        assert content_stream["Length"] == len(content_stream["Bytes"])
+
+        # appending (or setting /DecodedBytes) invalidates /Bytes and /Length
+        content_stream.append(b"BT")
+        assert "Bytes" not in dict.keys(content_stream)
+        assert zlib.decompress(content_stream["Bytes"]) == b"q 1 0 0 1 0 0 cm\nQ BT"
+        content_stream[Name("DecodedBytes")] = b"BT ET"
+        assert zlib.decompress(content_stream["Bytes"]) == b"BT ET"
+
+    def test_content_stream_keys_and_is_modified(self):
+        content_stream: ContentStream = ContentStream()
+        content_stream.set_is_modified(False)
+        content_stream.append(b"q")
+        assert content_stream.is_modified()
+
+        # /Bytes and /Length are only keys once they have been calculated
+        assert "Bytes" not in content_stream
+        assert "Bytes" not in content_stream.keys()
+        assert len(content_stream) == len([k for k in content_stream])
+        assert content_stream.get("Length") == len(content_stream["Bytes"])
+        assert "Bytes" in content_stream
+        assert "Length" in content_stream.keys()
+        assert len(content_stream) == len([k for k in content_stream])
+
+        # setting /DecodedBytes marks the ContentStream as modified
+        content_stream.set_is_modified(False)
+        content_stream[Name("DecodedBytes")] = b"BT ET"
+        assert content_stream.is_modified()
+        assert "Bytes" not in content_stream
+
+    def test_write_1000_page_report(self):
+
+        random.seed(0)
+
+        # create Document
+        doc: Document = Document()
+
+        # add content
+        delta_layout: float = time.time()
+        for i in range(0, TestContentStreamPerformance.NUMBER_OF_PAGES):
+            page: Page = Page()
+            doc.add_page(page)
+            layout: PageLayout = SingleColumnLayout(page)
+            layout.add(
+                Paragraph(
+                    "Section %d" % (i + 1),
+                    font="Helvetica-Bold",
+                    font_size=Decimal(20),
+                )
+            )
+            table: Table = FixedColumnWidthTable(number_of_rows=4, number_of_columns=3)
+            for _ in range(0, 12):
+                table.add(Paragraph(random.choice(TestContentStreamPerformance.WORDS)))
+            layout.add(table)
+            for _ in range(0, 3):
+                layout.add(
+                    Paragraph(
+                        " ".join(
+                            [
+                                random.choice(TestContentStreamPerformance.WORDS)
+                                for _ in range(0, 40)
+                            ]
+                        )
+                    )
+                )
+        delta_layout = time.time() - delta_layout
+
+        # write
+        delta_dumps: float = time.time()
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            pdf_bytes: bytes = pdf_file_handle.getvalue()
+        delta_dumps = time.time() - delta_dumps
+
+        # debug
+        print("laying out 1000 pages: %f" % delta_layout)
+        print("writing 1000 pages: %f" % delta_dumps)
+
+        # check
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        PDF.loads(io.BytesIO(pdf_bytes), [l])
+        for i in [0, 499, 999]:
+            assert l.get_text_for_page(i).startswith("Section %d\n" % (i + 1))
@@ -0,0 +1,185 @@
+import io
+import random
+import time
+import typing
+import unittest
+from decimal import Decimal
+
+from PIL import Image as PILImage  # type: ignore [import]
+
+from borb.io.filter.lzw_decode import LZWDecode
+from borb.io.filter.lzw_encode import LZWEncode
+from borb.io.filter.stream_decode_util import decode_stream
+from borb.io.read.types import Dictionary, Name, Stream
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestDecodeLZWPerformance(unittest.TestCase):
+    """
+    This test decodes (large) LZW encoded streams.
+    LZWDecode reads its codes from an integer bit buffer (using shifts and masks),
+    and allocates its code table (at its maximum size) once.
+    """
+
+    WORDS: typing.List[bytes] = [
+        b"lorem",
+        b"ipsum",
+        b"dolor",
+        b"sit",
+        b"amet",
+        b"consectetur",
+        b"adipiscing",
+        b"elit",
+        b"BT",
+        b"ET",
+        b"Tf",
+        b"Td",
+        b"Tj",
+    ]
+
+    @staticmethod
+    def _decode_using_bit_strings(bytes_in: bytes) -> bytes:
+        # this is the (previous) implementation of LZWDecode,
+        # every byte is turned into a list of bits, every code is parsed from a str
+        bits: typing.List[int] = []
+        pos: int = 0
+
+        def _next(n: int) -> int:
+            nonlocal bits, pos
+            while n > len(bits):
+                if pos >= len(bytes_in):
+                    return 257
+                bits += [int(x) for x in "{0:08b}".format(bytes_in[pos])]
+                pos += 1
+            x: typing.List[int] = bits[:n]
+            bits = bits[n:]
+            return int("".join([str(y) for y in x]), 2)
+
+        table: typing.Dict[int, bytes] = {}
+        table_index: int = 258
+        bits_to_read: int = 9
+        bytes_out: bytearray = bytearray()
+        prev_code: int = 0
+        while True:
+            code: int = _next(bits_to_read)
+            if code == 257:
+                break
+            if code == 256:
+                table = {i: i.to_bytes(1, "big") for i in range(0, 256)}
+                table_index = 258
+                bits_to_read = 9
+                code = _next(bits_to_read)
+                if code == 257:
+                    break
+                bytes_out += table[code]
+                prev_code = code
+                continue
+            x: bytes = table[code] if code < table_index else table[prev_code]
+            if code >= table_index:
+                x = x + x[0:1]
+            bytes_out += x
+            table[table_index] = table[prev_code] + x[0:1] if code < table_index else x
+            table_index += 1
+            bits_to_read = {511: 10, 1023: 11, 2047: 12}.get(table_index, bits_to_read)
+            prev_code = code
+        return bytes(bytes_out)
+
+    @staticmethod
+    def _build_content_stream(number_of_words: int) -> bytes:
+        random.seed(0)
+        return b" ".join(
+            [
+                random.choice(TestDecodeLZWPerformance.WORDS)
+                for _ in range(0, number_of_words)
+            ]
+        )
+
+    def test_decode_lzw(self):
+
+        bytes_in: bytes = TestDecodeLZWPerformance._build_content_stream(50000)
+        bytes_lzw: bytes = LZWEncode.encode(bytes_in)
+
+        # decode (using bit strings)
+        delta_bit_strings: float = time.time()
+        bytes_out_bit_strings: bytes = (
+            TestDecodeLZWPerformance._decode_using_bit_strings(bytes_lzw)
+        )
+        delta_bit_strings = time.time() - delta_bit_strings
+
+        # decode
+        delta: float = time.time()
+        bytes_out: bytes = LZWDecode.decode(bytes_lzw)
+        delta = time.time() - delta
+
+        # debug
+        print(
+            "decoding %d bytes of LZW: %f (bit strings), %f (bit buffer)"
+            % (len(bytes_in), delta_bit_strings, delta)
+        )
+
+        # check
+        assert bytes_out == bytes_in
+        assert bytes_out_bit_strings == bytes_in
+
+    def test_encode_and_decode_lzw_without_early_change(self):
+        for bytes_in in [
+            b"",
+            b"TOBEORNOTTOBEORTOBEORNOT",
+            bytes(100000),
+            bytes([random.randint(0, 255) for _ in range(0, 100000)]),
+        ]:
+            bytes_lzw: bytes = LZWEncode.encode(bytes_in, early_change=0)
+            assert LZWDecode.decode(bytes_lzw, early_change=0) == bytes_in
+
+    def test_decode_tiff_lzw(self):
+
+        # TIFF uses the same LZW compression (with early change)
+        random.seed(0)
+        im: PILImage.Image = PILImage.new("L", (256, 64))
+        im.putdata(
+            [(i % 256) // 16 * 16 + random.randint(0, 3) for i in range(0, 256 * 64)]
+        )
+        with io.BytesIO() as tiff_file_handle:
+            im.save(tiff_file_handle, "TIFF", compression="tiff_lzw")
+            tiff_bytes: bytes = tiff_file_handle.getvalue()
+            with PILImage.open(io.BytesIO(tiff_bytes)) as tiff:
+                strip_offsets = tiff.tag_v2[273]
+                strip_byte_counts = tiff.tag_v2[279]
+
+        # check
+        assert (
+            b"".join(
+                [
+                    LZWDecode.decode(tiff_bytes[offset : offset + byte_count])
+                    for offset, byte_count in zip(strip_offsets, strip_byte_counts)
+                ]
+            )
+            == im.tobytes()
+        )
+
+    def test_decode_lzw_stream_with_png_predictor(self):
+
+        # 3 rows of 4 bytes, each row uses PNG_FILTER_SUB
+        rows: typing.List[bytes] = [
+            bytes([1, 2, 3, 4]),
+            bytes([5, 5, 5, 5]),
+            bytes([0, 0, 0, 0]),
+        ]
+        predicted_bytes: bytes = b"".join(
+            [
+                bytes([1, r[0]] + [(r[i] - r[i - 1]) % 256 for i in range(1, 4)])
+                for r in rows
+            ]
+        )
+
+        s: Stream = Stream()
+        s[Name("Filter")] = Name("LZWDecode")
+        s[Name("DecodeParms")] = Dictionary()
+        s[Name("DecodeParms")][Name("Predictor")] = Decimal(12)
+        s[Name("DecodeParms")][Name("Columns")] = Decimal(4)
+        s[Name("Bytes")] = LZWEncode.encode(predicted_bytes)
+        decode_stream(s)
+
+        # check
+        assert s["DecodedBytes"] == b"".join(rows)
@@ -0,0 +1,87 @@
+import pickle
+import time
+import typing
+import unittest
+from decimal import Decimal
+
+from borb.io.read.types import Function, Name
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestEvaluatePostScriptFunctionPerformance(unittest.TestCase):
+    """
+    This test evaluates a (type 4) PostScript calculator Function many times.
+    The PostScript program is compiled (once) and cached on the Function,
+    and Function.evaluate_many evaluates many inputs in a single call.
+    """
+
+    @staticmethod
+    def _build_function() -> Function:
+        f: Function = Function()
+        f[Name("FunctionType")] = Decimal(4)
+        f[Name("Domain")] = [Decimal(0), Decimal(1)]
+        f[Name("Range")] = [Decimal(0), Decimal(1)] * 4
+        f[Name("DecodedBytes")] = b"""
+        {
+            dup 0.5 gt
+            { 1 exch sub 2 mul }
+            { 2 mul }
+            ifelse
+            dup 0.25 mul exch
+            dup 0.5 mul exch
+            dup 0.75 mul exch
+        }
+        """
+        return f
+
+    def test_evaluate_postscript_function(self):
+
+        f: Function = TestEvaluatePostScriptFunctionPerformance._build_function()
+        xss: typing.List[typing.List[Decimal]] = [
+            [Decimal(i) / Decimal(10000)] for i in range(0, 10000)
+        ]
+
+        # evaluate (one input at a time)
+        delta: float = time.time()
+        yss: typing.List[typing.List[Decimal]] = [f.evaluate(xs) for xs in xss]
+        delta = time.time() - delta
+
+        # evaluate (all inputs at once)
+        delta_many: float = time.time()
+        yss_many: typing.List[typing.List[Decimal]] = f.evaluate_many(xss)
+        delta_many = time.time() - delta_many
+
+        # debug
+        print(
+            "evaluating PostScript function 10000 times: %f (evaluate), %f (evaluate_many)"
+            % (delta, delta_many)
+        )
+
+        # check
+        assert yss == yss_many
+        assert yss[2500] == [
+            Decimal(0.125),
+            Decimal(0.25),
+            Decimal(0.375),
+            Decimal(0.5),
+        ]
+        assert yss[7500] == [
+            Decimal(0.125),
+            Decimal(0.25),
+            Decimal(0.375),
+            Decimal(0.5),
+        ]
+
+    def test_compiled_postscript_function_can_be_pickled(self):
+
+        f: Function = TestEvaluatePostScriptFunctionPerformance._build_function()
+        ys: typing.List[Decimal] = f.evaluate([Decimal(0.25)])
+        assert f._postscript_program is not None
+
+        # the compiled program is pickled as its source
+        g: Function = pickle.loads(pickle.dumps(f))
+        assert g.evaluate([Decimal(0.25)]) == ys
+
+        # input values are clipped to the domain
+        assert f.evaluate([Decimal(2)]) == f.evaluate([Decimal(1)])
@@ -0,0 +1,63 @@
+import time
+import typing
+import unittest
+from decimal import Decimal
+
+from borb.io.read.types import Function, Name
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestEvaluateSampledFunctionPerformance(unittest.TestCase):
+    """
+    This test evaluates a (type 0) sampled Function many times.
+    The sample table is unpacked (once) into an array, values are interpolated between the surrounding samples,
+    and the most recently used inputs (and their outputs) are remembered.
+    """
+
+    @staticmethod
+    def _build_sampled_function(
+        size: typing.List[int], bits_per_sample: int, samples: bytes, n: int
+    ) -> Function:
+        f: Function = Function()
+        f[Name("FunctionType")] = Decimal(0)
+        f[Name("Domain")] = [Decimal(0), Decimal(1)] * len(size)
+        f[Name("Range")] = [Decimal(0), Decimal(1)] * n
+        f[Name("Size")] = [Decimal(x) for x in size]
+        f[Name("BitsPerSample")] = Decimal(bits_per_sample)
+        f[Name("DecodedBytes")] = samples
+        return f
+
+    def test_evaluate_sampled_function(self):
+
+        # 1 input, 4 outputs (e.g. a tint transform to DeviceCMYK)
+        f: Function = TestEvaluateSampledFunctionPerformance._build_sampled_function(
+            [256], 8, bytes([x for i in range(0, 256) for x in [i, i, 255 - i, 0]]), 4
+        )
+
+        # evaluate
+        delta: float = time.time()
+        for i in range(0, 10000):
+            f.evaluate([Decimal(i) / Decimal(10000)])
+        delta = time.time() - delta
+
+        # evaluate (a few distinct inputs, many times)
+        delta_cached: float = time.time()
+        for i in range(0, 10000):
+            f.evaluate([Decimal(i % 100) / Decimal(100)])
+        delta_cached = time.time() - delta_cached
+
+        # debug
+        print(
+            "evaluating sampled function 10000 times: %f (10000 inputs), %f (100 inputs)"
+            % (delta, delta_cached)
+        )
+
+        # check
+        ys: typing.List[Decimal] = f.evaluate([Decimal(0.5)])
+        assert [round(y, 4) for y in ys] == [
+            Decimal("0.5"),
+            Decimal("0.5"),
+            Decimal("0.5"),
+            Decimal("0"),
+        ]
@@ -0,0 +1,119 @@
+import io
+import time
+import typing
+import unittest
+from decimal import Decimal
+
+from PIL import Image as PILImage  # type: ignore [import]
+
+from borb.pdf.canvas.layout.image.image import Image
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.page_layout.page_layout import PageLayout
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.export.pdf_to_jpg import PDFToJPG
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestExportInParallelPerformance(unittest.TestCase):
+    """
+    This test exports a Document with many pages to JPG, using a pool of worker processes.
+    Each worker receives the content stream and resources of a single Page (rather than the entire PDF),
+    and the rendered pages are yielded as soon as they are done.
+    """
+
+    NUMBER_OF_PAGES: int = 32
+
+    @staticmethod
+    def _build_document() -> Document:
+        doc: Document = Document()
+        for i in range(0, TestExportInParallelPerformance.NUMBER_OF_PAGES):
+            page: Page = Page()
+            doc.add_page(page)
+            layout: PageLayout = SingleColumnLayout(page)
+            layout.add(
+                Image(
+                    PILImage.new("RGB", (256, 256), color=(i * 8, 128, 255 - i * 8)),
+                    width=Decimal(256),
+                    height=Decimal(256),
+                )
+            )
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            return PDF.loads(io.BytesIO(pdf_file_handle.getvalue()))
+
+    def test_convert_many_pages_to_jpg_in_parallel(self):
+
+        doc: Document = TestExportInParallelPerformance._build_document()
+
+        # convert (sequential)
+        delta_sequential: float = time.time()
+        jpg_per_page: typing.Dict[int, PILImage.Image] = PDFToJPG.convert_pdf_to_jpg(
+            doc
+        )
+        delta_sequential = time.time() - delta_sequential
+
+        # convert (parallel)
+        delta_parallel: float = time.time()
+        page_nrs: typing.List[int] = []
+        for page_nr, jpg in PDFToJPG.convert_pdf_to_jpg_in_parallel(
+            doc, number_of_workers=4
+        ):
+            page_nrs.append(page_nr)
+            assert jpg.tobytes() == jpg_per_page[page_nr].tobytes()
+        delta_parallel = time.time() - delta_parallel
+
+        # debug
+        print(
+            "converting %d pages to JPG: %f (sequential), %f (4 workers)"
+            % (
+                TestExportInParallelPerformance.NUMBER_OF_PAGES,
+                delta_sequential,
+                delta_parallel,
+            )
+        )
+
+        # check
+        assert sorted(page_nrs) == [
+            x for x in range(0, TestExportInParallelPerformance.NUMBER_OF_PAGES)
+        ]
+
+    def test_convert_page_range_to_jpg_at_dpi(self):
+
+        doc: Document = TestExportInParallelPerformance._build_document()
+
+        # convert
+        jpg_per_page: typing.Dict[int, PILImage.Image] = {
+            page_nr: jpg
+            for page_nr, jpg in PDFToJPG.convert_pdf_to_jpg_in_parallel(
+                doc, page_range=[0, 5], dpi=Decimal(144), number_of_workers=1
+            )
+        }
+
+        # check
+        assert sorted(jpg_per_page.keys()) == [0, 5]
+        assert jpg_per_page[5].size == (1190, 1684)
+
+    def test_convert_lazy_memory_mapped_document_to_jpg_in_parallel(self):
+
+        # read document (lazy, memory-mapped)
+        doc: Document = TestExportInParallelPerformance._build_document()
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            doc = PDF.loads(
+                io.BytesIO(pdf_file_handle.getvalue()), memory_map=True, lazy=True
+            )
+
+        # convert
+        jpg_per_page: typing.Dict[int, PILImage.Image] = {
+            page_nr: jpg
+            for page_nr, jpg in PDFToJPG.convert_pdf_to_jpg_in_parallel(
+                doc, page_range=[0, 1], number_of_workers=2
+            )
+        }
+
+        # check
+        assert sorted(jpg_per_page.keys()) == [0, 1]
+        assert jpg_per_page[1].size == (595, 842)
@@ -0,0 +1,86 @@
+import io
+import time
+import typing
+import unittest
+import xml.etree.ElementTree as ET
+
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.page_layout.page_layout import PageLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.export.pdf_to_jpg import PDFToJPG, _SystemFonts
+from borb.toolkit.export.pdf_to_svg import PDFToSVG
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestExportManyPagesPerformance(unittest.TestCase):
+    """
+    This test exports a Document with many pages.
+    The system fonts are indexed (at most) once per process, ImageFont objects are cached,
+    and a single EventListener renders every Page.
+    """
+
+    NUMBER_OF_PAGES: int = 100
+
+    @staticmethod
+    def _build_document() -> Document:
+        doc: Document = Document()
+        for i in range(0, TestExportManyPagesPerformance.NUMBER_OF_PAGES):
+            page: Page = Page()
+            doc.add_page(page)
+            layout: PageLayout = SingleColumnLayout(page)
+            layout.add(Paragraph("Page %d" % (i + 1)))
+            layout.add(Paragraph("Lorem ipsum dolor sit amet"))
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            return PDF.loads(io.BytesIO(pdf_file_handle.getvalue()))
+
+    def test_system_fonts_are_indexed_once(self):
+
+        delta: float = time.time()
+        for _ in range(0, 500):
+            PDFToJPG()
+        delta = time.time() - delta
+
+        # debug
+        print("building 500 PDFToJPG objects: %f" % delta)
+
+        # check
+        assert _SystemFonts.get() is _SystemFonts.get()
+
+    def test_image_fonts_are_cached(self):
+        font_files = _SystemFonts.get().get_font_files()
+        if len(font_files) == 0:
+            return
+        assert _SystemFonts.get_image_font(
+            font_files[0], 12
+        ) is _SystemFonts.get_image_font(font_files[0], 12)
+        assert _SystemFonts.get_image_font(
+            font_files[0], 12
+        ) is not _SystemFonts.get_image_font(font_files[0], 14)
+
+    def test_convert_many_pages_to_svg(self):
+
+        doc: Document = TestExportManyPagesPerformance._build_document()
+
+        # convert
+        delta: float = time.time()
+        svg_per_page: typing.Dict[int, ET.Element] = PDFToSVG.convert_pdf_to_svg(doc)
+        delta = time.time() - delta
+
+        # debug
+        print(
+            "converting %d pages to SVG: %f"
+            % (TestExportManyPagesPerformance.NUMBER_OF_PAGES, delta)
+        )
+
+        # check
+        assert len(svg_per_page) == TestExportManyPagesPerformance.NUMBER_OF_PAGES
+        for i in [0, TestExportManyPagesPerformance.NUMBER_OF_PAGES - 1]:
+            text: typing.List[str] = [
+                x.text or "" for x in svg_per_page[i] if x.tag == "text"
+            ]
+            assert "Page %d" % (i + 1) in " ".join(text)
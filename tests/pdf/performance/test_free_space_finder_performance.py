@@ -0,0 +1,109 @@
+import random
+import time
+import typing
+import unittest
+from decimal import Decimal
+
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.free_space_finder import FreeSpaceFinder
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestFreeSpaceFinderPerformance(unittest.TestCase):
+    """
+    This test looks for free space on a (densely used) Page, at a fine resolution.
+    FreeSpaceFinder.Grid checks whether a Rectangle is free in constant time (using a summed-area table),
+    and searches outwards from the desired location (rather than checking every possible location).
+    """
+
+    @staticmethod
+    def _build_grid(resolution: Decimal) -> FreeSpaceFinder.Grid:
+        random.seed(0)
+        grid: FreeSpaceFinder.Grid = FreeSpaceFinder.Grid(
+            Decimal(595), Decimal(842), resolution
+        )
+        for _ in range(0, 200):
+            grid._mark_as_unavailable(
+                Rectangle(
+                    Decimal(random.randint(0, 595)),
+                    Decimal(random.randint(0, 842)),
+                    Decimal(random.randint(5, 60)),
+                    Decimal(random.randint(5, 60)),
+                )
+            )
+        return grid
+
+    @staticmethod
+    def _get_free_space_brute_force(
+        grid: FreeSpaceFinder.Grid, desired_rectangle: Rectangle
+    ) -> typing.Optional[typing.Tuple[Decimal, Decimal]]:
+        w: int = int(int(desired_rectangle.width) / grid._resolution)
+        h: int = int(int(desired_rectangle.height) / grid._resolution)
+        best: typing.Optional[typing.Tuple[Decimal, Decimal]] = None
+        best_dist: typing.Optional[Decimal] = None
+        for i in range(0, len(grid._availability) - w):
+            for j in range(0, len(grid._availability[i]) - h):
+                if not all(
+                    [all(grid._availability[i + k][j : j + h]) for k in range(0, w)]
+                ):
+                    continue
+                x: Decimal = Decimal(i * grid._resolution)
+                y: Decimal = Decimal(j * grid._resolution)
+                d: Decimal = (desired_rectangle.x - x) ** 2 + (
+                    desired_rectangle.y - y
+                ) ** 2
+                if best_dist is None or d < best_dist:
+                    best = (x, y)
+                    best_dist = d
+        return best
+
+    def test_get_free_space_at_fine_resolution(self):
+
+        grid: FreeSpaceFinder.Grid = TestFreeSpaceFinderPerformance._build_grid(
+            Decimal(1)
+        )
+
+        # find free space
+        delta: float = time.time()
+        free_rectangle: typing.Optional[Rectangle] = grid._get_free_space(
+            Rectangle(Decimal(300), Decimal(400), Decimal(50), Decimal(50))
+        )
+        delta = time.time() - delta
+
+        # debug
+        print("finding free space (resolution 1): %f" % delta)
+
+        # check
+        assert free_rectangle is not None
+        assert free_rectangle.width == 50
+        assert free_rectangle.height == 50
+
+    def test_get_free_space_matches_brute_force(self):
+
+        grid: FreeSpaceFinder.Grid = TestFreeSpaceFinderPerformance._build_grid(
+            Decimal(10)
+        )
+        for x, y, w, h in [
+            (0, 0, 10, 10),
+            (300, 400, 50, 50),
+            (590, 840, 100, 20),
+            (-50, 500, 30, 120),
+            (150, 150, 400, 400),
+        ]:
+            desired_rectangle: Rectangle = Rectangle(
+                Decimal(x), Decimal(y), Decimal(w), Decimal(h)
+            )
+            free_rectangle: typing.Optional[Rectangle] = grid._get_free_space(
+                desired_rectangle
+            )
+            expected: typing.Optional[
+                typing.Tuple[Decimal, Decimal]
+            ] = TestFreeSpaceFinderPerformance._get_free_space_brute_force(
+                grid, desired_rectangle
+            )
+            if expected is None:
+                assert free_rectangle is None
+                continue
+            assert free_rectangle is not None
+            assert (free_rectangle.x, free_rectangle.y) == expected
@@ -0,0 +1,148 @@
+import io
+import time
+import typing
+import unittest
+from decimal import Decimal
+
+from borb.io.read.types import Name, String
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.page_layout.page_layout import PageLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.toolkit.text.simple_text_extraction import SimpleTextExtraction
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestIncrementalUpdatePerformance(unittest.TestCase):
+    """
+    This test loads a PDF, modifies it, and writes it again (entirely, and as an incremental update).
+    The incremental update should only contain the objects that were modified (or added).
+    """
+
+    NUMBER_OF_PAGES: int = 500
+
+    @staticmethod
+    def _build_pdf() -> bytes:
+        doc: Document = Document()
+        for i in range(0, TestIncrementalUpdatePerformance.NUMBER_OF_PAGES):
+            page: Page = Page()
+            doc.add_page(page)
+            layout: PageLayout = SingleColumnLayout(page)
+            layout.add(Paragraph("Page %d" % (i + 1)))
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            return pdf_file_handle.getvalue()
+
+    @staticmethod
+    def _get_indirect_objects(pdf_bytes: bytes) -> typing.List[bytes]:
+        return [x for x in pdf_bytes.split(b"\n") if x.endswith(b" obj")]
+
+    def test_write_modified_info_dictionary(self):
+
+        pdf_bytes: bytes = TestIncrementalUpdatePerformance._build_pdf()
+
+        # read
+        doc: Document = PDF.loads(io.BytesIO(pdf_bytes), incremental=True)
+
+        # modify /Info
+        doc["XRef"]["Trailer"]["Info"][Name("Title")] = String("Lorem Ipsum")
+
+        # write (incremental update)
+        delta_incremental: float = time.time()
+        with io.BytesIO(pdf_bytes) as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc, incremental=True)
+            pdf_bytes_after_update: bytes = pdf_file_handle.getvalue()
+        delta_incremental = time.time() - delta_incremental
+
+        # write (entire Document)
+        delta_full: float = time.time()
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+        delta_full = time.time() - delta_full
+
+        # debug
+        print(
+            "writing %d pages, incremental update: %f, entire document: %f"
+            % (
+                TestIncrementalUpdatePerformance.NUMBER_OF_PAGES,
+                delta_incremental,
+                delta_full,
+            )
+        )
+
+        # the original bytes are kept, only the /Info dictionary was appended
+        update: bytes = pdf_bytes_after_update[len(pdf_bytes) :]
+        assert pdf_bytes_after_update.startswith(pdf_bytes)
+        assert len(TestIncrementalUpdatePerformance._get_indirect_objects(update)) == 1
+        assert b"/Prev" in update
+
+        # check
+        doc = PDF.loads(io.BytesIO(pdf_bytes_after_update))
+        assert doc["XRef"]["Trailer"]["Info"]["Title"] == "Lorem Ipsum"
+        assert (
+            int(doc.get_document_info().get_number_of_pages())
+            == TestIncrementalUpdatePerformance.NUMBER_OF_PAGES
+        )
+
+    def test_write_modified_and_new_pages(self):
+
+        pdf_bytes: bytes = TestIncrementalUpdatePerformance._build_pdf()
+
+        # read (lazily)
+        doc: Document = PDF.loads(io.BytesIO(pdf_bytes), lazy=True, incremental=True)
+
+        # first update: modify an existing Page
+        Paragraph("Lorem Ipsum").paint(
+            doc.get_page(4),
+            Rectangle(Decimal(100), Decimal(100), Decimal(200), Decimal(50)),
+        )
+        pdf_file_handle: io.BytesIO = io.BytesIO(pdf_bytes)
+        PDF.dumps(pdf_file_handle, doc, incremental=True)
+        pdf_bytes_after_first_update: bytes = pdf_file_handle.getvalue()
+
+        # second update: add a Page
+        page: Page = Page()
+        doc.add_page(page)
+        SingleColumnLayout(page).add(Paragraph("Dolor Sit Amet"))
+        PDF.dumps(pdf_file_handle, doc, incremental=True)
+        pdf_bytes_after_second_update: bytes = pdf_file_handle.getvalue()
+
+        # only the modified Page (and its new content stream) were appended
+        first_update: bytes = pdf_bytes_after_first_update[len(pdf_bytes) :]
+        assert (
+            len(TestIncrementalUpdatePerformance._get_indirect_objects(first_update))
+            == 2
+        )
+
+        # unmodified Page objects were not appended
+        second_update: bytes = pdf_bytes_after_second_update[
+            len(pdf_bytes_after_first_update) :
+        ]
+        assert (
+            len(TestIncrementalUpdatePerformance._get_indirect_objects(second_update))
+            < 10
+        )
+
+        # check
+        l: SimpleTextExtraction = SimpleTextExtraction()
+        doc = PDF.loads(io.BytesIO(pdf_bytes_after_second_update), [l])
+        assert (
+            int(doc.get_document_info().get_number_of_pages())
+            == TestIncrementalUpdatePerformance.NUMBER_OF_PAGES + 1
+        )
+        assert l.get_text_for_page(3) == "Page 4"
+        assert l.get_text_for_page(4) == "Page 5\nLorem Ipsum"
+        assert (
+            l.get_text_for_page(TestIncrementalUpdatePerformance.NUMBER_OF_PAGES)
+            == "Dolor Sit Amet"
+        )
+
+    def test_write_incremental_update_requires_incremental_read(self):
+        pdf_bytes: bytes = TestIncrementalUpdatePerformance._build_pdf()
+        doc: Document = PDF.loads(io.BytesIO(pdf_bytes))
+        with self.assertRaises(AssertionError):
+            PDF.dumps(io.BytesIO(pdf_bytes), doc, incremental=True)
@@ -0,0 +1,170 @@
+import random
+import time
+import typing
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from borb.pdf.canvas.font.font import Font
+from borb.pdf.canvas.font.glyph_line import GlyphLine
+from borb.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.hyphenation.hyphenation import Hyphenation
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.page_layout.page_layout import PageLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestLayoutManyPagesPerformance(unittest.TestCase):
+    """
+    This test lays out a text-only Document of 500 pages.
+    """
+
+    WORDS: typing.List[str] = [
+        "lorem",
+        "ipsum",
+        "dolor",
+        "sit",
+        "amet",
+        "consectetur",
+        "adipiscing",
+        "elit",
+        "sed",
+        "do",
+        "eiusmod",
+        "tempor",
+        "incididunt",
+        "ut",
+        "labore",
+        "et",
+        "dolore",
+        "magna",
+        "aliqua",
+    ]
+
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        # find output dir
+        p: Path = Path(__file__).parent
+        while "output" not in [x.stem for x in p.iterdir() if x.is_dir()]:
+            p = p.parent
+        p = p / "output"
+        self.output_dir = Path(p, Path(__file__).stem.replace(".py", ""))
+        if not self.output_dir.exists():
+            self.output_dir.mkdir()
+
+    @staticmethod
+    def _get_text(number_of_words: int) -> str:
+        return " ".join(
+            [
+                random.choice(TestLayoutManyPagesPerformance.WORDS)
+                for _ in range(0, number_of_words)
+            ]
+        )
+
+    def test_layout_500_pages(self):
+
+        random.seed(0)
+        helvetica: Font = StandardType1Font("Helvetica")
+
+        # create Document
+        doc: Document = Document()
+        page: Page = Page()
+        doc.add_page(page)
+        layout: PageLayout = SingleColumnLayout(page)
+
+        # add Paragraph objects until the Document has 500 pages
+        delta: float = time.time()
+        while int(doc.get_document_info().get_number_of_pages()) < 500:
+            layout.add(
+                Paragraph(TestLayoutManyPagesPerformance._get_text(120), font=helvetica)
+            )
+        delta = time.time() - delta
+
+        # debug
+        print("laying out 500 pages: %f" % delta)
+
+        # write
+        with open(self.output_dir / "output.pdf", "wb") as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+
+    def test_optimal_line_breaking(self):
+
+        random.seed(0)
+        helvetica: Font = StandardType1Font("Helvetica")
+        bounding_box: Rectangle = Rectangle(
+            Decimal(0), Decimal(0), Decimal(200), Decimal(1000)
+        )
+
+        for _ in range(0, 20):
+            text: str = TestLayoutManyPagesPerformance._get_text(100)
+            greedy_lines: typing.List[str] = Paragraph(
+                text, font=helvetica
+            )._split_text(bounding_box)
+            optimal_lines: typing.List[str] = Paragraph(
+                text, font=helvetica, optimal_line_breaking=True
+            )._split_text(bounding_box)
+
+            # both contain the same text
+            assert " ".join(greedy_lines) == text
+            assert " ".join(optimal_lines) == text
+
+            # every line fits
+            widths: typing.List[Decimal] = [
+                GlyphLine.from_str(x, helvetica, Decimal(12)).get_width_in_text_space()
+                for x in optimal_lines
+            ]
+            assert all([w <= Decimal(200) for w in widths])
+
+            # the white space at the end of the lines (except the last one) is minimal
+            def _cost(lines: typing.List[str]) -> Decimal:
+                return sum(
+                    [
+                        (
+                            Decimal(200)
+                            - GlyphLine.from_str(
+                                x, helvetica, Decimal(12)
+                            ).get_width_in_text_space()
+                        )
+                        ** 2
+                        for x in lines[:-1]
+                    ],
+                    Decimal(0),
+                )
+
+            assert _cost(optimal_lines) <= _cost(greedy_lines)
+
+    def test_hyphenate_lazily(self):
+
+        # keep track of the words that are hyphenated
+        hyphenated_words: typing.List[str] = []
+
+        class CountingHyphenation(Hyphenation):
+            def hyphenate(self, s: str, hyphenation_character: str = chr(173)) -> str:
+                hyphenated_words.append(s)
+                return super().hyphenate(s, hyphenation_character)
+
+        random.seed(0)
+        hyphenation: Hyphenation = CountingHyphenation("en-gb")
+        text: str = TestLayoutManyPagesPerformance._get_text(100)
+
+        # text that fits on a single line is not hyphenated
+        lines: typing.List[str] = Paragraph(text, hyphenation=hyphenation)._split_text(
+            Rectangle(Decimal(0), Decimal(0), Decimal(10000), Decimal(1000))
+        )
+        assert len(lines) == 1
+        assert len(hyphenated_words) == 0
+
+        # only words that do not fit on a line are hyphenated (once)
+        lines = Paragraph(text, hyphenation=hyphenation)._split_text(
+            Rectangle(Decimal(0), Decimal(0), Decimal(200), Decimal(1000))
+        )
+        assert len(lines) > 1
+        assert len(hyphenated_words) <= len(lines)
+        assert len(hyphenated_words) == len(set(hyphenated_words))
+        assert "".join(lines).replace("-", "").replace(" ", "") == text.replace(" ", "")
@@ -0,0 +1,80 @@
+import time
+import tracemalloc
+import typing
+import unittest
+
+from borb.io.read.tokenize.high_level_tokenizer import HighLevelTokenizer
+from borb.io.read.types import Decimal, Dictionary, List, Name, String
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestObjectModelMemoryPerformance(unittest.TestCase):
+    @staticmethod
+    def _build_content(number_of_dictionaries: int) -> bytes:
+        out: bytes = b"["
+        for i in range(0, number_of_dictionaries):
+            out += b"<< /Type /Annot /Subtype /Link /Rect [%d %d %d %d] " % (
+                i,
+                i + 1,
+                i + 2,
+                i + 3,
+            )
+            out += b"/Border [0 0 1] /C [0.5 0.25 0.125] /Contents (link %d) >>\n" % i
+        out += b"]"
+        return out
+
+    @staticmethod
+    def _count_objects(obj: typing.Any) -> int:
+        n: int = 0
+        todo: typing.List[typing.Any] = [obj]
+        while len(todo) > 0:
+            o = todo.pop(-1)
+            n += 1
+            if isinstance(o, Dictionary):
+                for k, v in o.items():
+                    todo.append(k)
+                    todo.append(v)
+            elif isinstance(o, List):
+                todo.extend(o)
+        return n
+
+    def test_name_objects_are_interned(self):
+        assert Name("Type") is Name("Type")
+        assert Name("Type") is not Name("Subtype")
+        assert Name("Type").get_parent() is None
+        assert Name("Type").set_parent(Dictionary()).get_parent() is None
+
+    def test_objects_have_no_instance_dictionary(self):
+        for obj in [Decimal(1), Dictionary(), List(), Name("Type"), String("abc")]:
+            assert not hasattr(obj, "__dict__")
+
+    def test_parse_many_objects(self):
+
+        content: bytes = TestObjectModelMemoryPerformance._build_content(2000)
+
+        # parse
+        delta: float = time.time()
+        obj = HighLevelTokenizer(content).read_object()
+        delta = time.time() - delta
+
+        # parse (measuring memory)
+        tracemalloc.start()
+        obj = HighLevelTokenizer(content).read_object()
+        memory_in_use, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # count
+        number_of_objects: int = TestObjectModelMemoryPerformance._count_objects(obj)
+        objects_per_megabyte: float = number_of_objects / (memory_in_use / 1024 / 1024)
+
+        # debug
+        print(
+            "parsed %d objects in %f seconds, using %d bytes (%f objects per MB)"
+            % (number_of_objects, delta, memory_in_use, objects_per_megabyte)
+        )
+
+        # check
+        assert isinstance(obj, List)
+        assert len(obj) == 2000
+        assert objects_per_megabyte > 5000
@@ -0,0 +1,95 @@
+import io
+import time
+import unittest
+
+from borb.pdf.document.document import Document
+from borb.pdf.pdf import PDF
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestOpenDocumentWithManyObjectsPerformance(unittest.TestCase):
+    @staticmethod
+    def _build_pdf(number_of_objects: int) -> bytes:
+        """
+        This function builds a PDF with a single (empty) Page,
+        and number_of_objects (unused) objects. The PDF has an incremental update
+        (with a /Prev XREF) that re-declares all objects, forcing the XREF sections to be merged.
+        """
+        out: bytearray = bytearray(b"%PDF-1.7\n")
+        offsets: list = [0]
+
+        # catalog, pages, page
+        offsets.append(len(out))
+        out += b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n"
+        offsets.append(len(out))
+        out += b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n"
+        offsets.append(len(out))
+        out += b"3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents 4 0 R >>\nendobj\n"
+        offsets.append(len(out))
+        out += b"4 0 obj\n<< /Length 0 >>\nstream\n\nendstream\nendobj\n"
+
+        # filler objects
+        for i in range(5, number_of_objects + 1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n%d\nendobj\n" % (i, i)
+
+        # xref
+        start_of_xref: int = len(out)
+        out += b"xref\n0 %d\n" % len(offsets)
+        out += b"0000000000 65535 f\r\n"
+        for o in offsets[1:]:
+            out += b"%010d 00000 n\r\n" % o
+        out += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % len(offsets)
+        out += b"startxref\n%d\n%%%%EOF\n" % start_of_xref
+
+        # incremental update (re-declaring every object)
+        start_of_update: int = len(out)
+        out += b"xref\n0 %d\n" % len(offsets)
+        out += b"0000000000 65535 f\r\n"
+        for o in offsets[1:]:
+            out += b"%010d 00000 n\r\n" % o
+        out += b"trailer\n<< /Size %d /Root 1 0 R /Prev %d >>\n" % (
+            len(offsets),
+            start_of_xref,
+        )
+        out += b"startxref\n%d\n%%%%EOF\n" % start_of_update
+
+        # return
+        return bytes(out)
+
+    @staticmethod
+    def _open(pdf_bytes: bytes) -> float:
+        delta: float = time.time()
+        doc: Document = PDF.loads(io.BytesIO(pdf_bytes))
+        delta = time.time() - delta
+        assert int(doc.get_document_info().get_number_of_pages()) == 1
+        return delta
+
+    def test_open_document_with_200k_objects(self):
+
+        delta_001: float = TestOpenDocumentWithManyObjectsPerformance._open(
+            TestOpenDocumentWithManyObjectsPerformance._build_pdf(50000)
+        )
+        delta_002: float = TestOpenDocumentWithManyObjectsPerformance._open(
+            TestOpenDocumentWithManyObjectsPerformance._build_pdf(200000)
+        )
+
+        # debug
+        print(
+            "opening 50k objects: %f, opening 200k objects: %f" % (delta_001, delta_002)
+        )
+
+    def test_lookup_objects_in_document_with_200k_objects(self):
+
+        doc: Document = PDF.loads(
+            io.BytesIO(TestOpenDocumentWithManyObjectsPerformance._build_pdf(200000))
+        )
+        xref = doc["XRef"]
+        # entries re-declared by the incremental update are merged (not duplicated)
+        assert len(xref) == 200001
+        delta: float = time.time()
+        for i in range(190000, 200001):
+            assert xref.get_entry(i) is not None
+        delta = time.time() - delta
+        print("looking up 10k objects: %f" % delta)
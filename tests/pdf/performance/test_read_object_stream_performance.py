@@ -0,0 +1,109 @@
+import io
+import time
+import unittest
+import zlib
+
+from borb.io.read.types import Decimal, List
+from borb.pdf.document.document import Document
+from borb.pdf.pdf import PDF
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestReadObjectStreamPerformance(unittest.TestCase):
+    @staticmethod
+    def _build_pdf(number_of_objects: int) -> bytes:
+        """
+        This function builds a PDF with a single (empty) Page, and a cross-reference stream.
+        The /Catalog has an entry /Numbers, holding a Reference to each of number_of_objects objects,
+        all of which are stored in one object stream (ObjStm).
+        """
+        out: bytearray = bytearray(b"%PDF-1.7\n")
+
+        # object numbers
+        # 1 catalog, 2 pages, 3 page, 4 content stream, 5 object stream, 6.. compressed objects, last: xref stream
+        first_compressed_object: int = 6
+        xref_stream_object: int = first_compressed_object + number_of_objects
+
+        # catalog, pages, page, content stream
+        offsets: dict = {}
+        offsets[1] = len(out)
+        out += b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R /Numbers ["
+        out += b" ".join(
+            [
+                b"%d 0 R" % (first_compressed_object + i)
+                for i in range(0, number_of_objects)
+            ]
+        )
+        out += b"] >>\nendobj\n"
+        offsets[2] = len(out)
+        out += b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n"
+        offsets[3] = len(out)
+        out += b"3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents 4 0 R >>\nendobj\n"
+        offsets[4] = len(out)
+        out += b"4 0 obj\n<< /Length 0 >>\nstream\n\nendstream\nendobj\n"
+
+        # object stream
+        header: bytes = b""
+        body: bytes = b""
+        for i in range(0, number_of_objects):
+            header += b"%d %d " % (first_compressed_object + i, len(body))
+            body += b"%d " % i
+        object_stream_bytes: bytes = zlib.compress(header + body)
+        offsets[5] = len(out)
+        out += (
+            b"5 0 obj\n<< /Type /ObjStm /N %d /First %d /Length %d /Filter /FlateDecode >>\nstream\n"
+            % (number_of_objects, len(header), len(object_stream_bytes))
+        )
+        out += object_stream_bytes
+        out += b"\nendstream\nendobj\n"
+
+        # xref stream (W [1 4 2])
+        xref_stream_bytes: bytes = b"\x00\x00\x00\x00\x00\xff\xff"
+        for i in range(1, 6):
+            xref_stream_bytes += b"\x01" + offsets[i].to_bytes(4, "big") + b"\x00\x00"
+        for i in range(0, number_of_objects):
+            xref_stream_bytes += b"\x02" + (5).to_bytes(4, "big") + i.to_bytes(2, "big")
+        start_of_xref: int = len(out)
+        xref_stream_bytes += b"\x01" + start_of_xref.to_bytes(4, "big") + b"\x00\x00"
+        out += (
+            b"%d 0 obj\n<< /Type /XRef /Size %d /W [1 4 2] /Root 1 0 R /Length %d >>\nstream\n"
+            % (xref_stream_object, xref_stream_object + 1, len(xref_stream_bytes))
+        )
+        out += xref_stream_bytes
+        out += b"\nendstream\nendobj\n"
+        out += b"startxref\n%d\n%%%%EOF\n" % start_of_xref
+
+        # return
+        return bytes(out)
+
+    @staticmethod
+    def _open(number_of_objects: int) -> float:
+        pdf_bytes: bytes = TestReadObjectStreamPerformance._build_pdf(number_of_objects)
+        delta: float = time.time()
+        doc: Document = PDF.loads(io.BytesIO(pdf_bytes))
+        delta = time.time() - delta
+
+        # check
+        numbers = doc["XRef"]["Trailer"]["Root"]["Numbers"]
+        assert isinstance(numbers, List)
+        assert len(numbers) == number_of_objects
+        for i in range(0, number_of_objects):
+            assert numbers[i] == Decimal(i)
+
+        # return
+        return delta
+
+    def test_read_object_stream(self):
+        TestReadObjectStreamPerformance._open(100)
+
+    def test_read_large_object_stream(self):
+
+        delta_001: float = TestReadObjectStreamPerformance._open(5000)
+        delta_002: float = TestReadObjectStreamPerformance._open(20000)
+
+        # debug
+        print(
+            "reading 5k compressed objects: %f, reading 20k compressed objects: %f"
+            % (delta_001, delta_002)
+        )
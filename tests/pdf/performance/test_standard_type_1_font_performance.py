@@ -0,0 +1,47 @@
+import copy
+import time
+import unittest
+from decimal import Decimal
+
+from borb.pdf.canvas.font.glyph_line import GlyphLine
+from borb.pdf.canvas.font.simple_font.font_type_1 import StandardType1Font
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestStandardType1FontPerformance(unittest.TestCase):
+    def test_standard_type_1_fonts_share_metrics(self):
+        f0: StandardType1Font = StandardType1Font("Helvetica")
+        f1: StandardType1Font = StandardType1Font("helvetica")
+        assert f0._metrics is f1._metrics
+        assert copy.deepcopy(f0)._metrics is f0._metrics
+        assert StandardType1Font("Courier")._metrics is not f0._metrics
+
+    def test_standard_type_1_font_get_width(self):
+        f: StandardType1Font = StandardType1Font("Helvetica")
+        assert f.get_width(f.unicode_to_character_identifier("A")) == Decimal(667)
+        assert f.get_width(f.unicode_to_character_identifier(" ")) == Decimal(278)
+        assert f.get_width(1024) == Decimal(0)
+        assert f.get_ascent() == Decimal(718)
+        assert f.get_descent() == Decimal(-207)
+
+        f = StandardType1Font("Courier")
+        for c in "abcdefghijklmnopqrstuvwxyz":
+            assert f.get_width(f.unicode_to_character_identifier(c)) == Decimal(600)
+
+    def test_build_many_standard_type_1_fonts(self):
+        delta: float = time.time()
+        for _ in range(0, 1000):
+            for font_name in StandardType1Font.STANDARD_14_FONT_NAMES:
+                StandardType1Font(font_name)
+        delta = time.time() - delta
+        print("building 14k fonts: %f" % delta)
+
+    def test_measure_text_in_standard_type_1_font(self):
+        f: StandardType1Font = StandardType1Font("Helvetica")
+        text: str = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 100
+        delta: float = time.time()
+        for _ in range(0, 100):
+            GlyphLine.from_str(text, f, Decimal(12)).get_width_in_text_space()
+        delta = time.time() - delta
+        print("measuring %d characters: %f" % (len(text) * 100, delta))
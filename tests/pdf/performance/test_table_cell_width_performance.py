@@ -0,0 +1,73 @@
+import time
+import unittest
+from decimal import Decimal
+
+from PIL import Image as PILImage  # type: ignore [import]
+
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.image.image import Image
+from borb.pdf.canvas.layout.list.unordered_list import UnorderedList
+from borb.pdf.canvas.layout.table.table import TableCell
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestTableCellWidthPerformance(unittest.TestCase):
+    """
+    This test calculates the minimum and maximum width of (many) TableCell objects.
+    Paragraph, Image, List (etc) report the minimum and maximum width of their content directly,
+    rather than being laid out at several widths (in a binary search).
+    """
+
+    def test_calculate_min_and_max_width(self):
+
+        cells = [
+            TableCell(Paragraph("Lorem ipsum dolor sit amet %d" % i))
+            for i in range(0, 1000)
+        ]
+
+        # calculate
+        delta: float = time.time()
+        for c in cells:
+            c._calculate_min_and_max_width()
+        delta = time.time() - delta
+
+        # debug
+        print("calculating min/max width of 1000 TableCell objects: %f" % delta)
+
+    def test_paragraph_min_and_max_width(self):
+
+        p: Paragraph = Paragraph("Lorem ipsum dolor sit amet", padding_left=Decimal(5))
+        min_width: Decimal = p._get_min_width()
+        max_width: Decimal = p._get_max_width()
+
+        # the Paragraph fits on a single line (at its maximum width)
+        lbox: Rectangle = p.get_layout_box(
+            Rectangle(Decimal(0), Decimal(0), max_width, Decimal(1000))
+        )
+        assert abs(lbox.get_width() - max_width) < Decimal(0.01)
+        assert lbox.get_height() == Decimal(12) * Decimal(1.2)
+
+        # the Paragraph does not overflow (at its minimum width), but it would be any narrower
+        lbox = p.get_layout_box(
+            Rectangle(Decimal(0), Decimal(0), min_width, Decimal(1000))
+        )
+        assert abs(lbox.get_width() - min_width) < Decimal(0.01)
+        lbox = p.get_layout_box(
+            Rectangle(Decimal(0), Decimal(0), min_width - 1, Decimal(1000))
+        )
+        assert lbox.get_width() > min_width - 1
+
+    def test_list_and_image_min_and_max_width(self):
+
+        img: Image = Image(
+            PILImage.new("RGB", (100, 50)), width=Decimal(64), height=Decimal(32)
+        )
+        assert img._get_min_width() == img._get_max_width() == Decimal(64)
+
+        ul: UnorderedList = UnorderedList()
+        ul.add(Paragraph("Lorem"))
+        ul.add(img)
+        assert ul._get_min_width() == ul._bullet_margin + Decimal(64)
+        assert ul._get_max_width() == ul._bullet_margin + Decimal(64)
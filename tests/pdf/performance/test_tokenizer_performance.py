@@ -0,0 +1,74 @@
+import io
+import time
+import typing
+import unittest
+
+from borb.io.read.tokenize.low_level_tokenizer import LowLevelTokenizer, Token
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestTokenizerPerformance(unittest.TestCase):
+    @staticmethod
+    def _build_content_stream(number_of_text_runs: int) -> bytes:
+        out: bytes = b""
+        for i in range(0, number_of_text_runs):
+            out += b"q\n"
+            out += b"BT\n/F1 12 Tf\n%d %d Td\n" % (i % 500, i % 700)
+            out += b"(Lorem ipsum \\(dolor\\) sit amet, %d) Tj\n" % i
+            out += b"<00480065006C006C006F> Tj\nET\n"
+            out += b"0.5 0.25 0.125 rg\n[3 2] 0 d\n"
+            out += b"%% comment %d\nQ\n" % i
+        return out
+
+    @staticmethod
+    def _tokenize(tokenizer: LowLevelTokenizer) -> typing.List[Token]:
+        tokens: typing.List[Token] = []
+        while True:
+            token: typing.Optional[Token] = tokenizer.next_non_comment_token()
+            if token is None:
+                break
+            tokens.append(token)
+        return tokens
+
+    def test_buffer_tokenizer_matches_stream_tokenizer(self):
+        content_stream: bytes = TestTokenizerPerformance._build_content_stream(100)
+        tokens_001: typing.List[Token] = TestTokenizerPerformance._tokenize(
+            LowLevelTokenizer(io.BytesIO(content_stream))
+        )
+        tokens_002: typing.List[Token] = TestTokenizerPerformance._tokenize(
+            LowLevelTokenizer(content_stream)
+        )
+        assert len(tokens_001) == len(tokens_002)
+        for t0, t1 in zip(tokens_001, tokens_002):
+            assert t0.get_byte_offset() == t1.get_byte_offset()
+            assert t0.get_token_type() == t1.get_token_type()
+            assert t0.get_bytes() == t1.get_bytes()
+
+    def test_tokenize_large_content_stream(self):
+        content_stream: bytes = TestTokenizerPerformance._build_content_stream(10000)
+
+        # stream based tokenizer
+        delta_001: float = time.time()
+        number_of_tokens_001: int = len(
+            TestTokenizerPerformance._tokenize(
+                LowLevelTokenizer(io.BytesIO(content_stream))
+            )
+        )
+        delta_001 = time.time() - delta_001
+
+        # buffer based tokenizer
+        delta_002: float = time.time()
+        number_of_tokens_002: int = len(
+            TestTokenizerPerformance._tokenize(LowLevelTokenizer(content_stream))
+        )
+        delta_002 = time.time() - delta_002
+
+        # debug
+        print(
+            "tokenized %d bytes (%d tokens), io.BytesIO: %f, bytes: %f"
+            % (len(content_stream), number_of_tokens_001, delta_001, delta_002)
+        )
+
+        # check
+        assert number_of_tokens_001 == number_of_tokens_002
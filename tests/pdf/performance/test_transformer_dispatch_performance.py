@@ -0,0 +1,106 @@
+import hashlib
+import io
+import time
+import typing
+import unittest
+from pathlib import Path
+
+from borb.io.read.types import Dictionary, Name, Stream
+from borb.pdf.document.document import Document
+from borb.pdf.pdf import PDF
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestTransformerDispatchPerformance(unittest.TestCase):
+    """
+    This test reads every PDF in the test corpus.
+    The (read) Transformer caches which child Transformer handles which kind of object,
+    rather than calling can_be_transformed on every child for every object.
+    """
+
+    @staticmethod
+    def _get_corpus() -> typing.List[Path]:
+        # find tests dir
+        p: Path = Path(__file__).parent
+        while p.name != "tests":
+            p = p.parent
+
+        # find (unique) input PDFs
+        files_by_hash: typing.Dict[str, Path] = {}
+        for f in sorted(p.glob("**/*.pdf")):
+            if "output" in f.parts:
+                continue
+            with open(f, "rb") as pdf_file_handle:
+                h: str = hashlib.md5(pdf_file_handle.read()).hexdigest()
+            files_by_hash.setdefault(h, f)
+        return [x for x in files_by_hash.values()]
+
+    @staticmethod
+    def _image_stream(color_space: str) -> Stream:
+        s: Stream = Stream()
+        s[Name("Type")] = Name("XObject")
+        s[Name("Subtype")] = Name("Image")
+        s[Name("Filter")] = Name("FlateDecode")
+        s[Name("ColorSpace")] = Name(color_space)
+        return s
+
+    def test_read_corpus(self):
+        for f in TestTransformerDispatchPerformance._get_corpus():
+            with open(f, "rb") as pdf_file_handle:
+                delta: float = time.time()
+                doc: Document = PDF.loads(pdf_file_handle)
+                delta = time.time() - delta
+            print("reading %s: %f" % (f.name, delta))
+            assert int(doc.get_document_info().get_number_of_pages()) > 0
+
+    def test_get_handler(self):
+        # the read Transformers can only be imported once borb.pdf has been imported
+        from borb.io.read.any_object_transformer import AnyObjectTransformer
+        from borb.io.read.image.grayscale_image_transformer import (
+            GrayscaleImageTransformer,
+        )
+        from borb.io.read.object.dictionary_transformer import DictionaryTransformer
+        from borb.io.read.object.stream_transformer import StreamTransformer
+        from borb.io.read.page.page_dictionary_transformer import (
+            PageDictionaryTransformer,
+        )
+
+        t: AnyObjectTransformer = AnyObjectTransformer()
+
+        # every lookup is done twice (the second lookup uses the cache)
+        for _ in range(0, 2):
+            page: Dictionary = Dictionary()
+            page[Name("Type")] = Name("Page")
+            assert isinstance(t._get_handler(page), PageDictionaryTransformer)
+            assert isinstance(t._get_handler(Dictionary()), DictionaryTransformer)
+
+            # objects with the same /Type, /Subtype and /Filter can still be handled differently
+            assert isinstance(
+                t._get_handler(
+                    TestTransformerDispatchPerformance._image_stream("DeviceGray")
+                ),
+                GrayscaleImageTransformer,
+            )
+            assert isinstance(
+                t._get_handler(
+                    TestTransformerDispatchPerformance._image_stream("DeviceRGB")
+                ),
+                StreamTransformer,
+            )
+
+    def test_is_recursive_object(self):
+        # the read Transformers can only be imported once borb.pdf has been imported
+        from borb.io.read.any_object_transformer import AnyObjectTransformer
+
+        t: AnyObjectTransformer = AnyObjectTransformer()
+
+        # a (distinct) Dictionary that is equal to its parent is not recursive
+        parent: Dictionary = Dictionary()
+        child: Dictionary = Dictionary()
+        child.set_parent(parent)  # type: ignore [attr-defined]
+        assert not t._is_recursive_object(child)
+
+        # a Dictionary that is its own ancestor is recursive
+        parent.set_parent(child)  # type: ignore [attr-defined]
+        assert t._is_recursive_object(child)
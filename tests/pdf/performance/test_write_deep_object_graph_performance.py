@@ -0,0 +1,81 @@
+import io
+import sys
+import time
+import unittest
+
+from borb.io.read.types import Dictionary, Name, String
+from borb.pdf.canvas.layout.annotation.link_annotation import DestinationType
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestWriteDeepObjectGraphPerformance(unittest.TestCase):
+    """
+    This test writes a Document with a (very) deep object graph.
+    Writing should never raise a RecursionError, however deep the Document is.
+    """
+
+    @staticmethod
+    def _build_document() -> Document:
+        doc: Document = Document()
+        page: Page = Page()
+        doc.add_page(page)
+        SingleColumnLayout(page).add(Paragraph("Hello World"))
+        return doc
+
+    @staticmethod
+    def _dumps(doc: Document) -> bytes:
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            return pdf_file_handle.getvalue()
+
+    def test_write_long_chain_of_dictionaries(self):
+
+        # build a linked list of Dictionary objects (each one refers to the next)
+        number_of_objects: int = sys.getrecursionlimit() * 5
+        doc: Document = TestWriteDeepObjectGraphPerformance._build_document()
+        first: Dictionary = Dictionary()
+        prev: Dictionary = first
+        for i in range(0, number_of_objects):
+            d: Dictionary = Dictionary()
+            d[Name("Title")] = String("Item %d" % i)
+            prev[Name("Next")] = d
+            prev = d
+        doc["XRef"]["Trailer"]["Root"][Name("Data")] = first
+
+        # write
+        delta: float = time.time()
+        pdf_bytes: bytes = TestWriteDeepObjectGraphPerformance._dumps(doc)
+        delta = time.time() - delta
+
+        # debug
+        print("writing a chain of %d objects: %f" % (number_of_objects, delta))
+
+        # check
+        assert b"(Item 0)" in pdf_bytes
+        assert ("(Item %d)" % (number_of_objects - 1)).encode() in pdf_bytes
+
+    def test_write_deeply_nested_outlines(self):
+
+        # every outline is a child of the previous outline
+        number_of_outlines: int = 1000
+        doc: Document = TestWriteDeepObjectGraphPerformance._build_document()
+        for i in range(0, number_of_outlines):
+            doc.add_outline("Item %d" % i, i, DestinationType.FIT, page_nr=0)
+
+        # write
+        delta: float = time.time()
+        pdf_bytes: bytes = TestWriteDeepObjectGraphPerformance._dumps(doc)
+        delta = time.time() - delta
+
+        # debug
+        print("writing %d nested outlines: %f" % (number_of_outlines, delta))
+
+        # check
+        for i in [0, number_of_outlines // 2, number_of_outlines - 1]:
+            assert ("/Title (Item %d)" % i).encode() in pdf_bytes
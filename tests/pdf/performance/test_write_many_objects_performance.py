@@ -0,0 +1,103 @@
+import gc
+import io
+import time
+import unittest
+
+from borb.io.read.types import Decimal as bDecimal
+from borb.io.read.types import Dictionary, List, Name, String
+from borb.io.write.chunked_writer import ChunkedWriter
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestWriteManyObjectsPerformance(unittest.TestCase):
+    """
+    This test writes a Document with (a lot of) small indirect objects.
+    Writing 10 times as many objects should take roughly 10 times longer (not 100 times).
+    """
+
+    @staticmethod
+    def _build_document(number_of_objects: int) -> Document:
+        doc: Document = Document()
+        page: Page = Page()
+        doc.add_page(page)
+        SingleColumnLayout(page).add(Paragraph("Hello World"))
+        data: List = List()
+        for i in range(0, number_of_objects):
+            # Dictionary objects with distinct keys (Dictionary.__hash__ only considers keys)
+            d: Dictionary = Dictionary()
+            d[Name("Index%d" % i)] = bDecimal(i)
+            d[Name("Value")] = String("Lorem Ipsum %d" % i)
+            data.append(d)
+        doc["XRef"]["Trailer"]["Root"][Name("Data")] = data
+        return doc
+
+    @staticmethod
+    def _dumps(doc: Document) -> float:
+        delta: float = time.time()
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+        return time.time() - delta
+
+    def test_write_many_objects(self):
+
+        doc_5k: Document = TestWriteManyObjectsPerformance._build_document(5000)
+        doc_50k: Document = TestWriteManyObjectsPerformance._build_document(50000)
+
+        # the garbage collector is disabled, so that only PDF.dumps is measured
+        gc.collect()
+        gc.disable()
+        try:
+            delta_5k: float = TestWriteManyObjectsPerformance._dumps(doc_5k)
+            delta_50k: float = TestWriteManyObjectsPerformance._dumps(doc_50k)
+        finally:
+            gc.enable()
+
+        # debug
+        print("writing 5k objects: %f, writing 50k objects: %f" % (delta_5k, delta_50k))
+
+    def test_write_and_read_many_objects(self):
+
+        # write
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(
+                pdf_file_handle, TestWriteManyObjectsPerformance._build_document(1000)
+            )
+            pdf_bytes: bytes = pdf_file_handle.getvalue()
+
+        # check
+        doc: Document = PDF.loads(io.BytesIO(pdf_bytes))
+        data: List = doc["XRef"]["Trailer"]["Root"]["Data"]
+        assert len(data) == 1000
+        assert data[999]["Index999"] == 999
+        assert data[999]["Value"] == "Lorem Ipsum 999"
+
+    def test_chunked_writer(self):
+        destination: io.BytesIO = io.BytesIO(b"%PDF")
+        destination.seek(0, io.SEEK_END)
+
+        # small writes are buffered (until chunk_size bytes are held)
+        writer: ChunkedWriter = ChunkedWriter(destination, chunk_size=16)
+        writer.write(b"<<")
+        writer.write(b" ")
+        assert writer.tell() == 7
+        assert destination.getvalue() == b"%PDF"
+        writer.write(b"/Type /Catalog")
+        assert destination.getvalue() == b"%PDF<< /Type /Catalog"
+
+        # seeking (and flushing) writes the buffered bytes
+        writer.write(b">>")
+        writer.seek(0, io.SEEK_END)
+        assert writer.tell() == 23
+        writer.write(b"\n")
+        writer.flush()
+        assert destination.getvalue() == b"%PDF<< /Type /Catalog>>\n"
+
+        # closing the ChunkedWriter does not close the destination
+        writer.close()
+        assert not destination.closed
@@ -0,0 +1,138 @@
+import io
+import time
+import typing
+import unittest
+from decimal import Decimal
+
+from borb.io.read.types import Name, String
+from borb.pdf.canvas.color.color import HexColor
+from borb.pdf.canvas.geometry.rectangle import Rectangle
+from borb.pdf.canvas.layout.annotation.square_annotation import SquareAnnotation
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+from borb.pdf.xref.stream_xref import StreamXREF
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestWriteObjectStreamsPerformance(unittest.TestCase):
+    """
+    This test writes a PDF with many (small) annotation dictionaries,
+    once using a cross-reference table, and once using object streams (and a cross-reference stream).
+    """
+
+    NUMBER_OF_PAGES: int = 20
+    NUMBER_OF_ANNOTATIONS_PER_PAGE: int = 100
+
+    @staticmethod
+    def _build_document() -> Document:
+        doc: Document = Document()
+        for i in range(0, TestWriteObjectStreamsPerformance.NUMBER_OF_PAGES):
+            page: Page = Page()
+            doc.add_page(page)
+            SingleColumnLayout(page).add(Paragraph("Page %d" % (i + 1)))
+            for j in range(
+                0, TestWriteObjectStreamsPerformance.NUMBER_OF_ANNOTATIONS_PER_PAGE
+            ):
+                page.add_annotation(
+                    SquareAnnotation(
+                        Rectangle(
+                            Decimal(10 + (j % 10) * 50),
+                            Decimal(10 + (j // 10) * 50),
+                            Decimal(40 - i),
+                            Decimal(40 - i),
+                        ),
+                        stroke_color=HexColor("56cbf9"),
+                    )
+                )
+        return doc
+
+    @staticmethod
+    def _dumps(doc: Document, use_object_streams: bool) -> typing.Tuple[bytes, float]:
+        delta: float = time.time()
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc, use_object_streams=use_object_streams)
+            pdf_bytes: bytes = pdf_file_handle.getvalue()
+        return pdf_bytes, time.time() - delta
+
+    @staticmethod
+    def _get_number_of_annotations(doc: Document) -> int:
+        return sum(
+            [
+                len(doc.get_page(i)["Annots"])
+                for i in range(0, int(doc.get_document_info().get_number_of_pages()))
+            ]
+        )
+
+    def test_write_object_streams(self):
+
+        doc: Document = TestWriteObjectStreamsPerformance._build_document()
+
+        # write
+        # fmt: off
+        pdf_bytes_with_xref_table, delta_xref_table = TestWriteObjectStreamsPerformance._dumps(doc, False)
+        pdf_bytes_with_object_streams, delta_object_streams = TestWriteObjectStreamsPerformance._dumps(doc, True)
+        # fmt: on
+
+        # debug
+        print(
+            "writing %d annotations, cross-reference table: %d bytes (%f), object streams: %d bytes (%f)"
+            % (
+                TestWriteObjectStreamsPerformance.NUMBER_OF_PAGES
+                * TestWriteObjectStreamsPerformance.NUMBER_OF_ANNOTATIONS_PER_PAGE,
+                len(pdf_bytes_with_xref_table),
+                delta_xref_table,
+                len(pdf_bytes_with_object_streams),
+                delta_object_streams,
+            )
+        )
+
+        # the (non-stream) objects are stored in (compressed) object streams
+        assert b"/Type /ObjStm" in pdf_bytes_with_object_streams
+        assert b"/Type /XRef" in pdf_bytes_with_object_streams
+        assert b"\nxref\n" not in pdf_bytes_with_object_streams
+        assert b"/Subtype /Square" not in pdf_bytes_with_object_streams
+        assert len(pdf_bytes_with_object_streams) * 2 < len(pdf_bytes_with_xref_table)
+
+        # check
+        doc = PDF.loads(io.BytesIO(pdf_bytes_with_object_streams))
+        assert isinstance(doc["XRef"], StreamXREF)
+        assert (
+            TestWriteObjectStreamsPerformance._get_number_of_annotations(doc)
+            == TestWriteObjectStreamsPerformance.NUMBER_OF_PAGES
+            * TestWriteObjectStreamsPerformance.NUMBER_OF_ANNOTATIONS_PER_PAGE
+        )
+        assert doc.get_page(0)["Annots"][0]["Subtype"] == "Square"
+
+    def test_write_incremental_update_using_object_streams(self):
+
+        pdf_bytes, _ = TestWriteObjectStreamsPerformance._dumps(
+            TestWriteObjectStreamsPerformance._build_document(), True
+        )
+
+        # read
+        doc: Document = PDF.loads(io.BytesIO(pdf_bytes), incremental=True)
+
+        # modify /Info
+        doc["XRef"]["Trailer"]["Info"][Name("Title")] = String("Lorem Ipsum")
+
+        # write (incremental update)
+        with io.BytesIO(pdf_bytes) as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc, incremental=True, use_object_streams=True)
+            pdf_bytes_after_update: bytes = pdf_file_handle.getvalue()
+
+        # the update holds an object stream (with the /Info dictionary) and a cross-reference stream
+        update: bytes = pdf_bytes_after_update[len(pdf_bytes) :]
+        assert update.count(b" obj\n") == 2
+        assert b"/Prev" in update
+
+        # check
+        doc = PDF.loads(io.BytesIO(pdf_bytes_after_update))
+        assert doc["XRef"]["Trailer"]["Info"]["Title"] == "Lorem Ipsum"
+        assert (
+            int(doc.get_document_info().get_number_of_pages())
+            == TestWriteObjectStreamsPerformance.NUMBER_OF_PAGES
+        )
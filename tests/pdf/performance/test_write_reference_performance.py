@@ -0,0 +1,66 @@
+import gc
+import time
+import typing
+import unittest
+from decimal import Decimal
+
+from borb.io.read.types import Dictionary, Name, Reference
+from borb.io.write.transformer import Transformer, WriteTransformerState
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestWriteReferencePerformance(unittest.TestCase):
+    @staticmethod
+    def _get_references(number_of_objects: int) -> typing.List[Reference]:
+        transformer: Transformer = Transformer()
+        context: WriteTransformerState = WriteTransformerState()
+        references: typing.List[Reference] = []
+        for i in range(0, number_of_objects):
+            # Dictionary objects with distinct keys (Dictionary.__hash__ only considers keys)
+            d: Dictionary = Dictionary()
+            d[Name("Index%d" % i)] = Decimal(i)
+            references.append(transformer.get_reference(d, context))
+        return references
+
+    def test_get_reference_assigns_consecutive_object_numbers(self):
+        references: typing.List[
+            Reference
+        ] = TestWriteReferencePerformance._get_references(100)
+        assert [int(r.object_number) for r in references] == [
+            i for i in range(1, 101)
+        ]
+
+    def test_get_reference_reuses_object_numbers(self):
+        transformer: Transformer = Transformer()
+        context: WriteTransformerState = WriteTransformerState()
+        d0: Dictionary = Dictionary()
+        d0[Name("Index")] = Decimal(0)
+        d1: Dictionary = Dictionary()
+        d1[Name("Index")] = Decimal(0)
+        r0: Reference = transformer.get_reference(d0, context)
+        r1: Reference = transformer.get_reference(d1, context)
+        assert r0.object_number == r1.object_number
+        assert transformer.get_reference(d0, context).object_number == r0.object_number
+
+    def test_get_reference_for_many_objects(self):
+
+        # the garbage collector is disabled, so that only get_reference is measured
+        gc.collect()
+        gc.disable()
+        try:
+            delta_001: float = time.time()
+            TestWriteReferencePerformance._get_references(5000)
+            delta_001 = time.time() - delta_001
+
+            delta_002: float = time.time()
+            TestWriteReferencePerformance._get_references(20000)
+            delta_002 = time.time() - delta_002
+        finally:
+            gc.enable()
+
+        # debug
+        print(
+            "building 5k references: %f, building 20k references: %f"
+            % (delta_001, delta_002)
+        )
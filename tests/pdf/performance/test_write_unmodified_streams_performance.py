@@ -0,0 +1,295 @@
+import base64
+import io
+import random
+import time
+import typing
+import unittest
+import zlib
+
+from borb.io.read.types import Name, Stream, String
+from borb.pdf.canvas.layout.page_layout.multi_column_layout import SingleColumnLayout
+from borb.pdf.canvas.layout.page_layout.page_layout import PageLayout
+from borb.pdf.canvas.layout.text.paragraph import Paragraph
+from borb.pdf.document.document import Document
+from borb.pdf.page.page import Page
+from borb.pdf.pdf import PDF
+
+unittest.TestLoader.sortTestMethodsUsing = None
+
+
+class TestWriteUnmodifiedStreamsPerformance(unittest.TestCase):
+    """
+    This test loads a PDF, modifies its /Info dictionary, and writes it again.
+    Streams that were not modified should be written using their original (encoded) bytes.
+    """
+
+    NUMBER_OF_PAGES: int = 100
+
+    WORDS: typing.List[str] = [
+        "lorem",
+        "ipsum",
+        "dolor",
+        "sit",
+        "amet",
+        "consectetur",
+        "adipiscing",
+        "elit",
+        "sed",
+        "do",
+    ]
+
+    @staticmethod
+    def _build_pdf_with_filter_chain() -> bytes:
+        """
+        This function builds a PDF with a single Page,
+        its content stream is encoded using /Filter [/ASCII85Decode /FlateDecode]
+        """
+        content: bytes = b"BT /F1 24 Tf 100 700 Td (Hello World) Tj ET"
+        encoded_content: bytes = base64.a85encode(zlib.compress(content)) + b"~>"
+        objects: typing.List[bytes] = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents 4 0 R "
+            b"/Resources << /Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >> >> >>",
+            b"<< /Length %d /Filter [/ASCII85Decode /FlateDecode] >>\nstream\n%s\nendstream"
+            % (len(encoded_content), encoded_content),
+        ]
+        out: bytearray = bytearray(b"%PDF-1.7\n")
+        offsets: typing.List[int] = []
+        for i, obj in enumerate(objects):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n%s\nendobj\n" % (i + 1, obj)
+        start_of_xref: int = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f\r\n" % (len(objects) + 1)
+        for o in offsets:
+            out += b"%010d 00000 n\r\n" % o
+        out += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+        out += b"startxref\n%d\n%%%%EOF\n" % start_of_xref
+        return bytes(out)
+
+    @staticmethod
+    def _build_pdf() -> bytes:
+        random.seed(0)
+        doc: Document = Document()
+        for _ in range(0, TestWriteUnmodifiedStreamsPerformance.NUMBER_OF_PAGES):
+            page: Page = Page()
+            doc.add_page(page)
+            layout: PageLayout = SingleColumnLayout(page)
+            for _ in range(0, 5):
+                layout.add(
+                    Paragraph(
+                        " ".join(
+                            [
+                                random.choice(
+                                    TestWriteUnmodifiedStreamsPerformance.WORDS
+                                )
+                                for _ in range(0, 100)
+                            ]
+                        )
+                    )
+                )
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            return pdf_file_handle.getvalue()
+
+    @staticmethod
+    def _get_content_streams(doc: Document) -> typing.List[Stream]:
+        return [
+            doc.get_page(i)["Contents"]
+            for i in range(0, int(doc.get_document_info().get_number_of_pages()))
+        ]
+
+    def test_write_unmodified_streams(self):
+
+        pdf_bytes: bytes = TestWriteUnmodifiedStreamsPerformance._build_pdf()
+
+        # read
+        doc: Document = PDF.loads(io.BytesIO(pdf_bytes))
+        content_streams: typing.List[Stream] = (
+            TestWriteUnmodifiedStreamsPerformance._get_content_streams(doc)
+        )
+        assert all([not x.is_modified() for x in content_streams])
+
+        # modify /Info
+        doc["XRef"]["Trailer"]["Info"][Name("Title")] = String("Lorem Ipsum")
+
+        # write (unmodified streams)
+        delta_unmodified: float = time.time()
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            pdf_bytes_after_write: bytes = pdf_file_handle.getvalue()
+        delta_unmodified = time.time() - delta_unmodified
+
+        # the original (encoded) bytes were written
+        for s in content_streams:
+            assert bytes(s["Bytes"]) in pdf_bytes_after_write
+
+        # write (all streams marked as modified)
+        for s in content_streams:
+            s.set_is_modified(True)
+        delta_modified: float = time.time()
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+        delta_modified = time.time() - delta_modified
+
+        # debug
+        print(
+            "writing %d pages, unmodified streams: %f, modified streams: %f"
+            % (
+                TestWriteUnmodifiedStreamsPerformance.NUMBER_OF_PAGES,
+                delta_unmodified,
+                delta_modified,
+            )
+        )
+
+        # check
+        doc = PDF.loads(io.BytesIO(pdf_bytes_after_write))
+        assert doc["XRef"]["Trailer"]["Info"]["Title"] == "Lorem Ipsum"
+        assert int(doc.get_document_info().get_number_of_pages()) == 100
+
+    def test_write_unmodified_stream_with_filter_chain(self):
+
+        # read
+        doc: Document = PDF.loads(
+            io.BytesIO(
+                TestWriteUnmodifiedStreamsPerformance._build_pdf_with_filter_chain()
+            )
+        )
+        content_stream: Stream = doc.get_page(0)["Contents"]
+        assert not content_stream.is_modified()
+
+        # write
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            pdf_bytes: bytes = pdf_file_handle.getvalue()
+        assert b"[/ASCII85Decode /FlateDecode]" in pdf_bytes
+        assert bytes(content_stream["Bytes"]) in pdf_bytes
+
+        # check
+        doc = PDF.loads(io.BytesIO(pdf_bytes))
+        assert b"(Hello World) Tj" in doc.get_page(0)["Contents"]["DecodedBytes"]
+
+    def test_write_modified_stream_with_filter_chain(self):
+
+        # read
+        doc: Document = PDF.loads(
+            io.BytesIO(
+                TestWriteUnmodifiedStreamsPerformance._build_pdf_with_filter_chain()
+            )
+        )
+
+        # modify
+        content_stream: Stream = doc.get_page(0)["Contents"]
+        content_stream[Name("DecodedBytes")] = content_stream["DecodedBytes"].replace(
+            b"Hello World", b"Hello There"
+        )
+        assert content_stream.is_modified()
+
+        # write
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            pdf_bytes: bytes = pdf_file_handle.getvalue()
+        assert b"/ASCII85Decode" not in pdf_bytes
+
+        # check
+        doc = PDF.loads(io.BytesIO(pdf_bytes))
+        assert b"(Hello There) Tj" in doc.get_page(0)["Contents"]["DecodedBytes"]
+
+    @staticmethod
+    def _build_unmodified_stream() -> Stream:
+        s: Stream = Stream()
+        s[Name("Type")] = Name("XObject")
+        s[Name("Bytes")] = zlib.compress(b"BT (Hello World) Tj ET")
+        s[Name("DecodedBytes")] = b"BT (Hello World) Tj ET"
+        s[Name("Filter")] = Name("FlateDecode")
+        s.set_is_modified(False)
+        return s
+
+    def test_mutations_of_stream_mark_stream_as_modified(self):
+
+        # mutations of other keys
+        s: Stream = TestWriteUnmodifiedStreamsPerformance._build_unmodified_stream()
+        s[Name("Type")] = Name("Metadata")
+        s.update({Name("Subtype"): Name("XML")})
+        s.setdefault(Name("Length"), 22)
+        del s["Subtype"]
+        s.pop("Type")
+        assert not s.is_modified()
+
+        # setting the same object again
+        s[Name("DecodedBytes")] = s["DecodedBytes"]
+        s.update({Name("Filter"): s["Filter"]})
+        s.setdefault(Name("Bytes"), b"")
+        assert not s.is_modified()
+
+        # __setitem__
+        s = TestWriteUnmodifiedStreamsPerformance._build_unmodified_stream()
+        s[Name("DecodedBytes")] = b"BT (Hello There) Tj ET"
+        assert s.is_modified()
+
+        # __delitem__
+        s = TestWriteUnmodifiedStreamsPerformance._build_unmodified_stream()
+        del s["DecodedBytes"]
+        assert s.is_modified()
+
+        # pop
+        s = TestWriteUnmodifiedStreamsPerformance._build_unmodified_stream()
+        s.pop("Filter")
+        assert s.is_modified()
+
+        # popitem
+        s = TestWriteUnmodifiedStreamsPerformance._build_unmodified_stream()
+        while "Filter" in s:
+            s.popitem()
+        assert s.is_modified()
+
+        # clear
+        s = TestWriteUnmodifiedStreamsPerformance._build_unmodified_stream()
+        s.clear()
+        assert s.is_modified()
+
+        # update (dict)
+        s = TestWriteUnmodifiedStreamsPerformance._build_unmodified_stream()
+        s.update({Name("DecodedBytes"): b"BT (Hello There) Tj ET"})
+        assert s.is_modified()
+
+        # update (keyword arguments)
+        s = TestWriteUnmodifiedStreamsPerformance._build_unmodified_stream()
+        s.update(Filter=Name("ASCIIHexDecode"))
+        assert s.is_modified()
+
+        # setdefault
+        s = TestWriteUnmodifiedStreamsPerformance._build_unmodified_stream()
+        s.setdefault(Name("DecodeParms"), {})
+        assert s.is_modified()
+
+        # in-place modification of a bytearray
+        s = TestWriteUnmodifiedStreamsPerformance._build_unmodified_stream()
+        s[Name("DecodedBytes")] = bytearray(s["DecodedBytes"])
+        s.set_is_modified(False)
+        s["DecodedBytes"].extend(b" BT (Hello There) Tj ET")
+        assert s.is_modified()
+
+    def test_write_stream_modified_in_place(self):
+
+        # read
+        doc: Document = PDF.loads(
+            io.BytesIO(
+                TestWriteUnmodifiedStreamsPerformance._build_pdf_with_filter_chain()
+            )
+        )
+
+        # modify (in place)
+        content_stream: Stream = doc.get_page(0)["Contents"]
+        content_stream[Name("DecodedBytes")] = bytearray(content_stream["DecodedBytes"])
+        content_stream.set_is_modified(False)
+        content_stream["DecodedBytes"].extend(b" BT 100 600 Td (Hello There) Tj ET")
+
+        # write
+        with io.BytesIO() as pdf_file_handle:
+            PDF.dumps(pdf_file_handle, doc)
+            pdf_bytes: bytes = pdf_file_handle.getvalue()
+
+        # check
+        doc = PDF.loads(io.BytesIO(pdf_bytes))
+        assert b"(Hello There) Tj" in doc.get_page(0)["Contents"]["DecodedBytes"]